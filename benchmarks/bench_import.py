@@ -0,0 +1,69 @@
+"""
+Benchmark the import time of ezweld and guard against regressions. The compute core should only require numpy;
+pandas, matplotlib, and plotly are imported on first use. Exits with status 1 if any of them are loaded by
+"import ezweld" or if the import takes longer than the budget.
+
+Run from the repository root:
+    python benchmarks/bench_import.py
+    python benchmarks/bench_import.py --budget-ms 300
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ["pandas", "matplotlib", "plotly"]
+
+# run in a fresh interpreter so nothing is already imported
+SNIPPET = """
+import json, sys, time
+t0 = time.perf_counter()
+{statement}
+t = time.perf_counter() - t0
+print(json.dumps({{"seconds": t, "loaded": [m for m in {heavy} if m in sys.modules]}}))
+"""
+
+
+def time_import(statement, repeat=5):
+    """return the fastest import time in seconds over several fresh interpreters and the heavy modules loaded"""
+    code = SNIPPET.format(statement=statement, heavy=HEAVY_MODULES)
+    env = dict(os.environ, PYTHONPATH=ROOT + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    timings = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+        result = json.loads(output.stdout.strip().splitlines()[-1])
+        timings.append(result["seconds"])
+    return min(timings), result["loaded"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the import time of ezweld")
+    parser.add_argument("--budget-ms", type=float, default=500, help="maximum import time of ezweld. Default = 500 ms")
+    parser.add_argument("--repeat", type=int, default=5, help="number of fresh interpreters. Default = 5")
+    args = parser.parse_args()
+
+    statements = {"import numpy": "import numpy",
+                  "import ezweld": "import ezweld",
+                  "import ezweld.batch": "import ezweld.batch",
+                  "import ezweld + plotting": "import ezweld, pandas, matplotlib.pyplot, plotly.graph_objects"}
+    print(f"{'statement':>26} {'time (ms)':>10}   heavy modules loaded")
+    failures = []
+    for name, statement in statements.items():
+        seconds, loaded = time_import(statement, args.repeat)
+        print(f"{name:>26} {seconds*1000:>10.1f}   {', '.join(loaded) or '-'}")
+        if name.startswith("import ezweld") and "plotting" not in name:
+            if loaded:
+                failures.append(f'"{statement}" loaded {", ".join(loaded)}')
+            if seconds * 1000 > args.budget_ms:
+                failures.append(f'"{statement}" took {seconds*1000:.0f} ms > budget of {args.budget_ms:.0f} ms')
+
+    for failure in failures:
+        print(f"FAILED: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark ezweld.service.SolveService with a process pool and a thread pool, and check that concurrent requests are
+answered correctly. Every answer is compared to WeldGroup.solve_many() of the same geometry. Batching is disabled
+(max_batch=1) for the thread pool so many threads solve the same cached weld group at once. Exits with status 1 if
+any answer differs or fails the equilibrium check.
+
+Run from the repository root:
+    python benchmarks/bench_service.py
+    python benchmarks/bench_service.py --geometries 20 --requests 64 --threads 8
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import numpy as np
+import ezweld
+from ezweld import service
+
+
+def geometry(i):
+    """two vertical lines capped by a semicircle. Symmetric so it is in its principal orientation"""
+    h = 4 + i
+    return [{"type": "line", "start": [0.0, 0.0], "end": [0.0, float(h)], "thickness": 0.25},
+            {"type": "line", "start": [5.0, 0.0], "end": [5.0, float(h)], "thickness": 0.25},
+            {"type": "arc", "center": [2.5, float(h)], "radius": 2.5, "start_angle": 0.0, "end_angle": 180.0, "thickness": 0.25}]
+
+
+def expected(welds, load_matrix, PATCH_SIZE):
+    """governing results of the same requests from solve_many()"""
+    weld_group = ezweld.WeldGroup(PATCH_SIZE=PATCH_SIZE)
+    for w in welds:
+        if w["type"] == "line":
+            weld_group.add_line(w["start"], w["end"], w["thickness"])
+        else:
+            weld_group.add_arc(w["center"], w["radius"], w["start_angle"], w["end_angle"], w["thickness"])
+    governing, _ = weld_group._governing_results(load_matrix, rtol=None, warn=False)
+    return governing
+
+
+async def run(executor, geometries, PATCH_SIZE, max_batch):
+    """send every request concurrently and return the answers per geometry and the elapsed time"""
+    service._GROUPS.clear()
+    async with service.SolveService(PATCH_SIZE=PATCH_SIZE, executor=executor, batch_window=0.002, max_batch=max_batch) as solver:
+        t0 = time.perf_counter()
+        tasks = [[solver.solve(geometry(i), list(load)) for load in loads] for i, loads in enumerate(geometries)]
+        answers = [await asyncio.gather(*t) for t in tasks]
+        return answers, time.perf_counter() - t0, solver.batches
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark and check the ezweld solve service")
+    parser.add_argument("--geometries", type=int, default=20, help="number of distinct geometries. Default = 20")
+    parser.add_argument("--requests", type=int, default=64, help="concurrent requests per geometry. Default = 64")
+    parser.add_argument("--threads", type=int, default=8, help="threads of the thread pool. Default = 8")
+    parser.add_argument("--patch-size", type=float, default=0.05, help="weld patch size. Default = 0.05")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    geometries = [rng.uniform(-50, 50, size=(args.requests, 6)) for _ in range(args.geometries)]
+    references = [expected(geometry(i), loads, args.patch_size) for i, loads in enumerate(geometries)]
+
+    pools = {"process pool": (lambda: ProcessPoolExecutor(), 1000),
+             f"{args.threads} threads": (lambda: ThreadPoolExecutor(args.threads), 1)}
+    print(f"{'executor':>14} {'requests':>9} {'batches':>8} {'time (ms)':>10} {'wrong':>6} {'unbalanced':>11}")
+    failures = 0
+    for name, (make_executor, max_batch) in pools.items():
+        with make_executor() as executor:
+            answers, seconds, batches = asyncio.run(run(executor, geometries, args.patch_size, max_batch))
+        wrong = unbalanced = 0
+        for answer, reference in zip(answers, references):
+            for k in ["v_max", "sigma_max"]:
+                wrong += int(np.sum(~np.isclose([a[k] for a in answer], reference[k], rtol=1e-12, atol=0)))
+            unbalanced += sum(not a["equilibrium"] for a in answer)
+        failures += wrong + unbalanced
+        print(f"{name:>14} {args.geometries * args.requests:>9} {batches:>8} {seconds*1000:>10.1f} {wrong:>6} {unbalanced:>11}")
+
+    if failures:
+        print("FAILED: answers differ from solve_many() or fail the equilibrium check")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
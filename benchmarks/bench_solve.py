@@ -0,0 +1,144 @@
+"""
+Benchmark the vectorized WeldGroup.solve() against the legacy per-patch Python loop. Before timing, every result
+column of solve() is checked against the legacy loop and the benchmark exits with status 1 on any mismatch.
+
+Run from the repository root:
+    python benchmarks/bench_solve.py
+"""
+import math
+import os
+import sys
+import time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import numpy as np
+import pandas as pd
+import ezweld
+
+
+def solve_legacy(weld_group, Vx=0, Vy=0, Vz=0, Mx=0, My=0, Mz=0):
+    """
+    Per-patch scalar loop that WeldGroup.solve() used before vectorization. Returns a dict
+    of result lists with the same keys as the result columns of WeldGroup.df_welds.
+    """
+    wg = weld_group
+    keys = ["vx_direct", "vx_torsion", "vy_direct", "vy_torsion", "vz_direct", "vz_Mx", "vz_My",
+            "vx_total", "vy_total", "vz_total", "v_resultant", "Fx", "Fy", "Fz", "Mxi", "Myi", "Mzi",
+            "tauX_direct", "tauX_torsion", "tauY_direct", "tauY_torsion", "tauZ_direct", "tauZ_Mx",
+            "tauZ_My", "tauX_total", "tauY_total", "tauZ_total", "sigma_vm"]
+    results = {k:[] for k in keys}
+    t_min = min(wg.dict_welds["thickness"])
+    for i in range(len(wg.dict_welds["length"])):
+        Li = wg.dict_welds["length"][i]
+        dx = wg.dict_welds["x_centroid"][i] - wg.x_centroid
+        dy = wg.dict_welds["y_centroid"][i] - wg.y_centroid
+        length_factor = wg.dict_welds["thickness"][i] / t_min
+
+        vx_direct = - Vx / wg.Le_force * length_factor
+        vx_torsion = Mz * dy / wg.Iz_force * length_factor
+        vy_direct = - Vy / wg.Le_force * length_factor
+        vy_torsion = - Mz * dx / wg.Iz_force * length_factor
+        vz_direct = - Vz / wg.Le_force * length_factor
+        vz_Mx = -Mx * dy / wg.Ix_force * length_factor
+        vz_My = My * dx / wg.Iy_force * length_factor
+        vx_total = vx_direct + vx_torsion
+        vy_total = vy_direct + vy_torsion
+        vz_total = vz_direct + vz_Mx + vz_My
+        v_resultant = math.sqrt(vx_total**2 + vy_total**2 + vz_total**2)
+        Fx = vx_total * Li
+        Fy = vy_total * Li
+        Fz = vz_total * Li
+
+        tauX_direct = - Vx / wg.A
+        tauX_torsion = Mz * dy / wg.Iz
+        tauY_direct = - Vy / wg.A
+        tauY_torsion = - Mz * dx / wg.Iz
+        tauZ_direct = - Vz / wg.A
+        tauZ_Mx = -Mx * dy / wg.Ix
+        tauZ_My = My * dx / wg.Iy
+        tauX_total = tauX_direct + tauX_torsion
+        tauY_total = tauY_direct + tauY_torsion
+        tauZ_total = tauZ_direct + tauZ_Mx + tauZ_My
+        sigma_vm = math.sqrt(3*(tauX_total**2 + tauY_total**2 + tauZ_total**2))
+
+        values = [vx_direct, vx_torsion, vy_direct, vy_torsion, vz_direct, vz_Mx, vz_My,
+                  vx_total, vy_total, vz_total, v_resultant, Fx, Fy, Fz, Fz * dy, -Fz * dx,
+                  - Fx * dy + Fy * dx, tauX_direct, tauX_torsion, tauY_direct, tauY_torsion,
+                  tauZ_direct, tauZ_Mx, tauZ_My, tauX_total, tauY_total, tauZ_total, sigma_vm]
+        for k, v in zip(keys, values):
+            results[k].append(v)
+    return results
+
+
+def moment_correction(weld_group, Mx=0, My=0, Mz=0):
+    """
+    Moment of the linear variation of force along each patch about its own centroid (length^3/12 term). solve()
+    adds this to Mxi, Myi, and Mzi so equilibrium is exact; the legacy loop lumped each patch force at its centroid.
+    """
+    wg = weld_group
+    length = wg.patches.column("length")
+    ux = (wg.patches.column("x_end") - wg.patches.column("x_start")) / length
+    uy = (wg.patches.column("y_end") - wg.patches.column("y_start")) / length
+    length_factor = wg.patches.column("thickness") / min(wg.dict_welds["thickness"])
+    dvz_ds = (-Mx * uy / wg.Ix_force + My * ux / wg.Iy_force) * length_factor
+    return {"Mxi": length**3 / 12 * dvz_ds * uy,
+            "Myi": -length**3 / 12 * dvz_ds * ux,
+            "Mzi": -length**3 / 12 * Mz / wg.Iz_force * length_factor}
+
+
+def check_results(weld_group, loads):
+    """
+    Compare every result column of solve() to the legacy loop. Returns a list of mismatch descriptions (empty if all
+    columns agree to floating-point tolerance).
+    """
+    df_welds = weld_group.solve(**loads)
+    legacy = solve_legacy(weld_group, **loads)
+    correction = moment_correction(weld_group, loads.get("Mx", 0), loads.get("My", 0), loads.get("Mz", 0))
+    mismatches = []
+    for k, values in legacy.items():
+        expected = np.asarray(values) + correction.get(k, 0)
+        actual = df_welds[k].to_numpy()
+        scale = max(np.max(np.abs(expected)), 1e-300)
+        if actual.shape != expected.shape or not np.allclose(actual, expected, rtol=1e-9, atol=1e-12 * scale):
+            mismatches.append(f"{k}: max difference {np.max(np.abs(actual - expected)):.3g} (max value {scale:.3g})")
+    return mismatches
+
+
+def best_of(func, repeat=5):
+    """return the fastest wall time of several runs in seconds"""
+    timings = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - t0)
+    return min(timings)
+
+
+def main():
+    loads = dict(Vx=5, Vy=-50, Vz=10, Mx=120, My=-30, Mz=80)
+    print(f"{'patches':>10} {'legacy loop (ms)':>18} {'solve() (ms)':>14} {'speedup':>10}")
+    for patch_size in [0.5, 0.1, 0.05, 0.01, 0.005, 0.001]:
+        weld_group = ezweld.WeldGroup(PATCH_SIZE=patch_size)
+        weld_group.add_rectangle(xo=-5, yo=-5, width=10, height=10, thickness=5/16)
+        n_patches = len(weld_group.dict_welds["x_centroid"])
+        
+        # same results as the legacy loop before anything is timed
+        mismatches = check_results(weld_group, loads)
+        if mismatches:
+            print(f"FAILED: solve() differs from the legacy loop with {n_patches} patches")
+            for mismatch in mismatches:
+                print(f"    {mismatch}")
+            sys.exit(1)
+        
+        # legacy timing includes the same property calculation and DataFrame conversion that solve() runs
+        def legacy():
+            weld_group.update_geometric_properties()
+            results = solve_legacy(weld_group, **loads)
+            geometry = weld_group.patches.as_dict()
+            pd.DataFrame({**geometry, **results})
+        t_legacy = best_of(legacy)
+        t_vector = best_of(lambda: weld_group.solve(**loads))
+        print(f"{n_patches:>10} {t_legacy*1000:>18.2f} {t_vector*1000:>14.2f} {t_legacy/t_vector:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
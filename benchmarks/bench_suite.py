@@ -0,0 +1,209 @@
+"""
+Benchmark suite covering geometry build, geometric properties, solve, rotate, equilibrium check, DataFrame
+construction, and figure construction across patch counts. Results are written to JSON so releases can be
+compared before upgrading.
+
+Every geometry has 40 in. of weld and is discretized with PATCH_SIZE = 40 / patches, so the patch count is
+controlled directly and the corresponding PATCH_SIZE is recorded with each result.
+
+Each result records the median and the median absolute deviation (spread) of the repeats. Fast cases are looped
+within each repeat so a single timing is not dominated by timer resolution. A benchmark is only reported as a
+regression if its median is slower than the baseline by more than the threshold ratio AND by more than both a
+minimum absolute delta and the combined spread of the two runs, so run-to-run noise of sub-millisecond cases is
+not flagged.
+
+Run from the repository root:
+    python benchmarks/bench_suite.py                                  # 100 to 1,000,000 patches
+    python benchmarks/bench_suite.py --patches 100 1000 --output new.json
+    python benchmarks/bench_suite.py --compare old.json --output new.json
+    python benchmarks/bench_suite.py --compare old.json --threshold 1.25 --min-delta-ms 0.5
+    python benchmarks/bench_suite.py --only solve rotate
+"""
+import argparse
+import datetime
+import gc
+import json
+import math
+import os
+import platform
+import sys
+import time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import numpy as np
+import ezweld
+
+
+LOADS = dict(Vx=5, Vy=-50, Vz=10, Mx=120, My=-30, Mz=80)
+RECTANGLE = dict(xo=-5, yo=-5, width=10, height=10, thickness=5/16)     # weld length = 40
+CIRCLE = dict(xo=0, yo=0, diameter=40/math.pi, thickness=5/16)          # weld length = 40
+LINE = dict(start=(0, -20), end=(0, 20), thickness=5/16)               # weld length = 40
+
+
+def measure(run, setup=None, repeat=5, max_seconds=2.0, min_repeat_seconds=0.01):
+    """
+    Time run(*setup()) and return {"seconds": median, "min_seconds", "spread_seconds": median absolute deviation,
+    "repeats"} per call. setup() is not timed. Without setup, calls are looped within each repeat until it takes at
+    least min_repeat_seconds. Stops repeating once the total time exceeds max_seconds so the largest cases only run once.
+    """
+    # number of calls per repeat so fast cases are not dominated by timer resolution
+    number = 1
+    if setup is None:
+        while True:
+            t0 = time.perf_counter()
+            for _ in range(number):
+                run()
+            if time.perf_counter() - t0 >= min_repeat_seconds or number >= 10_000:
+                break
+            number *= 10
+
+    timings = []
+    for _ in range(repeat):
+        args = setup() if setup is not None else ()
+        gc.collect()
+        t0 = time.perf_counter()
+        for _ in range(number):
+            run(*args)
+        timings.append((time.perf_counter() - t0) / number)
+        if sum(timings) * number > max_seconds:
+            break
+    median = float(np.median(timings))
+    return {"seconds": median,
+            "min_seconds": min(timings),
+            "spread_seconds": float(np.median(np.abs(np.array(timings) - median))),
+            "repeats": len(timings)}
+
+
+def solved_rectangle(patches, results="dataframe"):
+    """rectangular weld group discretized into the given number of patches and solved"""
+    weld_group = ezweld.WeldGroup(PATCH_SIZE=40 / patches)
+    weld_group.add_rectangle(**RECTANGLE)
+    weld_group.solve(**LOADS, results=results)
+    return weld_group
+
+
+def benchmarks(patches, max_plot_patches):
+    """
+    Return a dictionary of benchmark name => (run, setup). Figure benchmarks are left out above max_plot_patches.
+    """
+    import pandas as pd
+    PATCH_SIZE = 40 / patches
+
+    def build(method, kwargs):
+        return lambda: getattr(ezweld.WeldGroup(PATCH_SIZE=PATCH_SIZE), method)(**kwargs)
+
+    # solve(results="summary") drops per-patch results so it runs on a separate weld group
+    weld_group = solved_rectangle(patches)
+    summary_group = solved_rectangle(patches, "summary")
+    cases = {"add_rectangle": (build("add_rectangle", RECTANGLE), None),
+             "add_circle": (build("add_circle", CIRCLE), None),
+             "add_line": (build("add_line", LINE), None),
+             "update_geometric_properties": (weld_group.update_geometric_properties, None),
+             "solve": (lambda: weld_group.solve(**LOADS), None),
+             "solve_arrays": (lambda: weld_group.solve(**LOADS, results="arrays"), None),
+             "solve_summary": (lambda: summary_group.solve(**LOADS, results="summary"), None),
+             "check_equilibrium": (lambda: weld_group.check_equilibrium(), None),
+             "dataframe": (lambda: pd.DataFrame(weld_group.dict_welds), None),
+             "rotate": (lambda wg: wg.rotate(90), lambda: (solved_rectangle(patches, "summary"),))}
+
+    if patches <= max_plot_patches:
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+
+        def draw(plot):
+            def run():
+                plot()
+                plt.gcf().canvas.draw()
+                plt.close("all")
+            return run
+        cases["preview"] = (draw(weld_group.preview), None)
+        cases["plot_results"] = (draw(weld_group.plot_results), None)
+        cases["plot_results_3D"] = (lambda: weld_group.plot_results_3D(show=False).to_json(), None)
+    return cases
+
+
+def environment():
+    """versions and machine description stored with the results"""
+    import pandas as pd
+    return {"ezweld": ezweld.__version__,
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "platform": platform.platform(),
+            "processor": platform.processor() or platform.machine(),
+            "cpu_count": os.cpu_count(),
+            "date": datetime.datetime.now().isoformat(timespec="seconds")}
+
+
+def compare(results, baseline, threshold, min_delta, noise=3.0):
+    """
+    Print the ratio of every median timing to the baseline and return the regressions. A benchmark regresses if it
+    is slower than threshold times the baseline and the slowdown exceeds both min_delta seconds and noise times the
+    combined spread of the two runs. Slowdowns within the noise are marked but not returned. Baselines written
+    before spreads were recorded have a spread of 0.
+    """
+    previous = {(r["benchmark"], r["patches"]): r for r in baseline["results"]}
+    regressions = []
+    print(f"\nCompared to ezweld {baseline['environment']['ezweld']} ({baseline['environment']['date']})")
+    print(f"{'benchmark':>28} {'patches':>9} {'baseline (ms)':>14} {'now (ms)':>10} {'ratio':>7}")
+    for r in results:
+        key = (r["benchmark"], r["patches"])
+        if key not in previous:
+            continue
+        base = previous[key]
+        ratio = r["seconds"] / base["seconds"]
+        delta = r["seconds"] - base["seconds"]
+        spread = r.get("spread_seconds", 0.0) + base.get("spread_seconds", 0.0)
+        flag = ""
+        if ratio > threshold:
+            flag = "  REGRESSION" if delta > max(min_delta, noise * spread) else "  (within noise)"
+        print(f"{r['benchmark']:>28} {r['patches']:>9} {base['seconds']*1000:>14.3f} {r['seconds']*1000:>10.3f} {ratio:>6.2f}x{flag}")
+        if flag == "  REGRESSION":
+            regressions.append(r)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ezweld across patch counts")
+    parser.add_argument("--patches", type=int, nargs="+", default=[100, 1_000, 10_000, 100_000, 1_000_000],
+                        help="patch counts to benchmark. Default = 100 1000 10000 100000 1000000")
+    parser.add_argument("--only", nargs="+", default=None, help="only run the named benchmarks")
+    parser.add_argument("--max-plot-patches", type=int, default=100_000,
+                        help="skip figure benchmarks above this many patches. Default = 100000")
+    parser.add_argument("--repeat", type=int, default=5, help="maximum number of repetitions. Default = 5")
+    parser.add_argument("-o", "--output", default=None, help="output JSON. Default = benchmark_<ezweld version>.json")
+    parser.add_argument("--compare", default=None, help="baseline JSON from a previous run to compare against")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="ratio to the baseline reported as a regression. Default = 1.25")
+    parser.add_argument("--min-delta-ms", type=float, default=0.5,
+                        help="minimum slowdown in ms reported as a regression. Default = 0.5")
+    parser.add_argument("--noise", type=float, default=3.0,
+                        help="slowdowns within this many times the combined spread are not regressions. Default = 3")
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'benchmark':>28} {'patches':>9} {'PATCH_SIZE':>11} {'median (ms)':>12} {'spread (ms)':>12}")
+    for patches in args.patches:
+        for name, (run, setup) in benchmarks(patches, args.max_plot_patches).items():
+            if args.only is not None and name not in args.only:
+                continue
+            timing = measure(run, setup, repeat=args.repeat)
+            results.append({"benchmark": name, "patches": patches, "PATCH_SIZE": 40 / patches, **timing})
+            print(f"{name:>28} {patches:>9} {40 / patches:>11.3g} {timing['seconds']*1000:>12.3f} {timing['spread_seconds']*1000:>12.3f}")
+
+    output = args.output or f"benchmark_{ezweld.__version__}.json"
+    with open(output, "w") as f:
+        json.dump({"environment": environment(), "results": results}, f, indent=2)
+    print(f"Wrote {len(results)} results to {output}")
+
+    if args.compare is not None:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold, args.min_delta_ms / 1000, args.noise)
+        if regressions:
+            print(f"{len(regressions)} benchmark(s) slower than {args.threshold:.2f}x the baseline beyond noise")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""
+Solve many independent weld groups in parallel over a process pool.
+
+Each connection is defined by a dictionary:
+    {"name":    "C1",
+     "welds":   [{"type":"line", "start":[0,0], "end":[0,10], "thickness":0.25},
+                 {"type":"arc", "center":[0,0], "radius":4, "start_angle":0, "end_angle":90, "thickness":0.25}],
+     "loads":   [[Vx, Vy, Vz, Mx, My, Mz], ...]  or  {"combo name": {"Vy":-50, "Mx":200}, ...}}
+
+Welds use the same dictionary format as WeldGroup.primitives. Geometry and loads are packed into numpy
+arrays before they are sent to worker processes, and each worker returns only the governing results.
+
+Command line usage:
+    python -m ezweld.batch connections.json -o summary.csv --workers 8
+"""
+import argparse
+import json
+import logging
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+from ezweld.weldgroup import WeldGroup
+from ezweld.cache import SectionCache
+
+
+# one cache per worker process so connections with identical geometry reuse section properties
+_CACHE = SectionCache()
+
+logger = logging.getLogger(__name__)
+
+
+def run_batch(connections, PATCH_SIZE=0.05, max_workers=None, chunksize=None, progress=True, rtol=1e-3, check_every=1, cache=True):
+    """
+    Build and solve every connection, distributed across a process pool.
+
+    Arguments:
+        connections         list:: connection dictionaries (see module docstring)
+        PATCH_SIZE          (OPTIONAL) float:: patch size of every weld group. Default = 0.05
+        max_workers         (OPTIONAL) int:: number of worker processes. 1 solves serially in this process.
+                                Default = number of CPUs
+        chunksize           (OPTIONAL) int:: number of connections sent to a worker at a time.
+                                Default = about 4 chunks per worker
+        progress            (OPTIONAL) bool:: print progress as chunks complete. Default = True
+        rtol                (OPTIONAL) float:: relative tolerance of the equilibrium check. None to skip. Default = 1e-3
+        check_every         (OPTIONAL) int:: only check equilibrium of every n-th connection. Default = 1 (all)
+        cache               (OPTIONAL) bool:: reuse section properties of identical geometries within each worker. Default = True
+
+    Returns:
+        df_summary          dataframe:: one row per connection and load combination with v_max, v_max_ID,
+                                sigma_max, sigma_max_ID. Connections that fail have NaN results and the
+                                exception message in the "error" column. Connections that are not in their
+                                principal orientation are solved with the message in the "warning" column
+    """
+    import pandas as pd
+    jobs = [_pack(i, c) for i, c in enumerate(connections)]
+    max_workers = max_workers or os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(1, math.ceil(len(jobs) / (4 * max_workers)))
+    chunks = [jobs[i:i+chunksize] for i in range(0, len(jobs), chunksize)]
+
+    results = []
+    t0 = time.perf_counter()
+    if max_workers == 1:
+        for chunk in chunks:
+            results.extend(_solve_chunk(chunk, PATCH_SIZE, rtol, check_every, cache))
+            if progress:
+                _print_progress(len(results), len(jobs), t0)
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_solve_chunk, chunk, PATCH_SIZE, rtol, check_every, cache) for chunk in chunks]
+            for future in as_completed(futures):
+                results.extend(future.result())
+                if progress:
+                    _print_progress(len(results), len(jobs), t0)
+
+    # consolidate in the original connection order. Warnings are logged here rather than by each worker so they
+    # are not interleaved and name their connection
+    results.sort(key=lambda r: r["index"])
+    frames = []
+    for r in results:
+        if r["warning"] is not None:
+            logger.warning("Connection %s: %s", r["name"], r["warning"])
+        frames.append(pd.DataFrame({"connection": r["name"],
+                                    "combination": r["combinations"],
+                                    "v_max": r["v_max"],
+                                    "v_max_ID": r["v_max_ID"],
+                                    "sigma_max": r["sigma_max"],
+                                    "sigma_max_ID": r["sigma_max_ID"],
+                                    "error": r["error"],
+                                    "warning": r["warning"]}))
+    if not frames:
+        return pd.DataFrame(columns=["connection","combination","v_max","v_max_ID","sigma_max","sigma_max_ID","error","warning"])
+    return pd.concat(frames, ignore_index=True)
+
+
+def _pack(index, connection):
+    """
+    Pack a connection dictionary into numpy arrays so it is cheap to send to a worker process.
+    Lines are (n x 5) [x0, y0, x1, y1, thickness], arcs are (m x 6) [xc, yc, radius, start_angle, end_angle, thickness],
+    and loads are (k x 6). Packing errors are deferred to the worker so they are reported like any other failure.
+    """
+    name = connection.get("name", index)
+    try:
+        welds = connection["welds"]
+        lines = np.array([[*w["start"], *w["end"], w["thickness"]] for w in welds if w["type"] == "line"], dtype=float).reshape(-1, 5)
+        arcs = np.array([[*w["center"], w["radius"], w["start_angle"], w["end_angle"], w["thickness"]]
+                         for w in welds if w["type"] == "arc"], dtype=float).reshape(-1, 6)
+        unknown = [w["type"] for w in welds if w["type"] not in ["line", "arc"]]
+        if unknown:
+            raise ValueError(f'Unrecognized weld type {unknown[0]}. Expected "line" or "arc"')
+
+        loads = connection["loads"]
+        if isinstance(loads, dict):
+            import pandas as pd
+            loads = pd.DataFrame.from_dict(loads, orient="index").fillna(0)
+        load_matrix, combo_names = WeldGroup._load_matrix(loads)
+        combinations = list(range(len(load_matrix))) if combo_names is None else list(combo_names)
+    except Exception as e:
+        return {"index": index, "name": name, "error": f"{type(e).__name__}: {e}"}
+    return {"index": index, "name": name, "lines": lines, "arcs": arcs,
+            "loads": load_matrix, "combinations": combinations, "error": None}
+
+
+def _solve_chunk(jobs, PATCH_SIZE, rtol, check_every, cache):
+    """
+    Build and solve a list of packed connections. Runs in a worker process, which only needs numpy.
+    Exceptions and the principal orientation warning are captured per connection.
+    """
+    results = []
+    for job in jobs:
+        result = {"index": job["index"], "name": job["name"], "combinations": job.get("combinations", [None]),
+                  "v_max": np.nan, "v_max_ID": -1, "sigma_max": np.nan, "sigma_max_ID": -1, "error": job["error"],
+                  "warning": None}
+        if job["error"] is None:
+            try:
+                weld_group = WeldGroup(PATCH_SIZE=PATCH_SIZE, cache=_CACHE if cache else None)
+                if len(job["lines"]):
+                    weld_group.add_lines(job["lines"][:,0:2], job["lines"][:,2:4], job["lines"][:,4])
+                for xc, yc, radius, start_angle, end_angle, thickness in job["arcs"]:
+                    weld_group.add_arc([xc, yc], radius, start_angle, end_angle, thickness)
+                check = rtol if job["index"] % check_every == 0 else None
+                governing, _ = weld_group._governing_results(job["loads"], rtol=check, warn=False)
+                result.update(governing)
+                result["warning"] = weld_group._principal_warning()
+            except Exception as e:
+                result["error"] = f"{type(e).__name__}: {e}"
+        results.append(result)
+    return results
+
+
+def _print_progress(done, total, t0):
+    """print number of connections solved and elapsed time"""
+    print(f"Solved {done}/{total} connections ({time.perf_counter() - t0:.1f} s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Solve a batch of weld groups in parallel")
+    parser.add_argument("input", help="JSON file containing a list of connection definitions")
+    parser.add_argument("-o", "--output", default="summary.csv", help="output summary CSV. Default = summary.csv")
+    parser.add_argument("--workers", type=int, default=None, help="number of worker processes. Default = number of CPUs")
+    parser.add_argument("--chunksize", type=int, default=None, help="connections sent to a worker at a time")
+    parser.add_argument("--patch-size", type=float, default=0.05, help="weld patch size. Default = 0.05")
+    parser.add_argument("--rtol", type=float, default=1e-3, help="relative tolerance of the equilibrium check. Default = 1e-3")
+    parser.add_argument("--check-every", type=int, default=1, help="only check equilibrium of every n-th connection. Default = 1")
+    parser.add_argument("--no-check", action="store_true", help="skip the equilibrium check")
+    parser.add_argument("--no-cache", action="store_true", help="do not reuse section properties of identical geometries")
+    parser.add_argument("--quiet", action="store_true", help="do not print progress")
+    args = parser.parse_args()
+    logging.basicConfig(format="%(levelname)s: %(message)s")
+
+    with open(args.input) as f:
+        connections = json.load(f)
+    df_summary = run_batch(connections, PATCH_SIZE=args.patch_size, max_workers=args.workers,
+                           chunksize=args.chunksize, progress=not args.quiet,
+                           rtol=None if args.no_check else args.rtol, check_every=args.check_every,
+                           cache=not args.no_cache)
+    df_summary.to_csv(args.output, index=False)
+
+    n_failed = df_summary.loc[df_summary["error"].notna(), "connection"].nunique()
+    n_warned = df_summary.loc[df_summary["warning"].notna(), "connection"].nunique()
+    print(f"Wrote {len(df_summary)} rows to {args.output}. {n_failed} connection(s) failed. "
+          f"{n_warned} connection(s) not in principal orientation.")
+
+
+if __name__ == "__main__":
+    main()
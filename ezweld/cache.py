@@ -0,0 +1,118 @@
+"""
+Cache of section properties and unit load responses keyed by a content hash of weld geometry.
+
+Connections in a building model often share identical weld layouts. A SectionCache passed to
+WeldGroup(cache=...) lets every weld group with the same primitives and PATCH_SIZE reuse the
+section properties and (patches x 6 x 3) influence arrays calculated for the first one. Transformed and
+adaptively refined weld groups are not cached.
+"""
+import hashlib
+import json
+import os
+from collections import OrderedDict
+import numpy as np
+
+
+def geometry_hash(primitives, PATCH_SIZE):
+    """
+    Canonical content hash of weld geometry. Two weld groups built from the same primitives (in the same order)
+    and PATCH_SIZE have the same hash and are discretized identically. The hash does not describe patches that
+    were moved after discretization (WeldGroup.transform()) or refined (WeldGroup.solve_adaptive()).
+
+    Arguments:
+        primitives      list:: weld primitive dictionaries (see WeldGroup.primitives)
+        PATCH_SIZE      float:: patch size
+
+    Return:
+        key             str:: hexadecimal SHA-256 digest
+    """
+    canonical = json.dumps({"PATCH_SIZE": float(PATCH_SIZE), "primitives": primitives},
+                           sort_keys=True, separators=(",", ":"), default=float)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class SectionCache:
+    """
+    Least-recently-used cache of section properties and unit load responses, with an optional on-disk layer
+    that persists across sessions.
+
+    Input Arguments:
+        maxsize         (OPTIONAL)int:: maximum number of geometries kept in memory. Default = 128
+        directory       (OPTIONAL)str:: directory of on-disk cache files. Default = None (memory only)
+
+    Public Methods:
+        get()
+        put()
+        clear()
+    """
+    def __init__(self, maxsize=128, directory=None):
+        self.maxsize = maxsize
+        self.directory = directory
+        self.hits = 0           # found in memory
+        self.disk_hits = 0      # found on disk
+        self.misses = 0         # not found
+        self._entries = OrderedDict()
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+
+    def __len__(self):
+        return len(self._entries)
+
+
+    def get(self, key):
+        """
+        Return the cached entry {"properties": dict, "force_influence": array, "stress_influence": array} or None.
+        """
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+
+        if self.directory is not None and os.path.exists(self._path(key)):
+            with np.load(self._path(key)) as data:
+                entry = {"properties": json.loads(str(data["properties"])),
+                         "force_influence": data["force_influence"],
+                         "stress_influence": data["stress_influence"]}
+            self.disk_hits += 1
+            self._remember(key, entry)
+            return entry
+
+        self.misses += 1
+        return None
+
+
+    def put(self, key, properties, force_influence, stress_influence):
+        """Store section properties and unit load responses of a geometry. Arrays are made read-only as they are shared"""
+        entry = {"properties": properties,
+                 "force_influence": force_influence,
+                 "stress_influence": stress_influence}
+        self._remember(key, entry)
+        if self.directory is not None:
+            np.savez(self._path(key),
+                     properties=json.dumps(properties, default=float),
+                     force_influence=force_influence,
+                     stress_influence=stress_influence)
+
+
+    def clear(self):
+        """Empty the in-memory cache and reset counters. On-disk files are kept"""
+        self._entries.clear()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+
+    def _remember(self, key, entry):
+        """add entry to memory and evict the least recently used geometry if full"""
+        for k in ["force_influence", "stress_influence"]:
+            entry[k].setflags(write=False)
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+    def _path(self, key):
+        """on-disk file of a geometry"""
+        return os.path.join(self.directory, f"{key}.npz")
@@ -0,0 +1,238 @@
+"""
+Closed-form geometric properties of weld primitives (straight lines and circular arcs).
+
+Every primitive is reduced to its length integrals about a reference point (the global origin by default):
+    [L, ∫x ds, ∫y ds, ∫x² ds, ∫y² ds, ∫xy ds]
+Multiplying by throat thickness gives area-weighted first and second moments, which
+WeldGroup sums to get A, centroid, Ix, Iy, and Ixy exactly regardless of PATCH_SIZE.
+WeldGroup uses a reference point near its welds so the shift to the centroid does not lose precision.
+"""
+import math
+import numpy as np
+
+
+def line_moments(start, end):
+    """
+    Length integrals of straight line segments. Vectorized over any number of lines.
+
+    Arguments:
+        start           array:: [x, y] coordinate of first point, or (N x 2) array of first points
+        end             array:: [x, y] coordinate of second point, or (N x 2) array of second points
+
+    Return:
+        moments         array:: [L, ∫x, ∫y, ∫x², ∫y², ∫xy], or (N x 6) array for N lines
+    """
+    start = np.asarray(start, dtype=float)
+    end = np.asarray(end, dtype=float)
+    x0, y0 = start[...,0], start[...,1]
+    x1, y1 = end[...,0], end[...,1]
+    L = np.hypot(x1 - x0, y1 - y0)
+    return np.stack([L,
+                     L * (x0 + x1) / 2,
+                     L * (y0 + y1) / 2,
+                     L * (x0*x0 + x0*x1 + x1*x1) / 3,
+                     L * (y0*y0 + y0*y1 + y1*y1) / 3,
+                     L * (2*x0*y0 + x0*y1 + x1*y0 + 2*x1*y1) / 6], axis=-1)
+
+
+def arc_moments(center, radius, start_angle, end_angle):
+    """
+    Length integrals of a circular arc drawn counter-clockwise from start_angle to end_angle.
+
+    Arguments:
+        center          list:: [x, y] coordinate of arc center
+        radius          float:: arc radius
+        start_angle     float:: start angle in DEGREES measured counter-clockwise from +X
+        end_angle       float:: end angle in DEGREES. Must be greater than start_angle
+
+    Return:
+        moments         array:: [L, ∫x, ∫y, ∫x², ∫y², ∫xy]
+    """
+    xc, yc = center
+    r = radius
+    a = math.radians(start_angle)
+    b = math.radians(end_angle)
+    sweep = b - a
+    d_sin = math.sin(b) - math.sin(a)             # ∫cos(θ)dθ
+    d_cos = math.cos(a) - math.cos(b)             # ∫sin(θ)dθ
+    d_sin2 = (math.sin(2*b) - math.sin(2*a)) / 2  # ∫cos(2θ)dθ
+    d_sinsq = (math.sin(b)**2 - math.sin(a)**2) / 2  # ∫sin(θ)cos(θ)dθ
+
+    # x = xc + r*cos(θ), y = yc + r*sin(θ), ds = r*dθ
+    return np.array([r * sweep,
+                     r * (xc*sweep + r*d_sin),
+                     r * (yc*sweep + r*d_cos),
+                     r * (xc*xc*sweep + 2*xc*r*d_sin + r*r*(sweep + d_sin2)/2),
+                     r * (yc*yc*sweep + 2*yc*r*d_cos + r*r*(sweep - d_sin2)/2),
+                     r * (xc*yc*sweep + xc*r*d_cos + yc*r*d_sin + r*r*d_sinsq)])
+
+
+def arc_bounds(center, radius, start_angle, end_angle):
+    """
+    Bounding box of a circular arc. Includes the arc end points and any quadrant points (0, 90, 180, 270 deg)
+    that fall within the arc.
+
+    Return:
+        bounds          tuple:: (xmin, xmax, ymin, ymax)
+    """
+    xc, yc = center
+    angles = [start_angle, end_angle]
+    quadrant = math.ceil(start_angle / 90) * 90
+    while quadrant < end_angle:
+        angles.append(quadrant)
+        quadrant += 90
+    angles = np.radians(angles)
+    x = xc + radius * np.cos(angles)
+    y = yc + radius * np.sin(angles)
+    return x.min(), x.max(), y.min(), y.max()
+
+
+def primitive_moments(primitive, origin=(0, 0)):
+    """Length integrals [L, ∫x, ∫y, ∫x², ∫y², ∫xy] about origin of a weld primitive dictionary (see WeldGroup.primitives)"""
+    origin = np.asarray(origin, dtype=float)
+    if primitive["type"] == "line":
+        return line_moments(np.asarray(primitive["start"], dtype=float) - origin, np.asarray(primitive["end"], dtype=float) - origin)
+    return arc_moments(np.asarray(primitive["center"], dtype=float) - origin, primitive["radius"],
+                       primitive["start_angle"], primitive["end_angle"])
+
+
+def primitive_bounds(primitive):
+    """Bounding box (xmin, xmax, ymin, ymax) of a weld primitive dictionary (see WeldGroup.primitives)"""
+    if primitive["type"] == "line":
+        (x0, y0), (x1, y1) = primitive["start"], primitive["end"]
+        return min(x0, x1), max(x0, x1), min(y0, y1), max(y0, y1)
+    return arc_bounds(primitive["center"], primitive["radius"], primitive["start_angle"], primitive["end_angle"])
+
+
+def moments_and_bounds(primitives, origin=(0, 0)):
+    """
+    Length integrals and bounding boxes of a list of weld primitives. Lines are evaluated as one vectorized batch.
+
+    Arguments:
+        primitives      list:: weld primitive dictionaries (see WeldGroup.primitives)
+        origin          (OPTIONAL) list:: [x, y] reference point of the length integrals. Default = (0, 0)
+
+    Return:
+        moments         array:: (N x 6) [L, ∫x, ∫y, ∫x², ∫y², ∫xy] of each primitive about origin
+        bounds          array:: (N x 4) (xmin, xmax, ymin, ymax) of each primitive
+    """
+    origin = np.asarray(origin, dtype=float)
+    moments = np.zeros((len(primitives), 6))
+    bounds = np.zeros((len(primitives), 4))
+    is_line = np.array([p["type"] == "line" for p in primitives], dtype=bool)
+
+    if is_line.any():
+        starts = np.array([p["start"] for p, line in zip(primitives, is_line) if line], dtype=float)
+        ends = np.array([p["end"] for p, line in zip(primitives, is_line) if line], dtype=float)
+        moments[is_line] = line_moments(starts - origin, ends - origin)
+        bounds[is_line] = np.column_stack([np.minimum(starts[:,0], ends[:,0]), np.maximum(starts[:,0], ends[:,0]),
+                                           np.minimum(starts[:,1], ends[:,1]), np.maximum(starts[:,1], ends[:,1])])
+    for i in np.flatnonzero(~is_line):
+        moments[i] = primitive_moments(primitives[i], origin)
+        bounds[i] = primitive_bounds(primitives[i])
+    return moments, bounds
+
+
+def primitive_points(primitives, index, s):
+    """
+    Coordinates of points along weld primitives. Lines are parameterized linearly from start to end and arcs by angle
+    from start_angle to end_angle.
+
+    Arguments:
+        primitives      list:: weld primitive dictionaries (see WeldGroup.primitives)
+        index           array:: index of the primitive each point lies on
+        s               array:: normalized position of each point along its primitive (0 = start, 1 = end)
+
+    Return:
+        x               array:: x coordinates
+        y               array:: y coordinates
+    """
+    index = np.asarray(index, dtype=int)
+    s = np.asarray(s, dtype=float)
+    is_line = np.array([p["type"] == "line" for p in primitives], dtype=bool)
+
+    # per-primitive parameters. Lines: [x0, y0, x1, y1]. Arcs: [xc, yc, radius, start angle, end angle] (radians)
+    params = np.zeros((len(primitives), 5))
+    for i, p in enumerate(primitives):
+        if is_line[i]:
+            params[i,:4] = [p["start"][0], p["start"][1], p["end"][0], p["end"][1]]
+        else:
+            params[i] = [p["center"][0], p["center"][1], p["radius"],
+                         math.radians(p["start_angle"]), math.radians(p["end_angle"])]
+    params = params[index]
+    on_line = is_line[index]
+
+    x = np.empty(len(index))
+    y = np.empty(len(index))
+    a = params[on_line]
+    x[on_line] = a[:,0] + s[on_line] * (a[:,2] - a[:,0])
+    y[on_line] = a[:,1] + s[on_line] * (a[:,3] - a[:,1])
+    a = params[~on_line]
+    theta = a[:,3] + s[~on_line] * (a[:,4] - a[:,3])
+    x[~on_line] = a[:,0] + a[:,2] * np.cos(theta)
+    y[~on_line] = a[:,1] + a[:,2] * np.sin(theta)
+    return x, y
+
+
+def arc_stationary_angles(a, b, c):
+    """
+    Angles where the magnitude of a vector that varies around an arc as f(θ) = a + b*cos(θ) + c*sin(θ) is
+    stationary. |f|² is a trigonometric polynomial of second degree, so its derivative has at most four roots
+    which are found as the roots of a quartic in z = exp(iθ).
+
+    Arguments:
+        a               array:: vector value at the arc center
+        b               array:: change in vector per unit cos(θ)
+        c               array:: change in vector per unit sin(θ)
+
+    Return:
+        theta           array:: stationary angles in RADIANS between -π and π. May include spurious angles
+    """
+    # |f|² = const + A1*cos(θ) + B1*sin(θ) + A2*cos(2θ) + B2*sin(2θ)
+    A1 = 2 * np.dot(a, b)
+    B1 = 2 * np.dot(a, c)
+    A2 = (np.dot(b, b) - np.dot(c, c)) / 2
+    B2 = np.dot(b, c)
+
+    # derivative multiplied by z² is a polynomial in z
+    coefficients = [B2 + 1j*A2, (B1 + 1j*A1) / 2, 0, (B1 - 1j*A1) / 2, B2 - 1j*A2]
+    if np.allclose(coefficients, 0):
+        return np.array([])
+    return np.angle(np.roots(coefficients))
+
+
+def transform_primitive(primitive, matrix, offset):
+    """
+    Apply the affine transformation x' = matrix @ x + offset to a weld primitive dictionary. Lines accept any
+    affine transformation. Arcs remain circular only under similarity transformations (rotation, reflection,
+    uniform scaling, translation); anything else raises ValueError.
+
+    Return:
+        primitive       dict:: transformed copy of the primitive
+    """
+    matrix = np.asarray(matrix, dtype=float)
+    offset = np.asarray(offset, dtype=float)
+    transformed = dict(primitive)
+    if primitive["type"] == "line":
+        transformed["start"] = (matrix @ np.asarray(primitive["start"], dtype=float) + offset).tolist()
+        transformed["end"] = (matrix @ np.asarray(primitive["end"], dtype=float) + offset).tolist()
+        return transformed
+
+    # similarity transformation has matrix.T @ matrix = scale^2 * identity
+    scale = math.sqrt(abs(np.linalg.det(matrix)))
+    if not np.allclose(matrix.T @ matrix, scale**2 * np.eye(2), atol=1e-9 * max(scale**2, 1)):
+        raise ValueError("Arcs can only be transformed by rotation, reflection, uniform scaling, or translation")
+
+    # angle of the rotation part. A reflection maps the point at angle θ to angle φ - θ and reverses the sweep
+    phi = math.degrees(math.atan2(matrix[1,0], matrix[0,0]))
+    if np.linalg.det(matrix) > 0:
+        start_angle = primitive["start_angle"] + phi
+        end_angle = primitive["end_angle"] + phi
+    else:
+        start_angle = phi - primitive["end_angle"]
+        end_angle = phi - primitive["start_angle"]
+    transformed["center"] = (matrix @ np.asarray(primitive["center"], dtype=float) + offset).tolist()
+    transformed["radius"] = primitive["radius"] * scale
+    transformed["start_angle"] = start_angle
+    transformed["end_angle"] = end_angle
+    return transformed
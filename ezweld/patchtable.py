@@ -0,0 +1,212 @@
+import numpy as np
+
+
+class PatchTable:
+    """
+    Growable column storage for discretized weld patches. Every column lives in one row of a
+    contiguous buffer. Capacity doubles whenever the buffer is full so appending patches
+    is amortized O(1) rather than copying all previous patches on every call.
+
+    In compact mode only the end points and thickness are stored. Centroid, length, and area are
+    recalculated whenever they are requested, and writes to those columns are discarded.
+
+    Input Arguments:
+        capacity        (OPTIONAL)int:: initial number of patches to allocate. Default = 256
+        dtype           (OPTIONAL)dtype:: float type of the buffer. Default = np.float64
+        compact         (OPTIONAL)bool:: store only end points and thickness. Default = False
+
+    Public Methods:
+        append()
+        column()
+        as_dict()
+        buffer()
+        from_buffer()
+    """
+    COLUMNS = ["x_centroid",        # x coordinate of centroid of patch
+               "y_centroid",        # y coordinate of centroid of patch
+               "x_start",           # x coordinate of start node
+               "y_start",           # y coordinate of start node
+               "x_end",             # x coordinate of end node
+               "y_end",             # y coordinate of end node
+               "thickness",         # patch throat thickness
+               "length",            # patch length
+               "area"]              # patch area = length * thickness
+    STORED_COMPACT = ["x_start", "y_start", "x_end", "y_end", "thickness"]
+
+    def __init__(self, capacity=256, dtype=np.float64, compact=False):
+        self.size = 0
+        self.compact = compact
+        self.stored = self.STORED_COMPACT if compact else self.COLUMNS
+        self._index = {k:i for i,k in enumerate(self.stored)}
+        self._buffer = np.empty((len(self.stored), max(int(capacity), 1)), dtype=dtype)
+
+
+    def __len__(self):
+        return self.size
+
+
+    def __getstate__(self):
+        """pickle only the filled part of the buffer. Memory-mapped buffers are pickled as regular arrays"""
+        state = self.__dict__.copy()
+        state["_buffer"] = np.asarray(self.buffer())
+        return state
+
+
+    def append(self, **columns):
+        """
+        Append patches to the table. Every column in PatchTable.COLUMNS must be specified as an array of equal length.
+        Derived columns are ignored in compact mode.
+        """
+        n = len(columns["x_start"])
+
+        # grow by doubling capacity
+        capacity = self._buffer.shape[1]
+        if self.size + n > capacity:
+            while self.size + n > capacity:
+                capacity *= 2
+            new_buffer = np.empty((len(self.stored), capacity), dtype=self._buffer.dtype)
+            new_buffer[:, :self.size] = self._buffer[:, :self.size]
+            self._buffer = new_buffer
+
+        for k in self.stored:
+            self._buffer[self._index[k], self.size:self.size+n] = columns[k]
+        self.size += n
+
+
+    def column(self, key, rows=slice(None)):
+        """
+        Return a writable view of a column, or of a slice of rows. Views are invalidated once the table grows.
+        Derived columns in compact mode are returned as new arrays.
+        """
+        if key in self._index:
+            return self._buffer[self._index[key], :self.size][rows]
+        if key == "x_centroid":
+            return (self.column("x_start", rows) + self.column("x_end", rows)) / 2
+        if key == "y_centroid":
+            return (self.column("y_start", rows) + self.column("y_end", rows)) / 2
+        if key == "length":
+            return np.hypot(self.column("x_end", rows) - self.column("x_start", rows),
+                            self.column("y_end", rows) - self.column("y_start", rows))
+        if key == "area":
+            return self.column("length", rows) * self.column("thickness", rows)
+        raise KeyError(key)
+
+
+    def as_dict(self):
+        """Return a dictionary of column views"""
+        return {k:self.column(k) for k in self.COLUMNS}
+
+
+    def buffer(self):
+        """Return a (stored columns x patches) view of every stored column"""
+        return self._buffer[:, :self.size]
+
+
+    @classmethod
+    def from_buffer(cls, buffer, compact=False):
+        """
+        Wrap an existing (stored columns x patches) array, such as a memory-mapped file, without copying it.
+        The array is only copied if more patches are appended.
+        """
+        table = cls(capacity=1, dtype=buffer.dtype, compact=compact)
+        if buffer.shape[0] != len(table.stored):
+            raise ValueError(f"Expected {len(table.stored)} patch columns. Got {buffer.shape[0]}")
+        table._buffer = buffer
+        table.size = buffer.shape[1]
+        return table
+
+
+class ResultTable:
+    """
+    Preallocated column storage for the per-patch results of WeldGroup.solve(). Kept separate from the patch
+    geometry and overwritten in place by every solve() so repeated analyses run at flat memory. The buffer is
+    only reallocated when the number of patches changes.
+
+    Input Arguments:
+        size            (OPTIONAL)int:: number of patches. Default = 0
+        dtype           (OPTIONAL)dtype:: float type of the buffer. Default = np.float64
+
+    Public Methods:
+        resize()
+        column()
+        as_dict()
+        buffer()
+        from_buffer()
+    """
+    COLUMNS = ["vx_direct",         # x direct shear from Vx
+               "vx_torsion",        # x torsional shear from Mz
+               "vy_direct",         # y direct shear from Vy
+               "vy_torsion",        # y torsional shear from Mz
+               "vz_direct",         # z shear (axial) from Vz
+               "vz_Mx",             # z shear (axial) from Mx
+               "vz_My",             # z shear (axial) from My
+               "vx_total",          # x shear total = direct + torsional
+               "vy_total",          # y shear total = direct + torsional
+               "vz_total",          # z shear total = direct + overturningX + overturningY
+               "v_resultant",       # resultant shear from SRSS of x, y, z shear
+               "Fx",                # patch force (kips) used to verify equilibrium
+               "Fy",
+               "Fz",
+               "Mxi",               # patch moment about centroid (k.in) used to verify equilibrium
+               "Myi",
+               "Mzi",
+               "tauX_direct",       # same as above but expressed in stress (ksi) rather than (k/in)
+               "tauX_torsion",
+               "tauY_direct",
+               "tauY_torsion",
+               "tauZ_direct",
+               "tauZ_Mx",
+               "tauZ_My",
+               "tauX_total",
+               "tauY_total",
+               "tauZ_total",
+               "sigma_vm"]
+
+    def __init__(self, size=0, dtype=np.float64):
+        self._index = {k:i for i,k in enumerate(self.COLUMNS)}
+        self._buffer = np.empty((len(self.COLUMNS), size), dtype=dtype)
+
+
+    def __len__(self):
+        return self._buffer.shape[1]
+
+
+    def __getstate__(self):
+        """memory-mapped buffers are pickled as regular arrays"""
+        state = self.__dict__.copy()
+        state["_buffer"] = np.asarray(self._buffer)
+        return state
+
+
+    def resize(self, size):
+        """
+        Reallocate the buffer if the number of patches has changed or it is read-only (e.g. memory-mapped by
+        WeldGroup.load()). Existing results are discarded.
+        """
+        if size != self._buffer.shape[1] or not self._buffer.flags.writeable:
+            self._buffer = np.empty((len(self.COLUMNS), size), dtype=self._buffer.dtype)
+
+
+    def column(self, key):
+        """Return a writable view of a column. Overwritten by the next solve()"""
+        return self._buffer[self._index[key]]
+
+
+    def as_dict(self):
+        """Return a dictionary of column views"""
+        return {k:self.column(k) for k in self.COLUMNS}
+
+
+    def buffer(self):
+        """Return the (columns x patches) result buffer"""
+        return self._buffer
+
+
+    @classmethod
+    def from_buffer(cls, buffer):
+        """Wrap an existing (columns x patches) array, such as a memory-mapped file, without copying it"""
+        if buffer.shape[0] != len(cls.COLUMNS):
+            raise ValueError(f"Expected {len(cls.COLUMNS)} result columns. Got {buffer.shape[0]}")
+        table = cls(dtype=buffer.dtype)
+        table._buffer = buffer
+        return table
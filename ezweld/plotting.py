@@ -0,0 +1,743 @@
+"""
+Matplotlib and plotly visualization of weld groups. Kept separate from the compute core in ezweld.weldgroup so
+that WeldGroup objects stay light to import and pickle. Every function reads the patch and result arrays of a
+WeldGroup; the WeldGroup.preview(), plot_results(), and plot_results_3D() methods are shortcuts to them.
+"""
+import math
+import numpy as np
+import matplotlib.pyplot as plt
+import matplotlib.colors as mcolors
+import matplotlib.cm as mcm
+from matplotlib.collections import PolyCollection
+import plotly.graph_objects as go
+import plotly.io as pio
+from plotly.subplots import make_subplots
+
+
+_PLOTLY_RENDERER_SET = False
+
+
+def _set_default_renderer():
+    """
+    Set the default plotly renderer to "browser" on the first 3D plot only, so users may change it afterwards.
+    """
+    global _PLOTLY_RENDERER_SET
+    if not _PLOTLY_RENDERER_SET:
+        pio.renderers.default = "browser"
+        _PLOTLY_RENDERER_SET = True
+
+
+def preview(weld_group):
+    """
+    preview weld group defined by user.
+
+    Arguments:
+        weld_group          WeldGroup:: weld group to preview
+    """
+    DEFAULT_THICKNESS = 0.25  # for display
+
+    # update geometric property. Skipped if nothing changed since last calculation
+    if not weld_group._properties_current:
+        weld_group.update_geometric_properties()
+    weld_group._sync_dict_welds(force=True)
+
+    # initialize figure
+    fig, axs = plt.subplots(1,2, figsize=(11,8.5), gridspec_kw={"width_ratios":[2,3]})
+
+    # plot weld mesh as a single polygon collection
+    axs[1].add_collection(PolyCollection(_patch_polygons(weld_group, DEFAULT_THICKNESS), closed=True, facecolor="steelblue",
+                                         alpha=0.8, edgecolor="black", zorder=1, lw=0.5))
+    axs[1].autoscale_view()
+
+    # plot Cog
+    axs[1].plot(weld_group.x_centroid, weld_group.y_centroid, marker="x",c="red",markersize=8,zorder=2,linestyle="none")
+
+    # annotation for weld properties
+    xo = 0.12
+    yo = 0.98
+    dy = 0.045
+    unit = "in"
+    axs[0].annotate("Weld Group Properties", 
+                    (xo-0.03,yo), fontweight="bold",xycoords='axes fraction', fontsize=12, va="top", ha="left")
+    axs[0].annotate(r"$x_{{cg}} = {:.2f} \quad {}$".format(weld_group.x_centroid_force, unit), 
+                    (xo,yo-dy*1), xycoords='axes fraction', fontsize=12, va="top", ha="left")
+    axs[0].annotate(r"$y_{{cg}} = {:.2f} \quad {}$".format(weld_group.y_centroid_force, unit), 
+                    (xo,yo-dy*2), xycoords='axes fraction', fontsize=12, va="top", ha="left")
+    axs[0].annotate(r"$L = {:.2f} \quad {}$".format(weld_group.L_force, unit), 
+                    (xo,yo-dy*3), xycoords='axes fraction', fontsize=12, va="top", ha="left")
+    axs[0].annotate(r"$L_{{effective}} = {:.2f} \quad {}$".format(weld_group.Le_force, unit), 
+                    (xo,yo-dy*4), xycoords='axes fraction', fontsize=12, va="top", ha="left")
+    axs[0].annotate(r"$I_x = {:.2f} \quad {}^3$".format(weld_group.Ix_force, unit), 
+                    (xo,yo-dy*5), xycoords='axes fraction', fontsize=12, va="top", ha="left")
+    axs[0].annotate(r"$I_y = {:.2f} \quad {}^3$".format(weld_group.Iy_force, unit), 
+                    (xo,yo-dy*6), xycoords='axes fraction', fontsize=12, va="top", ha="left")
+    axs[0].annotate(r"$I_z = {:.2f} \quad {}^3$".format(weld_group.Iz_force, unit), 
+                    (xo,yo-dy*7), xycoords='axes fraction', fontsize=12, va="top", ha="left")
+    axs[0].annotate(r"$S_{{x,top}} = {:.2f} \quad {}^2$".format(weld_group.Sx1_force, unit), 
+                    (xo,yo-dy*8), xycoords='axes fraction', fontsize=12, va="top", ha="left")
+    axs[0].annotate(r"$S_{{x,bottom}} = {:.2f} \quad {}^2$".format(weld_group.Sx2_force, unit), 
+                    (xo,yo-dy*9), xycoords='axes fraction', fontsize=12, va="top", ha="left")
+    axs[0].annotate(r"$S_{{y,right}} = {:.2f} \quad {}^2$".format(weld_group.Sy1_force, unit), 
+                    (xo,yo-dy*10), xycoords='axes fraction', fontsize=12, va="top", ha="left")
+    axs[0].annotate(r"$S_{{y,left}} = {:.2f} \quad {}^2$".format(weld_group.Sy2_force, unit), 
+                    (xo,yo-dy*11), xycoords='axes fraction', fontsize=12, va="top", ha="left")
+    axs[0].annotate(r"$I_{{xy}} = {:.2f} \quad {}^3$".format(weld_group.Ixy_force, unit), 
+                    (xo,yo-dy*12), xycoords='axes fraction', fontsize=12, va="top", ha="left")
+    axs[0].annotate(r"$\theta_{{p}} = {:.2f} \quad deg$".format(weld_group.theta_p_force), 
+                    (xo,yo-dy*13), xycoords='axes fraction', fontsize=12, va="top", ha="left")
+
+
+    # styling
+    axs[1].set_aspect('equal', 'datalim')
+    fig.suptitle("Weld Group Preview", fontweight="bold", fontsize=16)
+    axs[1].set_axisbelow(True)
+    axs[0].set_xticks([])
+    axs[0].set_yticks([])
+    plt.tight_layout()
+
+
+def plot_results(weld_group, plot="force", colormap="jet", cmin="auto", cmax="auto"):
+    """
+    plot results using matplotlib
+
+    Arguments:
+        weld_group          WeldGroup:: solved weld group (solve() with results="dataframe" or "arrays")
+        plot                (OPTIONAL) str:: "force" (k/in) or "stress" (ksi). Default = "force"
+        colormap            (OPTIONAL) str:: matplotlib colormap. Default = "jet"
+        cmin                (OPTIONAL) float:: lower limit of the colormap. Default = "auto"
+        cmax                (OPTIONAL) float:: upper limit of the colormap. Default = "auto"
+    """
+    # plot unit force or stress
+    if plot == "force":
+        magnitude = weld_group.dict_welds["v_resultant"]
+        title = "Shear Resultant Force (k/in)"
+    else:
+        magnitude = weld_group.dict_welds["sigma_vm"]
+        title = "Shear Stress Contour (ksi)"
+
+    # initialize figure
+    DEFAULT_THICKNESS = 0.25  # for display
+    fig, axs = plt.subplots(1,2, figsize=(11,8.5), gridspec_kw={"width_ratios":[2,3]})
+
+    # colormap
+    magnitude = np.asarray(magnitude)
+    cm = plt.get_cmap(colormap)
+    cmin = magnitude.min() if cmin == "auto" else cmin
+    cmax = magnitude.max() if cmax == "auto" else cmax
+    if math.isclose(cmax-cmin, 0):
+        cmin = 0
+    norm = mcolors.Normalize(vmin=cmin, vmax=cmax)
+
+    # add colorbar to plot
+    tick_values = np.linspace(cmin,cmax,6)
+    fig.colorbar(mcm.ScalarMappable(norm=norm, cmap=cm), 
+                 orientation='vertical',
+                 ax=axs[1],
+                 ticks=tick_values)
+
+    # plot weld mesh as a single polygon collection colored by magnitude
+    colors = cm(norm(magnitude))
+    axs[1].add_collection(PolyCollection(_patch_polygons(weld_group, DEFAULT_THICKNESS), closed=True, facecolor=colors,
+                                         alpha=0.8, edgecolor=colors, zorder=1, lw=0.5))
+    axs[1].autoscale_view()
+
+    # plot Cog
+    axs[1].plot(weld_group.x_centroid, weld_group.y_centroid, marker="x",c="red",markersize=8,zorder=2,linestyle="none")
+    axs[1].annotate("",
+                    xy=(weld_group.x_centroid+1, weld_group.y_centroid), 
+                    xytext=(weld_group.x_centroid, weld_group.y_centroid),
+                    color="black",
+                    arrowprops=dict(arrowstyle="simple,head_length=0.4,head_width=0.3,tail_width=0.10",
+                                        fc="black", ec="black"))
+    axs[1].annotate("",
+                    xy=(weld_group.x_centroid, weld_group.y_centroid+1), 
+                    xytext=(weld_group.x_centroid, weld_group.y_centroid),
+                    color="black",
+                    arrowprops=dict(arrowstyle="simple,head_length=0.4,head_width=0.3,tail_width=0.10",
+                                        fc="black", ec="black"))
+    axs[1].annotate("X",
+                    xy=(weld_group.x_centroid, weld_group.y_centroid), 
+                    xytext=(weld_group.x_centroid+1.1, weld_group.y_centroid),
+                    va="center",
+                    color="black")
+    axs[1].annotate("Y",
+                    xy=(weld_group.x_centroid, weld_group.y_centroid), 
+                    xytext=(weld_group.x_centroid, weld_group.y_centroid+1.1),
+                    ha="center",
+                    color="black")
+
+
+    # annotation for weld properties
+    xo = 0.12
+    yo = 0.98
+    dy = 0.045
+    axs[0].annotate("Weld Group Properties", 
+                    (xo-0.03,yo), fontweight="bold",xycoords='axes fraction', fontsize=12, va="top", ha="left")
+    if plot == "force":
+        axs[0].annotate(r"$x_{{cg}} = {:.2f} \quad in$".format(weld_group.x_centroid_force), 
+                        (xo,yo-dy*1), xycoords='axes fraction', fontsize=12, va="top", ha="left")
+        axs[0].annotate(r"$y_{{cg}} = {:.2f} \quad in$".format(weld_group.y_centroid_force), 
+                        (xo,yo-dy*2), xycoords='axes fraction', fontsize=12, va="top", ha="left")
+        axs[0].annotate(r"$L = {:.2f} \quad in$".format(weld_group.L_force), 
+                        (xo,yo-dy*3), xycoords='axes fraction', fontsize=12, va="top", ha="left")
+        axs[0].annotate(r"$L_{{effective}} = {:.2f} \quad in$".format(weld_group.Le_force), 
+                        (xo,yo-dy*4), xycoords='axes fraction', fontsize=12, va="top", ha="left")
+        axs[0].annotate(r"$I_x = {:.2f} \quad in^3$".format(weld_group.Ix_force), 
+                        (xo,yo-dy*5), xycoords='axes fraction', fontsize=12, va="top", ha="left")
+        axs[0].annotate(r"$I_y = {:.2f} \quad in^3$".format(weld_group.Iy_force), 
+                        (xo,yo-dy*6), xycoords='axes fraction', fontsize=12, va="top", ha="left")
+        axs[0].annotate(r"$I_z = {:.2f} \quad in^3$".format(weld_group.Iz_force), 
+                        (xo,yo-dy*7), xycoords='axes fraction', fontsize=12, va="top", ha="left")
+        axs[0].annotate(r"$S_{{x,top}} = {:.2f} \quad in^2$".format(weld_group.Sx1_force), 
+                        (xo,yo-dy*8), xycoords='axes fraction', fontsize=12, va="top", ha="left")
+        axs[0].annotate(r"$S_{{x,bottom}} = {:.2f} \quad in^2$".format(weld_group.Sx2_force), 
+                        (xo,yo-dy*9), xycoords='axes fraction', fontsize=12, va="top", ha="left")
+        axs[0].annotate(r"$S_{{y,right}} = {:.2f} \quad in^2$".format(weld_group.Sy1_force), 
+                        (xo,yo-dy*10), xycoords='axes fraction', fontsize=12, va="top", ha="left")
+        axs[0].annotate(r"$S_{{y,left}} = {:.2f} \quad in^2$".format(weld_group.Sy2_force), 
+                        (xo,yo-dy*11), xycoords='axes fraction', fontsize=12, va="top", ha="left")
+        axs[0].annotate(r"$I_{{xy}} = {:.2f} \quad in^3$".format(weld_group.Ixy_force), 
+                        (xo,yo-dy*12), xycoords='axes fraction', fontsize=12, va="top", ha="left")
+        axs[0].annotate(r"$\theta_{{p}} = {:.2f} \quad deg$".format(weld_group.theta_p_force), 
+                        (xo,yo-dy*13), xycoords='axes fraction', fontsize=12, va="top", ha="left")
+    else:
+        axs[0].annotate(r"$x_{{cg}} = {:.2f} \quad in$".format(weld_group.x_centroid), 
+                        (xo,yo-dy*1), xycoords='axes fraction', fontsize=12, va="top", ha="left")
+        axs[0].annotate(r"$y_{{cg}} = {:.2f} \quad in$".format(weld_group.y_centroid), 
+                        (xo,yo-dy*2), xycoords='axes fraction', fontsize=12, va="top", ha="left")
+        axs[0].annotate(r"$A = {:.2f} \quad in^2$".format(weld_group.A), 
+                        (xo,yo-dy*3), xycoords='axes fraction', fontsize=12, va="top", ha="left")
+        axs[0].annotate(r"$I_x = {:.2f} \quad in^4$".format(weld_group.Ix), 
+                        (xo,yo-dy*4), xycoords='axes fraction', fontsize=12, va="top", ha="left")
+        axs[0].annotate(r"$I_y = {:.2f} \quad in^4$".format(weld_group.Iy), 
+                        (xo,yo-dy*5), xycoords='axes fraction', fontsize=12, va="top", ha="left")
+        axs[0].annotate(r"$I_z = {:.2f} \quad in^4$".format(weld_group.Iz), 
+                        (xo,yo-dy*6), xycoords='axes fraction', fontsize=12, va="top", ha="left")
+        axs[0].annotate(r"$S_{{x,top}} = {:.2f} \quad in^3$".format(weld_group.Sx1), 
+                        (xo,yo-dy*7), xycoords='axes fraction', fontsize=12, va="top", ha="left")
+        axs[0].annotate(r"$S_{{x,bottom}} = {:.2f} \quad in^3$".format(weld_group.Sx2), 
+                        (xo,yo-dy*8), xycoords='axes fraction', fontsize=12, va="top", ha="left")
+        axs[0].annotate(r"$S_{{y,right}} = {:.2f} \quad in^3$".format(weld_group.Sy1), 
+                        (xo,yo-dy*9), xycoords='axes fraction', fontsize=12, va="top", ha="left")
+        axs[0].annotate(r"$S_{{y,left}} = {:.2f} \quad in^3$".format(weld_group.Sy2), 
+                        (xo,yo-dy*10), xycoords='axes fraction', fontsize=12, va="top", ha="left")
+        axs[0].annotate(r"$I_{{xy}} = {:.2f} \quad in^4$".format(weld_group.Ixy), 
+                        (xo,yo-dy*11), xycoords='axes fraction', fontsize=12, va="top", ha="left")
+        axs[0].annotate(r"$\theta_{{p}} = {:.2f} \quad deg$".format(weld_group.theta_p), 
+                        (xo,yo-dy*12), xycoords='axes fraction', fontsize=12, va="top", ha="left")
+
+    xo = 0.12
+    yo = 0.35
+    dy = 0.045
+    axs[0].annotate("Applied Loading", 
+                    (xo-0.03,yo), fontweight="bold",xycoords='axes fraction', fontsize=12, va="top", ha="left")
+    axs[0].annotate(r"$V_x = {:.2f} \quad kips$".format(weld_group.Vx), 
+                    (xo,yo-dy*1), xycoords='axes fraction', fontsize=12, va="top", ha="left")
+    axs[0].annotate(r"$V_y = {:.2f} \quad kips$".format(weld_group.Vy), 
+                    (xo,yo-dy*2), xycoords='axes fraction', fontsize=12, va="top", ha="left")
+    axs[0].annotate(r"$V_z = {:.2f} \quad kips$".format(weld_group.Vz), 
+                    (xo,yo-dy*3), xycoords='axes fraction', fontsize=12, va="top", ha="left")
+    axs[0].annotate(r"$M_x = {:.2f} \quad k.in$".format(weld_group.Mx), 
+                    (xo,yo-dy*4), xycoords='axes fraction', fontsize=12, va="top", ha="left")
+    axs[0].annotate(r"$M_y = {:.2f} \quad k.in$".format(weld_group.My), 
+                    (xo,yo-dy*5), xycoords='axes fraction', fontsize=12, va="top", ha="left")
+    axs[0].annotate(r"$M_z = {:.2f} \quad k.in$".format(weld_group.Mz), 
+                    (xo,yo-dy*6), xycoords='axes fraction', fontsize=12, va="top", ha="left")
+
+    # styling
+    axs[1].set_aspect('equal', 'datalim')
+    fig.suptitle(title, fontweight="bold", fontsize=16)
+    axs[1].set_axisbelow(True)
+    axs[0].set_xticks([])
+    axs[0].set_yticks([])
+    plt.tight_layout()
+
+
+def plot_results_3D(weld_group, colormap="jet", cmin="auto", cmax="auto", scale=0.2, max_vectors=10000, show=True):
+    """
+    use plotly to generate an interactive plot
+
+    Arguments:
+        weld_group          WeldGroup:: solved weld group (solve() with results="dataframe" or "arrays")
+        colormap            (OPTIONAL) str:: matplotlib colormap of the force vectors. Default = "jet"
+        cmin                (OPTIONAL) float:: lower limit of the colormap. Default = "auto"
+        cmax                (OPTIONAL) float:: upper limit of the colormap. Default = "auto"
+        scale               (OPTIONAL) float:: vector length per unit force (in per k/in). Default = 0.2
+        max_vectors         (OPTIONAL) int:: vector budget. Larger weld groups only plot every k-th patch,
+                                plus the governing patches. None to plot every patch. Default = 10000
+        show                (OPTIONAL) bool:: open the figure in the default plotly renderer. Default = True
+    """
+    _set_default_renderer()
+
+    # level of detail. Keep every k-th patch along with the patches of maximum force and stress
+    n_patches = len(weld_group.dict_welds["v_resultant"])
+    k = 1 if max_vectors is None else max(1, math.ceil(n_patches / max_vectors))
+    shown = np.arange(0, n_patches, k)
+    if k > 1:
+        governing = [np.argmax(weld_group.dict_welds["v_resultant"]), np.argmax(weld_group.dict_welds["sigma_vm"])]
+        shown = np.union1d(shown, governing)
+    vector_title = "Vector Plot" if k == 1 else f"Vector Plot ({len(shown)} of {n_patches} patches shown)"
+
+    # initialize a plotly figure with 2 subplots
+    fig = make_subplots(rows=2, cols=2,
+                        subplot_titles=("Weld Group Properties", vector_title, "Applied Loading"),
+                        column_widths=[0.3, 0.7],
+                        row_heights=[0.65, 0.35],
+                        horizontal_spacing=0.02,
+                        vertical_spacing=0.05,
+                        specs = [[{"type":"table"}, {"type":"scene","rowspan":2}],
+                                 [{"type":"table"}, None],
+                                 ])
+
+    # properties table
+    table_properties = [r"$x_{{cg}}$",
+                 r"$y_{{cg}}$",
+                 r"$L$",
+                 r"$L_e$",
+                 r"$I_{x}$",
+                 r"$I_{y}$",
+                 r"$I_{z}$",
+                 r"$S_{{x,top}}$",
+                 r"$S_{{x,bottom}}$",
+                 r"$S_{{y,right}}$",
+                 r"$S_{{y,left}}$"]
+    table_values = [r"${:.2f} \quad in$".format(weld_group.x_centroid_force),
+                    r"${:.2f} \quad in$".format(weld_group.y_centroid_force),
+                    r"${:.1f} \quad in$".format(weld_group.L_force),
+                    r"${:.1f} \quad in$".format(weld_group.Le_force),
+                    r"${:.1f} \quad in^3$".format(weld_group.Ix_force),
+                    r"${:.1f} \quad in^3$".format(weld_group.Iy_force),
+                    r"${:.1f} \quad in^3$".format(weld_group.Iz_force),
+                    r"${:.1f} \quad in^2$".format(weld_group.Sx1_force),
+                    r"${:.1f} \quad in^2$".format(weld_group.Sx2_force),
+                    r"${:.1f} \quad in^2$".format(weld_group.Sy1_force),
+                    r"${:.1f} \quad in^2$".format(weld_group.Sy2_force)]
+    property_table = go.Table(header_values = ['Parameters', 'Value'],
+                              header_line_color = "black",
+                              header_font_color = "white",
+                              header_fill_color = "#3b3b41",
+                              header_align = "center",
+                              header_font_size = 18,
+                              header_height = 34,
+                              cells_values = [table_properties, table_values],
+                              cells_line_color = "black",
+                              cells_font_color = "black",
+                              cells_fill_color = "white",
+                              cells_align = "center",
+                              cells_font_size = 22,
+                              cells_height = 34,
+                              )
+    fig.add_trace(property_table, row=1, col=1)
+
+    # applied force table
+    table_properties = [r"$V_x$",
+                        r"$V_y$",
+                        r"$V_z$",
+                        r"$M_x$",
+                        r"$M_y$",
+                        r"$M_z$"]
+    table_values = [r"${:.1f} \quad kips$".format(weld_group.Vx),
+                    r"${:.1f} \quad kips$".format(weld_group.Vy),
+                    r"${:.1f} \quad kips$".format(weld_group.Vz),
+                    r"${:.1f} \quad k.in$".format(weld_group.Mx),
+                    r"${:.1f} \quad k.in$".format(weld_group.My),
+                    r"${:.1f} \quad k.in$".format(weld_group.Mz)]
+    property_table = go.Table(header_values = ['Applied Load', 'Value'],
+                              header_line_color = "black",
+                              header_font_color = "white",
+                              header_fill_color = "#3b3b41",
+                              header_align = "center",
+                              header_font_size = 18,
+                              header_height = 34,
+                              cells_values = [table_properties, table_values],
+                              cells_line_color = "black",
+                              cells_font_color = "black",
+                              cells_fill_color = "white",
+                              cells_align = "center",
+                              cells_font_size = 22,
+                              cells_height = 34,
+                              )
+    fig.add_trace(property_table, row=2, col=1)
+
+
+    # plot orgin marker at centroid
+    x_centroid = np.asarray(weld_group.dict_welds["x_centroid"])
+    y_centroid = np.asarray(weld_group.dict_welds["y_centroid"])
+    dmax = max(x_centroid.max()-x_centroid.min(), y_centroid.max()-y_centroid.min())/1.5
+    X = go.Scatter3d(
+        x=[weld_group.x_centroid, weld_group.x_centroid + dmax/14],
+        y=[weld_group.y_centroid, weld_group.y_centroid],
+        z=[0,0],
+        mode='lines+text',
+        hoverinfo = 'skip',
+        showlegend=False,
+        line=dict(color='blue', width=5),
+        text=["","X"],
+        textposition="top center",
+        textfont=dict(
+            family="Arial",
+            size=14,
+            color="blue"))
+    fig.add_trace(X, row=1, col=2)
+    Y = go.Scatter3d(
+        x=[weld_group.x_centroid, weld_group.x_centroid],
+        y=[weld_group.y_centroid, weld_group.y_centroid + dmax/14],
+        z=[0,0],
+        mode='lines+text',
+        hoverinfo = 'skip',
+        line=dict(color='red', width=5),
+        text=["","Y"],
+        textposition="top center",
+        showlegend=False,
+        textfont=dict(
+            family="Arial",
+            size=14,
+            color="red"))
+    fig.add_trace(Y,row=1, col=2)
+    Z = go.Scatter3d(
+        x=[weld_group.x_centroid, weld_group.x_centroid],
+        y=[weld_group.y_centroid, weld_group.y_centroid],
+        z=[0, 0 + dmax/14],
+        mode='lines+text',
+        hoverinfo = 'skip',
+        line=dict(color='green', width=5),
+        text=["","Z"],
+        textposition="top center",
+        showlegend=False,
+        textfont=dict(
+            family="Arial",
+            size=14,
+            color="green"))
+    fig.add_trace(Z, row=1, col=2)
+
+    # prep colormap. Sampled into a plotly colorscale so vectors are colored by value rather than per-patch strings
+    cm = plt.get_cmap(colormap)
+    magnitude = np.asarray(weld_group.dict_welds["v_resultant"])
+    cmin = magnitude.min() if cmin == "auto" else cmin
+    cmax = magnitude.max() if cmax == "auto" else cmax
+    if math.isclose(cmax-cmin, 0):
+        cmin = 0
+    samples = np.linspace(0, 1, 256)
+    colorscale = [[t, "rgb({:.0f},{:.0f},{:.0f})".format(*rgb)] for t, rgb in zip(samples, cm(samples)[:,:3] * 255)]
+
+    # weld force vectors from patch centroid (on Z=0 plane) to centroid + scale * force
+    LENGTH_SF = scale
+    xyz0 = np.column_stack([x_centroid[shown], y_centroid[shown], np.zeros(len(shown))])
+    uvw = np.column_stack([np.asarray(weld_group.dict_welds[key])[shown] for key in ["vx_total", "vy_total", "vz_total"]])
+    resultant = magnitude[shown]
+    xyz1 = xyz0 + LENGTH_SF * uvw
+
+    # one polyline of [start, end, gap] per vector
+    lines = np.stack([xyz0, xyz1, np.full_like(xyz0, np.nan)], axis=1).reshape(-1, 3)
+    line_colors = np.repeat(resultant, 3)
+
+    # hover info is formatted by plotly from customdata
+    customdata = np.column_stack([uvw, resultant])
+
+    # prep work before plotting vectors
+    hovertemplate = '<b>coord: (%{x:.1f}, %{y:.1f}, %{z:.1f})</b><br>' +\
+        '<b>Vx</b>: %{customdata[0]:.2f} k/in<br>' +\
+        '<b>Vy</b>: %{customdata[1]:.2f} k/in<br>' +\
+        '<b>Vz</b>: %{customdata[2]:.2f} k/in<br>' +\
+        '<b>V_resultant</b>: %{customdata[3]:.2f} k/in<br><extra></extra>'
+    _cmin = magnitude.min()
+    _cmax = magnitude.max()
+    tick_interval = np.linspace(_cmin, _cmax, 9)
+    tick_interval_str = [f"{x:.2f}" for x in tick_interval]
+
+    # plot vectors
+    vector_line = go.Scatter3d(x=lines[:,0],
+                                  y=lines[:,1],
+                                  z=lines[:,2],
+                                  mode='lines',
+                                  line_width = 8,
+                                  line_color = line_colors,
+                                  line_colorscale = colorscale,
+                                  line_cmin = cmin,
+                                  line_cmax = cmax,
+                                  showlegend = False,
+                                  hoverinfo="none")
+    vector_base = go.Scatter3d(x=xyz0[:,0],
+                                  y=xyz0[:,1],
+                                  z=xyz0[:,2],
+                                  mode='markers',
+                                  marker_symbol = "square",
+                                  marker_size = 8,
+                                  showlegend = False,
+                                  hovertemplate = hovertemplate,
+                                  customdata = customdata,
+                                  hoverlabel_font_size=16,
+                                  marker_color=resultant,
+                                  marker_cmin=_cmin,
+                                  marker_cmax=_cmax,
+                                  marker_colorscale=colormap,
+                                  marker_showscale=True,
+                                  marker_colorbar=dict(title_text="k/in",
+                                                       outlinecolor="black",
+                                                       outlinewidth=2,
+                                                       tickvals=tick_interval,
+                                                       ticktext=tick_interval_str,
+                                                       xpad=40,
+                                                       ypad=40)
+                                  )
+    fig.add_trace(vector_base, row=1, col=2)
+    fig.add_trace(vector_line, row=1, col=2)
+
+    # change such that axes are in proportion.
+    fig.update_scenes(aspectmode="data")
+
+    # add title
+    fig.update_layout(title="<b>Weld Group Result Summary</b>",
+                      title_xanchor="center",
+                      title_font_size=22,
+                      title_x=0.5, 
+                      title_y=0.98,
+                      title_font_color="black")
+
+    # background color
+    fig.update_layout(paper_bgcolor="white",
+                      font_color="black")
+
+    # adjust zoom level and default camera position
+    fig.update_scenes(camera_eye=dict(x=2, y=2, z=2))
+
+    # change origin to be on the bottom left corner
+    fig.update_scenes(xaxis_autorange="reversed")
+    fig.update_scenes(yaxis_autorange="reversed")
+    fig.update_scenes(xaxis_backgroundcolor="white",
+                      yaxis_backgroundcolor="white",
+                      xaxis_gridcolor="grey",
+                      yaxis_gridcolor="grey",
+                      xaxis_gridwidth=0.5,
+                      yaxis_gridwidth=0.5,
+                      zaxis_visible=False,
+                      )
+    if show:
+        fig.show()
+    return fig
+
+
+def plot_results_3D_deprecated(weld_group, colormap="jet", cmin="auto", cmax="auto"):
+    """
+    use plotly to generate an interactive plot
+    """
+    _set_default_renderer()
+
+    # initialize a plotly figure with 2 subplots
+    fig = make_subplots(rows=2, cols=2,
+                        subplot_titles=("Weld Group Properties", "Vector Plot", "Applied Loading"),
+                        column_widths=[0.3, 0.7],
+                        row_heights=[0.65, 0.35],
+                        horizontal_spacing=0.02,
+                        vertical_spacing=0.05,
+                        specs = [[{"type":"table"}, {"type":"scene","rowspan":2}],
+                                 [{"type":"table"}, None],
+                                 ])
+
+    # properties table
+    table_properties = [r"$x_{{cg}}$",
+                 r"$y_{{cg}}$",
+                 r"$L$",
+                 r"$L_e$",
+                 r"$I_{x}$",
+                 r"$I_{y}$",
+                 r"$I_{z}$",
+                 r"$S_{{x,top}}$",
+                 r"$S_{{x,bottom}}$",
+                 r"$S_{{y,right}}$",
+                 r"$S_{{y,left}}$"]
+    table_values = [r"${:.2f} \quad in$".format(weld_group.x_centroid_force),
+                    r"${:.2f} \quad in$".format(weld_group.y_centroid_force),
+                    r"${:.1f} \quad in$".format(weld_group.L_force),
+                    r"${:.1f} \quad in$".format(weld_group.Le_force),
+                    r"${:.1f} \quad in^3$".format(weld_group.Ix_force),
+                    r"${:.1f} \quad in^3$".format(weld_group.Iy_force),
+                    r"${:.1f} \quad in^3$".format(weld_group.Iz_force),
+                    r"${:.1f} \quad in^2$".format(weld_group.Sx1_force),
+                    r"${:.1f} \quad in^2$".format(weld_group.Sx2_force),
+                    r"${:.1f} \quad in^2$".format(weld_group.Sy1_force),
+                    r"${:.1f} \quad in^2$".format(weld_group.Sy2_force)]
+    property_table = go.Table(header_values = ['Parameters', 'Value'],
+                              header_line_color = "black",
+                              header_font_color = "white",
+                              header_fill_color = "#3b3b41",
+                              header_align = "center",
+                              header_font_size = 18,
+                              header_height = 34,
+                              cells_values = [table_properties, table_values],
+                              cells_line_color = "black",
+                              cells_font_color = "black",
+                              cells_fill_color = "white",
+                              cells_align = "center",
+                              cells_font_size = 22,
+                              cells_height = 34,
+                              )
+    fig.add_trace(property_table, row=1, col=1)
+
+    # applied force table
+    table_properties = [r"$V_x$",
+                        r"$V_y$",
+                        r"$V_z$",
+                        r"$M_x$",
+                        r"$M_y$",
+                        r"$M_z$"]
+    table_values = [r"${:.1f} \quad kips$".format(weld_group.Vx),
+                    r"${:.1f} \quad kips$".format(weld_group.Vy),
+                    r"${:.1f} \quad kips$".format(weld_group.Vz),
+                    r"${:.1f} \quad k.in$".format(weld_group.Mx),
+                    r"${:.1f} \quad k.in$".format(weld_group.My),
+                    r"${:.1f} \quad k.in$".format(weld_group.Mz)]
+    property_table = go.Table(header_values = ['Applied Load', 'Value'],
+                              header_line_color = "black",
+                              header_font_color = "white",
+                              header_fill_color = "#3b3b41",
+                              header_align = "center",
+                              header_font_size = 18,
+                              header_height = 34,
+                              cells_values = [table_properties, table_values],
+                              cells_line_color = "black",
+                              cells_font_color = "black",
+                              cells_fill_color = "white",
+                              cells_align = "center",
+                              cells_font_size = 22,
+                              cells_height = 34,
+                              )
+    fig.add_trace(property_table, row=2, col=1)
+
+
+    # plot orgin marker at centroid
+    xmax = max(weld_group.dict_welds["x_centroid"])
+    xmin = min(weld_group.dict_welds["x_centroid"])
+    ymax = max(weld_group.dict_welds["y_centroid"])
+    ymin = min(weld_group.dict_welds["y_centroid"])
+    dmax = max(xmax-xmin, ymax-ymin)/1.5
+    X = go.Scatter3d(
+        x=[weld_group.x_centroid, weld_group.x_centroid + dmax/14],
+        y=[weld_group.y_centroid, weld_group.y_centroid],
+        z=[0,0],
+        mode='lines+text',
+        hoverinfo = 'skip',
+        showlegend=False,
+        line=dict(color='blue', width=5),
+        text=["","X"],
+        textposition="top center",
+        textfont=dict(
+            family="Arial",
+            size=14,
+            color="blue"))
+    fig.add_trace(X, row=1, col=2)
+    Y = go.Scatter3d(
+        x=[weld_group.x_centroid, weld_group.x_centroid],
+        y=[weld_group.y_centroid, weld_group.y_centroid + dmax/14],
+        z=[0,0],
+        mode='lines+text',
+        hoverinfo = 'skip',
+        line=dict(color='red', width=5),
+        text=["","Y"],
+        textposition="top center",
+        showlegend=False,
+        textfont=dict(
+            family="Arial",
+            size=14,
+            color="red"))
+    fig.add_trace(Y,row=1, col=2)
+    Z = go.Scatter3d(
+        x=[weld_group.x_centroid, weld_group.x_centroid],
+        y=[weld_group.y_centroid, weld_group.y_centroid],
+        z=[0, 0 + 0.75],
+        mode='lines+text',
+        hoverinfo = 'skip',
+        line=dict(color='green', width=5),
+        text=["","Z"],
+        textposition="top center",
+        showlegend=False,
+        textfont=dict(
+            family="Arial",
+            size=14,
+            color="green"))
+    fig.add_trace(Z, row=1, col=2)
+
+
+    # plot weld stress quiver contour
+    cmin = min(weld_group.df_welds["v_resultant"]) if cmin == "auto" else cmin
+    cmax = max(weld_group.df_welds["v_resultant"]) if cmax == "auto" else cmax
+    if math.isclose(cmax-cmin, 0):
+        cmin = 0
+    sizeref = 0.35 * 1/cmax # fixes arrow scaling issues
+    # need to use sizemode raw which is not available on older versions of plotly
+    custom_hover = '<b>vx</b>: %{u:.2f} k/in<br>' +\
+        '<b>vy</b>: %{v:.2f} k/in<br>' +\
+        '<b>vz</b>: %{w:.2f} k/in<br>' +\
+        '<b>vtotal</b>: %{text:.2f} k/in<br>'
+    cone_plot = go.Cone(x = weld_group.df_welds["x_centroid"],
+                        y = weld_group.df_welds["y_centroid"],
+                        z = [0] * len(weld_group.df_welds["y_centroid"]),
+                        u = weld_group.df_welds["vx_total"],
+                        v = weld_group.df_welds["vy_total"],
+                        w = weld_group.df_welds["vz_total"],
+                        text = weld_group.df_welds["v_resultant"],
+                        colorbar_title_text="(k/in)",
+                        hovertemplate = custom_hover,
+                        hoverlabel_font_size=16,
+                        colorscale=colormap,
+                        cmin=cmin,
+                        cmax=cmax,
+                        sizemode = "raw", #very new in plotly...
+                        sizeref = sizeref)
+    fig.add_trace(cone_plot, row=1, col=2)
+
+
+    # change such that axes are in proportion.
+    fig.update_scenes(aspectmode="data")
+
+    # add title
+    fig.update_layout(title="<b>Weld Group Result Summary</b>",
+                      title_xanchor="center",
+                      title_font_size=22,
+                      title_x=0.5, 
+                      title_y=0.98,
+                      title_font_color="black")
+
+    # background color
+    fig.update_layout(paper_bgcolor="white",
+                      font_color="black")
+
+    # adjust zoom level and default camera position
+    fig.update_scenes(camera_eye=dict(x=2, y=2, z=2))
+
+    # change origin to be on the bottom left corner
+    fig.update_scenes(xaxis_autorange="reversed")
+    fig.update_scenes(yaxis_autorange="reversed")
+    fig.update_scenes(xaxis_backgroundcolor="white",
+                      yaxis_backgroundcolor="white",
+                      xaxis_gridcolor="grey",
+                      yaxis_gridcolor="grey",
+                      xaxis_gridwidth=0.5,
+                      yaxis_gridwidth=0.5,
+                      zaxis_visible=False,
+                      )
+    fig.show()
+    return fig
+
+
+def _patch_polygons(weld_group, display_thickness):
+    """
+    Quadrilateral outline of every patch for plotting, calculated in one vectorized pass. Patches are offset
+    on both sides by display_thickness scaled by their throat thickness relative to the thinnest weld.
+
+    Return:
+        polygons            array:: (patches x 4 x 2) vertices [start+, start-, end-, end+]
+    """
+    x0, y0 = weld_group.patches.column("x_start"), weld_group.patches.column("y_start")
+    x1, y1 = weld_group.patches.column("x_end"), weld_group.patches.column("y_end")
+    thickness = weld_group.patches.column("thickness")
+    offset = thickness / thickness.min() * display_thickness
+
+    # perpendicular unit vector scaled by display thickness
+    length = np.hypot(x1 - x0, y1 - y0)
+    vx = (y1 - y0) / length * offset
+    vy = -(x1 - x0) / length * offset
+    return np.stack([np.column_stack([x0 + vx, y0 + vy]),
+                     np.column_stack([x0 - vx, y0 - vy]),
+                     np.column_stack([x1 - vx, y1 - vy]),
+                     np.column_stack([x1 + vx, y1 + vy])], axis=1)
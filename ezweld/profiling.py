@@ -0,0 +1,163 @@
+"""
+Optional per-stage instrumentation of WeldGroup.
+
+Attach a StageProfiler to a weld group (WeldGroup(profiler=...) or weld_group.profiler = ...) to record the wall
+time, number of patches, and array memory of every stage: discretization, geometric properties, unit load
+responses, solve, DataFrame construction, equilibrium check, and plotting. One profiler may be shared by many
+weld groups. Without a profiler each instrumented method only pays for one attribute lookup.
+
+Stages may be nested (e.g. check_equilibrium within solve), in which case the outer stage time includes the inner.
+"""
+import functools
+import logging
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager, nullcontext
+
+
+_NOT_PROFILED = nullcontext()
+
+
+def profiled(stage_name):
+    """
+    Decorator that times a WeldGroup method as a stage when the weld group has a profiler attached.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if self.profiler is None:
+                return method(self, *args, **kwargs)
+            with self.profiler.stage(stage_name, self):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def stage(weld_group, stage_name):
+    """Context manager that times a block of code as a stage when the weld group has a profiler attached"""
+    if weld_group.profiler is None:
+        return _NOT_PROFILED
+    return weld_group.profiler.stage(stage_name, weld_group)
+
+
+def array_nbytes(weld_group):
+    """bytes of patch geometry, results, unit load responses, and df_welds currently held by a weld group"""
+    nbytes = weld_group.patches.buffer().nbytes + weld_group.results.buffer().nbytes
+    for influence in [weld_group._force_influence, weld_group._stress_influence]:
+        if influence is not None:
+            nbytes += influence.nbytes
+    if weld_group.df_welds is not None:
+        nbytes += int(weld_group.df_welds.memory_usage(index=False).sum())
+    return int(nbytes)
+
+
+class StageProfiler:
+    """
+    Records wall time, patch count, and memory of instrumented WeldGroup stages.
+
+    Every completed stage produces a record:
+        {"stage": name, "depth": nesting level, "seconds": wall time, "patches": number of patches,
+         "nbytes": bytes of arrays held by the weld group, "peak_bytes": peak bytes allocated during the stage}
+    peak_bytes is None unless trace_memory=True.
+
+    Input Arguments:
+        callback        (OPTIONAL)callable:: called with every record, e.g. to forward to job metrics. Default = None
+        logger          (OPTIONAL)logging.Logger:: logger that every record is written to. Default = None
+        level           (OPTIONAL)int:: logging level. Default = logging.DEBUG
+        trace_memory    (OPTIONAL)bool:: measure peak allocation with tracemalloc (python 3.9+). Much slower. Default = False
+        max_records     (OPTIONAL)int:: number of most recent records kept. Totals in report() include every record. Default = 10000
+
+    Public Methods:
+        stage()
+        report()
+        reset()
+    """
+    def __init__(self, callback=None, logger=None, level=logging.DEBUG, trace_memory=False, max_records=10000):
+        if trace_memory and not hasattr(tracemalloc, "reset_peak"):
+            raise RuntimeError("trace_memory=True requires python 3.9 or newer")
+        self.callback = callback
+        self.logger = logger
+        self.level = level
+        self.trace_memory = trace_memory
+        self.records = deque(maxlen=max_records)
+        self._totals = {}
+        self._stack = []            # [start of traced memory, running peak of traced memory] of each open stage
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+
+    @contextmanager
+    def stage(self, name, weld_group):
+        """
+        Time the enclosed block as a stage of weld_group.
+        """
+        if self.trace_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            if self._stack:
+                self._stack[-1][1] = max(self._stack[-1][1], peak)
+            tracemalloc.reset_peak()
+            self._stack.append([current, current])
+        else:
+            self._stack.append(None)
+
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - t0
+            frame = self._stack.pop()
+            peak_bytes = None
+            if frame is not None:
+                peak = max(tracemalloc.get_traced_memory()[1], frame[1])
+                peak_bytes = peak - frame[0]
+                if self._stack:
+                    self._stack[-1][1] = max(self._stack[-1][1], peak)
+                tracemalloc.reset_peak()
+            self._record({"stage": name,
+                          "depth": len(self._stack),
+                          "seconds": seconds,
+                          "patches": len(weld_group.patches),
+                          "nbytes": array_nbytes(weld_group),
+                          "peak_bytes": peak_bytes})
+
+
+    def _record(self, record):
+        """store a record, update totals, and forward it to the callback and logger"""
+        self.records.append(record)
+        total = self._totals.setdefault(record["stage"], {"calls": 0, "seconds": 0.0, "max_seconds": 0.0,
+                                                           "patches": 0, "nbytes": 0, "peak_bytes": None})
+        total["calls"] += 1
+        total["seconds"] += record["seconds"]
+        total["max_seconds"] = max(total["max_seconds"], record["seconds"])
+        total["patches"] = max(total["patches"], record["patches"])
+        total["nbytes"] = max(total["nbytes"], record["nbytes"])
+        if record["peak_bytes"] is not None:
+            total["peak_bytes"] = max(total["peak_bytes"] or 0, record["peak_bytes"])
+
+        if self.callback is not None:
+            self.callback(record)
+        if self.logger is not None:
+            self.logger.log(self.level, "ezweld stage %s: %.3f ms, %d patches, %d bytes",
+                            record["stage"], record["seconds"] * 1000, record["patches"], record["nbytes"])
+
+
+    def report(self):
+        """
+        Totals of every stage recorded since the last reset().
+
+        Return:
+            report          dict:: {stage: {"calls", "seconds" (total), "mean_seconds", "max_seconds",
+                                "patches" (max), "nbytes" (max), "peak_bytes" (max or None)}}
+                                ordered by total time, largest first
+        """
+        report = {}
+        for name, total in sorted(self._totals.items(), key=lambda item: -item[1]["seconds"]):
+            report[name] = dict(total, mean_seconds=total["seconds"] / total["calls"])
+        return report
+
+
+    def reset(self):
+        """Discard every record and total"""
+        self.records.clear()
+        self._totals = {}
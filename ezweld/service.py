@@ -0,0 +1,348 @@
+"""
+Asyncio service that answers many small solve requests against a few common weld geometries.
+
+Concurrent requests for the same geometry (same welds and PATCH_SIZE, see geometry_hash()) that arrive within
+batch_window seconds of each other are coalesced into one multi-load solve. Solves run in a worker pool so the
+event loop never blocks, and every worker keeps its most recently used weld groups so common geometries are only
+discretized once.
+
+Requests use the connection format of ezweld.batch with a single load case:
+    {"id":      1,
+     "welds":   [{"type":"line", "start":[0,0], "end":[0,10], "thickness":0.25}, ...],
+     "loads":   {"Vy":-50, "Mx":200}  or  [Vx, Vy, Vz, Mx, My, Mz]}
+and are answered with:
+    {"id": 1, "v_max": ..., "v_max_ID": ..., "sigma_max": ..., "sigma_max_ID": ..., "equilibrium": true, "warning": null}
+or {"id": 1, "error": "..."}. "warning" holds the message if the weld group is not in its principal orientation.
+
+Command line usage:
+    python -m ezweld.service < requests.jsonl             # one JSON request per line on stdin, one answer per line on stdout
+    python -m ezweld.service --http 8080                  # POST /solve with a request or a list of requests, GET /stats
+"""
+import argparse
+import asyncio
+import functools
+import json
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from ezweld.weldgroup import WeldGroup
+from ezweld.cache import geometry_hash
+
+
+LOAD_NAMES = ["Vx", "Vy", "Vz", "Mx", "My", "Mz"]
+
+# weld groups most recently solved by this worker process, keyed by geometry hash
+_GROUPS = OrderedDict()
+_GROUPS_LOCK = threading.Lock()
+_MAX_GROUPS = 64
+
+
+class SolveService:
+    """
+    Coalesce concurrent solve requests for the same weld geometry into batched multi-load solves on a worker pool.
+
+    Input Arguments:
+        PATCH_SIZE      (OPTIONAL)float:: patch size of every weld group. Default = 0.05
+        max_workers     (OPTIONAL)int:: number of worker processes. Default = number of CPUs
+        executor        (OPTIONAL)Executor:: run solves on this executor instead of a new process pool. It is not shut
+                            down by close(). Default = None
+        batch_window    (OPTIONAL)float:: seconds to wait for more requests of the same geometry after the first.
+                            Default = 0.002
+        max_batch       (OPTIONAL)int:: solve immediately once this many requests of one geometry are waiting. Default = 1000
+        rtol            (OPTIONAL)float:: relative tolerance of the equilibrium check. None to skip. Default = 1e-3
+
+    Public Methods:
+        solve()
+        close()
+    """
+    def __init__(self, PATCH_SIZE=0.05, max_workers=None, executor=None, batch_window=0.002, max_batch=1000, rtol=1e-3):
+        self.PATCH_SIZE = PATCH_SIZE
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.rtol = rtol
+        self.requests = 0               # number of requests received
+        self.batches = 0                # number of batched solves sent to the worker pool
+        self._executor = executor if executor is not None else ProcessPoolExecutor(max_workers=max_workers)
+        self._owns_executor = executor is None
+        self._pending = {}              # geometry hash => {"welds", "loads", "futures", "timer"} waiting to be solved
+        self._running = set()           # batched solves in progress
+
+
+    async def __aenter__(self):
+        return self
+
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+
+    async def solve(self, welds, loads):
+        """
+        Solve one load case. Waits up to batch_window for other requests of the same geometry to share the solve.
+
+        Arguments:
+            welds               list:: weld primitive dictionaries (see WeldGroup.primitives)
+            loads               dict or list:: {"Vx":..., "Mz":...} (missing loads = 0) or [Vx, Vy, Vz, Mx, My, Mz]
+
+        Returns:
+            result              dict:: v_max, v_max_ID, sigma_max, sigma_max_ID, equilibrium (bool, or None if
+                                    the check is skipped), and warning (principal orientation message or None)
+        """
+        welds = _canonical_welds(welds)
+        load_vector = _load_vector(loads)
+        key = geometry_hash(welds, self.PATCH_SIZE)
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.requests += 1
+
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = {"welds": welds, "loads": [], "futures": [], "timer": loop.call_later(self.batch_window, self._flush, key)}
+            self._pending[key] = batch
+        batch["loads"].append(load_vector)
+        batch["futures"].append(future)
+        if len(batch["loads"]) >= self.max_batch:
+            batch["timer"].cancel()
+            self._flush(key)
+        return await future
+
+
+    async def close(self):
+        """Solve every waiting request, wait for solves in progress, and shut down the worker pool if it was created here"""
+        for key in list(self._pending):
+            self._pending[key]["timer"].cancel()
+            self._flush(key)
+        if self._running:
+            await asyncio.wait(self._running)
+        if self._owns_executor:
+            self._executor.shutdown()
+
+
+    def _flush(self, key):
+        """send the waiting requests of one geometry to the worker pool as a single batch"""
+        batch = self._pending.pop(key, None)
+        if batch is None:
+            return
+        self.batches += 1
+        loop = asyncio.get_running_loop()
+        task = loop.run_in_executor(self._executor, _solve_batch, batch["welds"], self.PATCH_SIZE,
+                                    np.array(batch["loads"]), self.rtol)
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+        task.add_done_callback(functools.partial(_deliver, batch["futures"]))
+
+
+def _deliver(futures, task):
+    """pass the results (or exception) of a batched solve to every request in it. Cancelled requests are skipped"""
+    error = task.exception() if not task.cancelled() else asyncio.CancelledError()
+    if error is None:
+        governing, ok, warning = task.result()
+    for i, future in enumerate(futures):
+        if future.done():
+            continue
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result({"v_max": float(governing["v_max"][i]),
+                               "v_max_ID": int(governing["v_max_ID"][i]),
+                               "sigma_max": float(governing["sigma_max"][i]),
+                               "sigma_max_ID": int(governing["sigma_max_ID"][i]),
+                               "equilibrium": None if ok is None else bool(ok[i]),
+                               "warning": warning})
+
+
+def _canonical_welds(welds):
+    """
+    Convert weld dictionaries into the primitive format of WeldGroup.primitives with float values, so equal geometry
+    always has the same hash. Raises ValueError for malformed welds.
+    """
+    primitives = []
+    try:
+        for w in welds:
+            if w["type"] == "line":
+                primitives.append({"type": "line", "start": [float(w["start"][0]), float(w["start"][1])],
+                                   "end": [float(w["end"][0]), float(w["end"][1])], "thickness": float(w["thickness"])})
+            elif w["type"] == "arc":
+                primitives.append({"type": "arc", "center": [float(w["center"][0]), float(w["center"][1])],
+                                   "radius": float(w["radius"]), "start_angle": float(w["start_angle"]),
+                                   "end_angle": float(w["end_angle"]), "thickness": float(w["thickness"])})
+            else:
+                raise ValueError(f'Unrecognized weld type {w["type"]}. Expected "line" or "arc"')
+    except (KeyError, IndexError, TypeError) as e:
+        raise ValueError(f"Malformed weld definition: {type(e).__name__}: {e}") from e
+    if not primitives:
+        raise ValueError("At least one weld is required")
+    return primitives
+
+
+def _load_vector(loads):
+    """Convert {"Vx":..., "Mz":...} or [Vx, Vy, Vz, Mx, My, Mz] into a list of 6 floats"""
+    if isinstance(loads, dict):
+        unknown = [k for k in loads if k not in LOAD_NAMES]
+        if unknown:
+            raise ValueError(f"Unrecognized loads {unknown}. Expected any of {LOAD_NAMES}")
+        return [float(loads.get(k, 0)) for k in LOAD_NAMES]
+    load_vector = [float(v) for v in loads]
+    if len(load_vector) != 6:
+        raise ValueError(f"Expected 6 loads [Vx, Vy, Vz, Mx, My, Mz]. Got {len(load_vector)}")
+    return load_vector
+
+
+def _weld_group(welds, PATCH_SIZE):
+    """Return the weld group of a geometry, reusing one built earlier by this worker if available"""
+    key = geometry_hash(welds, PATCH_SIZE)
+    with _GROUPS_LOCK:
+        if key in _GROUPS:
+            _GROUPS.move_to_end(key)
+            return _GROUPS[key]
+
+    weld_group = WeldGroup(PATCH_SIZE=PATCH_SIZE)
+    for w in welds:
+        if w["type"] == "line":
+            weld_group.add_line(w["start"], w["end"], w["thickness"])
+        else:
+            weld_group.add_arc(w["center"], w["radius"], w["start_angle"], w["end_angle"], w["thickness"])
+    
+    # calculate every lazily cached quantity before sharing, so threads of a thread pool executor only read the weld group
+    weld_group._unit_load_response()
+    weld_group._reaction_matrix()
+    weld_group._chord_error()
+
+    with _GROUPS_LOCK:
+        _GROUPS[key] = weld_group
+        while len(_GROUPS) > _MAX_GROUPS:
+            _GROUPS.popitem(last=False)
+    return weld_group
+
+
+def _solve_batch(welds, PATCH_SIZE, load_matrix, rtol):
+    """
+    Solve every load combination of one geometry. Runs in a worker. The principal orientation warning is returned
+    with the results rather than issued by the worker. Equilibrium is checked per load combination rather than
+    failing the whole batch.
+    """
+    weld_group = _weld_group(welds, PATCH_SIZE)
+    governing, _ = weld_group._governing_results(load_matrix, rtol=None, warn=False)
+    ok = None
+    if rtol is not None:
+        sums = load_matrix @ weld_group._reaction_matrix().T
+        ok = weld_group.check_equilibrium(sums, load_matrix, rtol, raise_error=False)["ok"]
+    return governing, ok, weld_group._principal_warning()
+
+
+async def _answer(service, request):
+    """answer one request dictionary. Errors are reported in the answer rather than raised"""
+    answer = {"id": request.get("id") if isinstance(request, dict) else None}
+    try:
+        answer.update(await service.solve(request["welds"], request["loads"]))
+    except Exception as e:
+        answer["error"] = f"{type(e).__name__}: {e}"
+    return answer
+
+
+async def serve_stdin(service):
+    """
+    Read one JSON request per line from stdin and write each answer to stdout as one JSON line as soon as it is
+    solved, so answers may be out of order. Returns at the end of input once every request is answered.
+    """
+    loop = asyncio.get_running_loop()
+    tasks = set()
+
+    async def answer_line(line):
+        try:
+            answer = await _answer(service, json.loads(line))
+        except json.JSONDecodeError as e:
+            answer = {"id": None, "error": f"JSONDecodeError: {e}"}
+        sys.stdout.write(json.dumps(answer) + "\n")
+        sys.stdout.flush()
+
+    while True:
+        line = await loop.run_in_executor(None, sys.stdin.readline)
+        if not line:
+            break
+        if line.strip():
+            task = asyncio.ensure_future(answer_line(line))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+    if tasks:
+        await asyncio.wait(tasks)
+
+
+async def serve_http(service, host="127.0.0.1", port=8080):
+    """
+    Minimal HTTP/1.1 front end. POST /solve accepts a request or a list of requests and returns the answer(s).
+    GET /stats returns the number of requests and batched solves. Runs until cancelled.
+    """
+    async def handle(reader, writer):
+        try:
+            method, path, _ = (await reader.readline()).decode("latin-1").split(" ", 2)
+            length = 0
+            while True:
+                header = (await reader.readline()).decode("latin-1").strip()
+                if not header:
+                    break
+                name, _, value = header.partition(":")
+                if name.strip().lower() == "content-length":
+                    length = int(value)
+            body = await reader.readexactly(length) if length else b""
+
+            if method == "POST" and path == "/solve":
+                try:
+                    payload = json.loads(body)
+                except json.JSONDecodeError as e:
+                    status, answer = "400 Bad Request", {"error": f"JSONDecodeError: {e}"}
+                else:
+                    status = "200 OK"
+                    if isinstance(payload, list):
+                        answer = list(await asyncio.gather(*[_answer(service, r) for r in payload]))
+                    else:
+                        answer = await _answer(service, payload)
+            elif method == "GET" and path == "/stats":
+                status, answer = "200 OK", {"requests": service.requests, "batches": service.batches}
+            else:
+                status, answer = "404 Not Found", {"error": f"{method} {path} not found"}
+        except (ValueError, asyncio.IncompleteReadError) as e:
+            status, answer = "400 Bad Request", {"error": f"Malformed HTTP request: {e}"}
+
+        content = json.dumps(answer).encode()
+        writer.write(f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\nContent-Length: {len(content)}\r\n"
+                     f"Connection: close\r\n\r\n".encode() + content)
+        await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(handle, host, port)
+    print(f"Serving weld checks on http://{host}:{port}/solve", file=sys.stderr)
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve weld group solves, coalescing requests of the same geometry")
+    parser.add_argument("--http", type=int, default=None, metavar="PORT", help="serve HTTP on this port instead of stdin")
+    parser.add_argument("--host", default="127.0.0.1", help="HTTP host. Default = 127.0.0.1")
+    parser.add_argument("--workers", type=int, default=None, help="number of worker processes. Default = number of CPUs")
+    parser.add_argument("--patch-size", type=float, default=0.05, help="weld patch size. Default = 0.05")
+    parser.add_argument("--batch-window", type=float, default=2.0,
+                        help="milliseconds to wait for more requests of the same geometry. Default = 2")
+    parser.add_argument("--rtol", type=float, default=1e-3, help="relative tolerance of the equilibrium check. Default = 1e-3")
+    args = parser.parse_args()
+
+    async def run():
+        async with SolveService(PATCH_SIZE=args.patch_size, max_workers=args.workers,
+                                batch_window=args.batch_window / 1000, rtol=args.rtol) as service:
+            if args.http is None:
+                await serve_stdin(service)
+                print(f"Answered {service.requests} requests with {service.batches} batched solves", file=sys.stderr)
+            else:
+                await serve_http(service, args.host, args.http)
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class WeldSummary:
+    """
+    Governing results returned by WeldGroup.solve(results="summary"). Immutable and holds no per-patch data.
+
+    Attributes:
+        v_max           float:: maximum resultant force per unit length (k/in)
+        v_max_ID        int:: patch index where v_max occurs
+        v_max_x         float:: x coordinate of the patch centroid where v_max occurs
+        v_max_y         float:: y coordinate of the patch centroid where v_max occurs
+        sigma_max       float:: maximum von Mises stress (ksi)
+        sigma_max_ID    int:: patch index where sigma_max occurs
+        sigma_max_x     float:: x coordinate of the patch centroid where sigma_max occurs
+        sigma_max_y     float:: y coordinate of the patch centroid where sigma_max occurs
+        residuals       tuple:: equilibrium residuals (Fx, Fy, Fz, Mx, My, Mz) = applied load + sum of weld reactions.
+                                None if the equilibrium check was skipped
+    """
+    v_max: float
+    v_max_ID: int
+    v_max_x: float
+    v_max_y: float
+    sigma_max: float
+    sigma_max_ID: int
+    sigma_max_x: float
+    sigma_max_y: float
+    residuals: tuple
@@ -1,14 +1,16 @@
-import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-import matplotlib.colors as mcolors
-import matplotlib.cm as mcm
 import math
-import plotly.graph_objects as go
-import plotly.io as pio
-from plotly.subplots import make_subplots
-pio.renderers.default = "browser"
+import json
+import os
+import sys
+import warnings
+from ezweld import geometry
+from ezweld.patchtable import PatchTable, ResultTable
+from ezweld.summary import WeldSummary
+from ezweld.cache import geometry_hash
+from ezweld.profiling import profiled, stage
+
+# pandas is imported on first use and plotting lives in ezweld.plotting so the compute core only requires numpy
 
 
 class WeldGroup:
@@ -17,19 +19,47 @@ class WeldGroup:
     
     Input Arguments:
         PATCH_SIZE      (OPTIONAL)float:: how fine to discretize weld fiber. Default = 0.05 inches       
+        compact         (OPTIONAL)bool:: store patches and results as float32, calculate derived patch geometry on
+                            request, and do not cache unit load responses. Use with solve(results="summary") for
+                            very large weld groups. Default = False
+        cache           (OPTIONAL)SectionCache:: shared cache of section properties and unit load responses keyed by
+                            geometry_hash(). Weld groups with identical geometry reuse each other's results. Not used
+                            in compact mode. Default = None
+        profiler        (OPTIONAL)StageProfiler:: records wall time, patch count, and memory of each stage
+                            (discretization, properties, solve, dataframe, equilibrium check, plotting). Default = None
         
     Public Methods:
         add_line()
+        add_lines()
         add_rectangle()
         add_circle()
+        add_arc()
         rotate()
+        translate()
+        transform()
+        geometry_hash()
         solve()
+        solve_many()
+        solve_adaptive()
+        max_stress()
+        size_welds()
+        save()
+        load()
         preview()
         plot_results()
         plot_results_3D()
     """
-    def __init__(self, PATCH_SIZE = 0.05):
+    # geometric properties calculated by update_geometric_properties()
+    SECTION_PROPERTIES = ["x_centroid", "y_centroid", "A", "Ix", "Iy", "Iz", "Ixy", "theta_p", "Sx1", "Sx2", "Sy1", "Sy2",
+                          "x_centroid_force", "y_centroid_force", "L_force", "Le_force", "Ix_force", "Iy_force", "Iz_force",
+                          "Ixy_force", "theta_p_force", "Sx1_force", "Sx2_force", "Sy1_force", "Sy2_force"]
+    
+    def __init__(self, PATCH_SIZE = 0.05, compact = False, cache = None, profiler = None):
         self.PATCH_SIZE = PATCH_SIZE    # how fine to discretize weld patches
+        self.compact = compact          # float32 storage with derived patch geometry calculated on request
+        self.cache = cache              # SectionCache shared between weld groups with identical geometry
+        self.profiler = profiler        # StageProfiler recording the time of each stage. None to disable
+        self._dtype = np.float32 if compact else np.float64
         
         # applied force
         self.Vx = None                  # applied shear horizontal X
@@ -68,8 +98,25 @@ class WeldGroup:
         self.Sy1_force = None           # SAME AS ABOVE but with one length dimension less
         self.Sy2_force = None           # SAME AS ABOVE but with one length dimension less
         
+        # every add_line() or add_circle() call is also kept as an exact primitive (line segment or arc).
+        # geometric properties are calculated in closed-form from these rather than from the discretized patches
+        #   line: {"type":"line", "start":[x,y], "end":[x,y], "thickness":t}
+        #   arc:  {"type":"arc", "center":[x,y], "radius":r, "start_angle":deg, "end_angle":deg, "thickness":t}
+        self.primitives = []
+        
+        # running sums of the primitives above. Updated as welds are added so geometric properties are O(1)
+        # effective-length (unit force) sums are the area sums divided by t_min so they are not stored separately
+        self._moment_sums = np.zeros(6)                 # area-weighted [ΣA, ΣAx, ΣAy, ΣAx², ΣAy², ΣAxy] about _moment_origin
+        self._moment_origin = np.zeros(2)               # reference point near the welds. Set when the first welds are added
+        self._length_sum = 0.0                          # total weld length ΣL
+        self._t_min = math.inf                          # minimum throat thickness
+        self._bounds = np.array([math.inf, -math.inf, math.inf, -math.inf])    # [x_min, x_max, y_min, y_max]
+        
         # weld group could contain multiple weld lines. Each weld line could in turn contain many small weld patches (discretization)
-        # the dict below stores every patch of weld in our weld group
+        # patch geometry is stored in a growable array-backed table. See PatchTable.COLUMNS
+        self.patches = PatchTable(dtype=self._dtype, compact=compact)
+        
+        # the dict below stores every patch of weld in our weld group. Geometry entries are views into self.patches
         self.dict_welds = {"x_centroid":[],              # x coordinate of centroid of patch
                            "y_centroid":[],              # y coordinate of centroid of patch
                            "x_start":[],                 # x coordinate of start node
@@ -117,9 +164,56 @@ class WeldGroup:
         self.v_max = None                               # maximum shear force within the weld group
         self.v_max_ID = None                            # the patch ID (or index) where maximum shear force occurs
         
+        # per-patch results of solve() are stored separately from geometry and reused in place. See ResultTable.COLUMNS
+        self.results = ResultTable(dtype=self._dtype)
+        
         # the dict above is converted into a dataframe for return
         self.df_welds = None
         
+        # convergence history of solve_adaptive()
+        self.df_refinement = None
+        
+        # unit load influence tensors (patches x 6 x 3). Cached until geometry changes. See _unit_load_response()
+        self._force_influence = None
+        self._stress_influence = None
+        
+        # (6 x 6) summed weld reactions per unit load. Cached until geometry changes. See _reaction_matrix()
+        self._reactions = None
+        
+        # (6 x 6) error of the summed reactions from approximating arcs by straight patches. See _chord_error()
+        self._chord_errors = None
+        
+        # True when the geometric properties above reflect the current weld geometry
+        self._properties_current = False
+        
+        # True once transform() or solve_adaptive() has changed the mesh so it is no longer the uniform PATCH_SIZE
+        # discretization of the primitives. Such meshes are not cached
+        self._custom_mesh = False
+        
+    
+    def __getstate__(self):
+        """
+        Pickle only the solver state so weld groups are cheap to send to worker processes. Array entries of dict_welds
+        are views into patches and results, so they are re-created on unpickling rather than copied. Unit load
+        responses are recalculated when needed. The section cache, profiler, df_welds, and df_refinement are not pickled;
+        use pd.DataFrame(weld_group.dict_welds) if a dataframe is needed.
+        """
+        state = self.__dict__.copy()
+        state["dict_welds"] = {k: [] if isinstance(v, np.ndarray) else v for k, v in self.dict_welds.items()}
+        state["_dict_welds_arrays"] = [k for k, v in self.dict_welds.items() if isinstance(v, np.ndarray)]
+        for k in ["cache", "profiler", "df_welds", "df_refinement", "_force_influence", "_stress_influence", "_reactions", "_chord_errors"]:
+            state[k] = None
+        return state
+    
+    
+    def __setstate__(self, state):
+        arrays = state.pop("_dict_welds_arrays")
+        self.__dict__.update(state)
+        if arrays:
+            self._sync_dict_welds(force="length_effective" in arrays)
+        if "v_resultant" in arrays:
+            self.dict_welds.update(self.results.as_dict())
+        
     
     def add_rectangle(self, xo, yo, width, height, thickness):
         """
@@ -153,23 +247,40 @@ class WeldGroup:
             diameter                float:: circle center diameter
             thickness               float:: weld throat thickness
         """
-        # calculate circumference to determine number of segments
-        circumference = diameter * math.pi
-        segments = int(circumference // self.PATCH_SIZE)
-        
-        # divide into angle increments from 0 to 360
-        theta_list = np.linspace(0,360,segments+1)
-        theta_list = [x*math.pi/180 for x in theta_list]
-        
-        # get x and y coordinate with equation of circle
-        x_list = [xo+diameter/2*math.cos(theta) for theta in theta_list]
-        y_list = [yo+diameter/2*math.sin(theta) for theta in theta_list]
+        self.add_arc(center=[xo, yo], radius=diameter/2, start_angle=0, end_angle=360, thickness=thickness)
+    
+    
+    def add_arc(self, center, radius, start_angle, end_angle, thickness):
+        """
+        Add a circular arc weld drawn counter-clockwise from start_angle to end_angle.
         
-        # draw segments
-        for i in range(len(x_list)-1):
-            pt1 = [x_list[i], y_list[i]]
-            pt2 = [x_list[i+1], y_list[i+1]]
-            self.add_line(start=pt1, end=pt2, thickness=thickness)
+        Arguments:
+            center                  list:: [x, y] coordinate of arc center
+            radius                  float:: arc radius
+            start_angle             float:: start angle in DEGREES measured counter-clockwise from +X axis
+            end_angle               float:: end angle in DEGREES. Must be greater than start_angle and within 360 degrees of it
+            thickness               float:: weld throat thickness
+        """
+        sweep = end_angle - start_angle
+        if sweep <= 0 or sweep > 360:
+            raise ValueError(f"Arc must sweep counter-clockwise between 0 and 360 degrees. Got {start_angle} to {end_angle}")
+        
+        # calculate arc length to determine number of segments
+        arc_length = radius * math.radians(sweep)
+        segments = max(int(arc_length // self.PATCH_SIZE), 1)
+        
+        # end points of every chord with the equation of circle
+        theta = np.radians(np.linspace(start_angle, end_angle, segments+1))
+        x = center[0] + radius * np.cos(theta)
+        y = center[1] + radius * np.sin(theta)
+        points = np.column_stack([x, y])
+        
+        # draw all segments in one call
+        self._add_patches(starts=points[:-1], ends=points[1:], thickness=np.full(segments, float(thickness)))
+        
+        # store exact primitive for geometric property calculation
+        self._store_primitives([{"type":"arc", "center":[float(center[0]), float(center[1])], "radius":float(radius),
+                                 "start_angle":float(start_angle), "end_angle":float(end_angle), "thickness":float(thickness)}])
     
     
     def add_line(self, start, end, thickness):
@@ -184,106 +295,224 @@ class WeldGroup:
         Return:
             None
         """
+        self._add_patches(starts=[start], ends=[end], thickness=[thickness])
+        
+        # store exact primitive for geometric property calculation
+        self._store_primitives([{"type":"line", "start":[float(start[0]), float(start[1])],
+                                 "end":[float(end[0]), float(end[1])], "thickness":float(thickness)}])
+    
+    
+    def add_lines(self, starts, ends, thickness):
+        """
+        Add many weld strips to the weld group in one call. Discretization is vectorized over all lines.
+        
+        Arguments:
+            starts          array:: (N x 2) [x, y] coordinates of first points
+            ends            array:: (N x 2) [x, y] coordinates of second points
+            thickness       float or array:: weld throat thickness. Either one value for all lines or one value per line
+
+        Return:
+            None
+        """
+        starts = np.asarray(starts, dtype=float).reshape(-1, 2)
+        ends = np.asarray(ends, dtype=float).reshape(-1, 2)
+        if len(starts) != len(ends):
+            raise ValueError(f"starts and ends must have the same number of points. Got {len(starts)} and {len(ends)}")
+        thickness = np.broadcast_to(np.asarray(thickness, dtype=float), (len(starts),))
+        
+        # nothing to add
+        if len(starts) == 0:
+            return
+        
+        self._add_patches(starts=starts, ends=ends, thickness=thickness)
+        
+        # store exact primitive for geometric property calculation
+        self._store_primitives([{"type":"line", "start":start, "end":end, "thickness":t}
+                                for start, end, t in zip(starts.tolist(), ends.tolist(), thickness.tolist())])
+        
+        
+    @profiled("discretize")
+    def _add_patches(self, starts, ends, thickness):
+        """
+        Discretize straight weld strips into patches of size PATCH_SIZE. Private method called by add_line(), add_lines(),
+        and add_arc().
+        
+        Arguments:
+            starts          array:: (N x 2) [x, y] coordinates of first points
+            ends            array:: (N x 2) [x, y] coordinates of second points
+            thickness       array:: (N) weld throat thickness of each line
+        """
         # convert into numpy arrays
-        start = np.array(start)
-        end = np.array(end)
-        position_vector = end-start
-        
-        # calculate number of segments
-        length_line = np.linalg.norm(position_vector)
-        segments = int(length_line // self.PATCH_SIZE) if length_line > self.PATCH_SIZE else 1
-        length_segments = length_line / (segments)
-        
-        # discretize into N segments (N+1 end points)
-        alpha = np.linspace(0, 1, segments+1)
-        x_ends = start[0] + alpha * position_vector[0]
-        y_ends = start[1] + alpha * position_vector[1]
-        x_center = [(x_ends[i] + x_ends[i+1]) / 2 for i in range(len(x_ends)-1)]
-        y_center = [(y_ends[i] + y_ends[i+1]) / 2 for i in range(len(y_ends)-1)]
-        
-        # add to dictionary storing discretization
-        self.dict_welds["x_centroid"] = self.dict_welds["x_centroid"] + list(x_center)
-        self.dict_welds["y_centroid"] = self.dict_welds["y_centroid"] + list(y_center)
-        self.dict_welds["x_start"] = self.dict_welds["x_start"] + list(x_ends[:-1])
-        self.dict_welds["y_start"] = self.dict_welds["y_start"] + list(y_ends[:-1])
-        self.dict_welds["x_end"] = self.dict_welds["x_end"] + list(x_ends[1:])
-        self.dict_welds["y_end"] = self.dict_welds["y_end"] + list(y_ends[1:])
-        self.dict_welds["length"] = self.dict_welds["length"] + [length_segments] * segments
-        self.dict_welds["thickness"] = self.dict_welds["thickness"] + [thickness] * segments
-        self.dict_welds["area"] = self.dict_welds["area"] + [thickness * length_segments] * segments
+        starts = np.asarray(starts, dtype=float).reshape(-1, 2)
+        ends = np.asarray(ends, dtype=float).reshape(-1, 2)
+        thickness = np.asarray(thickness, dtype=float)
+        position_vector = ends - starts
+        
+        # calculate number of segments of each line
+        length_line = np.hypot(position_vector[:,0], position_vector[:,1])
+        segments = np.where(length_line > self.PATCH_SIZE, length_line // self.PATCH_SIZE, 1).astype(int)
+        length_segments = length_line / segments
+        
+        # discretize each line into N segments (N+1 end points). k is the segment number within its own line
+        line_index = np.repeat(np.arange(len(segments)), segments)
+        k = np.arange(segments.sum()) - np.repeat(np.cumsum(segments) - segments, segments)
+        alpha_start = k / segments[line_index]
+        alpha_end = (k + 1) / segments[line_index]
+        x_start = starts[line_index,0] + alpha_start * position_vector[line_index,0]
+        y_start = starts[line_index,1] + alpha_start * position_vector[line_index,1]
+        x_end = starts[line_index,0] + alpha_end * position_vector[line_index,0]
+        y_end = starts[line_index,1] + alpha_end * position_vector[line_index,1]
+        
+        # add to patch table storing discretization. Compact tables derive the remaining columns on request
+        columns = dict(x_start = x_start,
+                       y_start = y_start,
+                       x_end = x_end,
+                       y_end = y_end,
+                       thickness = thickness[line_index])
+        if not self.compact:
+            columns.update(x_centroid = (x_start + x_end) / 2,
+                           y_centroid = (y_start + y_end) / 2,
+                           length = length_segments[line_index],
+                           area = (thickness * length_segments)[line_index])
+        self.patches.append(**columns)
+        self._sync_dict_welds()
+        self._geometry_changed()
         
         
     def rotate(self, angle):
-        """rotate all meshes by a user-specified angle in DEGREES counter-clockwise"""
+        """
+        Rotate all welds by a user-specified angle in DEGREES counter-clockwise about the origin.
+        
+        Coordinates are transformed with a single vectorized matrix product and the moment of inertia is
+        rotated via Mohr's transformation rather than recalculated. See transform().
+        """
         # rotation matrix
         rotation_rad = angle * math.pi / 180
         T = np.array([
             [math.cos(rotation_rad), -math.sin(rotation_rad)],
             [math.sin(rotation_rad), math.cos(rotation_rad)]
             ])
+        self.transform(T)
         
-        # apply to each patch
-        x_centroid_new = []
-        y_centroid_new = []
-        x_start_new = []
-        x_end_new = []
-        y_start_new = []
-        y_end_new = []
-        for i in range(len(self.dict_welds["x_centroid"])):
-            center = np.array([self.dict_welds["x_centroid"][i], self.dict_welds["y_centroid"][i]])
-            start = np.array([self.dict_welds["x_start"][i], self.dict_welds["y_start"][i]])
-            end = np.array([self.dict_welds["x_end"][i], self.dict_welds["y_end"][i]])
-            
-            center_r = T @ center
-            start_r = T @ start
-            end_r = T @ end
-            
-            x_centroid_new.append(center_r[0])
-            y_centroid_new.append(center_r[1])
-            x_start_new.append(start_r[0])
-            x_end_new.append(end_r[0])
-            y_start_new.append(start_r[1])
-            y_end_new.append(end_r[1])
         
-        # override coordinate information
-        self.dict_welds["x_centroid"] = x_centroid_new
-        self.dict_welds["y_centroid"] = y_centroid_new
-        self.dict_welds["x_start"] = x_start_new
-        self.dict_welds["y_start"] = y_start_new
-        self.dict_welds["x_end"] = x_end_new
-        self.dict_welds["y_end"] = y_end_new
+    def translate(self, dx, dy):
+        """
+        Move all welds by (dx, dy).
+        """
+        self.transform(np.eye(2), offset=[dx, dy])
+        
+        
+    @profiled("transform")
+    def transform(self, matrix, offset=(0, 0)):
+        """
+        Apply an affine transformation x' = matrix @ x + offset to all welds.
         
-        # re-calculate geometric properties
-        self.update_geometric_properties() 
+        For rigid transformations (rotation, reflection, translation) the running moment sums are transformed as a
+        tensor (Mohr's transformation about the origin plus parallel axis shift). Otherwise they are rebuilt from primitives.
         
+        Arguments:
+            matrix                  array:: (2 x 2) transformation matrix. Arcs only accept rotation, reflection, and uniform scaling
+            offset                  (OPTIONAL) list:: [dx, dy] translation applied after the matrix. Default = (0, 0)
+        """
+        matrix = np.asarray(matrix, dtype=float)
+        offset = np.asarray(offset, dtype=float)
+        
+        # EXCEPTION: patches memory-mapped read-only by load()
+        if not self.patches.buffer().flags.writeable:
+            raise ValueError('Weld patches are read-only. Use WeldGroup.load(path, mmap_mode="c") or mmap_mode=None to move welds')
         
+        # transform exact primitives first so invalid transformations of arcs raise before anything is modified
+        self.primitives = [geometry.transform_primitive(p, matrix, offset) for p in self.primitives]
+        
+        # transform all patch coordinates as one (2 x 2) @ (2 x 3N) operation
+        N = len(self.patches)
+        coordinates = np.vstack([
+            np.concatenate([self.patches.column("x_start"), self.patches.column("x_end"), self.patches.column("x_centroid")]),
+            np.concatenate([self.patches.column("y_start"), self.patches.column("y_end"), self.patches.column("y_centroid")]),
+            ])
+        coordinates = matrix @ coordinates + offset[:, None]
+        self.patches.column("x_start")[:] = coordinates[0, :N]
+        self.patches.column("x_end")[:] = coordinates[0, N:2*N]
+        self.patches.column("x_centroid")[:] = coordinates[0, 2*N:]
+        self.patches.column("y_start")[:] = coordinates[1, :N]
+        self.patches.column("y_end")[:] = coordinates[1, N:2*N]
+        self.patches.column("y_centroid")[:] = coordinates[1, 2*N:]
+        
+        # patch lengths only change if the transformation is not rigid
+        rigid = np.allclose(matrix.T @ matrix, np.eye(2))
+        if not rigid:
+            length = np.hypot(coordinates[0, N:2*N] - coordinates[0, :N], coordinates[1, N:2*N] - coordinates[1, :N])
+            self.patches.column("length")[:] = length
+            self.patches.column("area")[:] = length * self.patches.column("thickness")
+        
+        # running moment sums. The reference point moves with the welds, so relative to it x' - r' = M(x - r). Weights
+        # (area) are unchanged by a rigid transformation so Σx'x'ᵀ = M(Σxxᵀ)Mᵀ and Σx' = M(Σx)
+        self._moment_origin = matrix @ self._moment_origin + offset
+        moments, bounds = geometry.moments_and_bounds(self.primitives, self._moment_origin)
+        if rigid:
+            A, xA, yA, xxA, yyA, xyA = self._moment_sums
+            first = matrix @ np.array([xA, yA])
+            second = matrix @ np.array([[xxA, xyA], [xyA, yyA]]) @ matrix.T
+            self._moment_sums = np.array([A, first[0], first[1], second[0,0], second[1,1], second[0,1]])
+        else:
+            thickness = np.array([p["thickness"] for p in self.primitives], dtype=float)
+            self._moment_sums = thickness @ moments
+            self._length_sum = moments[:,0].sum()
+        self._bounds = np.array([bounds[:,0].min(), bounds[:,1].max(), bounds[:,2].min(), bounds[:,3].max()])
+        self._geometry_changed()
+        
+        # transformed patches may differ from a fresh discretization of the transformed primitives (e.g. number of
+        # patches per line after scaling) so they can no longer share cached unit load responses
+        self._custom_mesh = True
+        
+        # re-calculate geometric properties. O(1) from the running sums above
+        self.update_geometric_properties()
+        
+        
+    def geometry_hash(self):
+        """
+        Content hash of the weld primitives and PATCH_SIZE. Weld groups with the same hash have identical section
+        properties. Their patches are identical unless either weld group was transformed or adaptively refined.
+        
+        Returns:
+            key                 str:: hexadecimal SHA-256 digest
+        """
+        return geometry_hash(self.primitives, self.PATCH_SIZE)
+    
+    
+    @profiled("update_geometric_properties")
     def update_geometric_properties(self):
         """
         Calculate geometric properties of weld group. Private method called by solve() or preview().
+        
+        Properties are calculated in closed-form from running moment sums of the exact weld primitives (lines and arcs),
+        which are updated as welds are added or moved. This method is therefore O(1) and does not depend on PATCH_SIZE.
         """
         # calculate widths and depths
-        all_x = self.dict_welds["x_centroid"] + self.dict_welds["x_start"] + self.dict_welds["x_end"]
-        all_y = self.dict_welds["y_centroid"] + self.dict_welds["y_start"] + self.dict_welds["y_end"]
+        x_min, x_max, y_min, y_max = self._bounds
         
         ################ STRESS CONVENTION #################
-        # centroid
-        xA = sum([x*A for x,A in zip(self.dict_welds["x_centroid"],self.dict_welds["area"])])
-        yA = sum([y*A for y,A in zip(self.dict_welds["y_centroid"],self.dict_welds["area"])])
-        self.A = sum(self.dict_welds["area"])
-        self.x_centroid = xA / self.A
-        self.y_centroid = yA / self.A
-        
-        # moment of inertia
-        self.Ix = sum([ A * (y - self.y_centroid)**2 for y,A in zip(self.dict_welds["y_centroid"],self.dict_welds["area"]) ])
-        self.Iy = sum([ A * (x - self.x_centroid)**2 for x,A in zip(self.dict_welds["x_centroid"],self.dict_welds["area"]) ])
-        self.Ixy = sum([ A * (y - self.y_centroid) * (x - self.x_centroid) for x,y,A in zip(self.dict_welds["x_centroid"],self.dict_welds["y_centroid"],self.dict_welds["area"]) ])
+        # area-weighted sums [A, ΣAx, ΣAy, ΣAx², ΣAy², ΣAxy] about a reference point near the welds
+        A, xA, yA, xxA, yyA, xyA = self._moment_sums
+        
+        # centroid relative to the reference point, then in global coordinates
+        self.A = A
+        dx_centroid = xA / self.A
+        dy_centroid = yA / self.A
+        self.x_centroid = self._moment_origin[0] + dx_centroid
+        self.y_centroid = self._moment_origin[1] + dy_centroid
+        
+        # moment of inertia (parallel axis theorem to shift from reference point to centroid)
+        self.Ix = yyA - self.A * dy_centroid**2
+        self.Iy = xxA - self.A * dx_centroid**2
+        self.Ixy = xyA - self.A * dx_centroid * dy_centroid
         self.Iz = self.Ix + self.Iy
         
         # section modulus
-        self.Sx1 = self.Ix / abs(max(all_y) - self.y_centroid)
-        self.Sx2 = self.Ix / abs(min(all_y) - self.y_centroid)
-        self.Sy1 = self.Iy / abs(max(all_x) - self.x_centroid)
-        self.Sy2 = self.Iy / abs(min(all_x) - self.x_centroid)
+        self.Sx1 = self.Ix / abs(y_max - self.y_centroid)
+        self.Sx2 = self.Ix / abs(y_min - self.y_centroid)
+        self.Sy1 = self.Iy / abs(x_max - self.x_centroid)
+        self.Sy2 = self.Iy / abs(x_min - self.x_centroid)
         
         # principal axes via Mohr's circle
         if math.isclose(self.Ixy, 0, abs_tol=1e-6):
@@ -297,31 +526,26 @@ class WeldGroup:
 
         ################ UNIT FORCE CONVENTION #################
         # modify length to account for variable thickness. Proportioned based on min weld thickness
-        t_min = min(self.dict_welds["thickness"])
-        modified_length = [t/t_min * L for t,L in zip(self.dict_welds["thickness"], self.dict_welds["length"])]
-        self.dict_welds["length_effective"] = modified_length
-        
-        # total lengths and effective length
-        self.L_force = sum(self.dict_welds["length"])
-        self.Le_force = sum(self.dict_welds["length_effective"])
+        # effective length is therefore area / t_min and every property below is the stress convention divided by t_min
+        t_min = self._t_min
+        self.L_force = self._length_sum
+        self.Le_force = self.A / t_min
         
         # centroid
-        xL = sum([x*L for x,L in zip(self.dict_welds["x_centroid"],modified_length)])
-        yL = sum([y*L for y,L in zip(self.dict_welds["y_centroid"],modified_length)])
-        self.x_centroid_force = xL / self.Le_force
-        self.y_centroid_force = yL / self.Le_force
+        self.x_centroid_force = self.x_centroid
+        self.y_centroid_force = self.y_centroid
         
         # moment of inertia
-        self.Ix_force = sum([ L * (y - self.y_centroid)**2 for y,L in zip(self.dict_welds["y_centroid"],modified_length) ])
-        self.Iy_force = sum([ L * (x - self.x_centroid)**2 for x,L in zip(self.dict_welds["x_centroid"],modified_length) ])
-        self.Ixy_force = sum([ L * (y - self.y_centroid) * (x - self.x_centroid) for x,y,L in zip(self.dict_welds["x_centroid"],self.dict_welds["y_centroid"],modified_length) ])
+        self.Ix_force = self.Ix / t_min
+        self.Iy_force = self.Iy / t_min
+        self.Ixy_force = self.Ixy / t_min
         self.Iz_force = self.Ix_force + self.Iy_force
         
         # section modulus
-        self.Sx1_force = self.Ix_force / abs(max(all_y) - self.y_centroid)
-        self.Sx2_force = self.Ix_force / abs(min(all_y) - self.y_centroid)
-        self.Sy1_force = self.Iy_force / abs(max(all_x) - self.x_centroid)
-        self.Sy2_force = self.Iy_force / abs(min(all_x) - self.x_centroid)
+        self.Sx1_force = self.Ix_force / abs(y_max - self.y_centroid)
+        self.Sx2_force = self.Ix_force / abs(y_min - self.y_centroid)
+        self.Sy1_force = self.Iy_force / abs(x_max - self.x_centroid)
+        self.Sy2_force = self.Iy_force / abs(x_min - self.x_centroid)
         
         # principal axis
         if math.isclose(self.Ixy_force, 0, abs_tol=1e-6):
@@ -331,95 +555,46 @@ class WeldGroup:
                 self.theta_p_force = 45
             else:
                 self.theta_p_force = (  math.atan((self.Ixy_force)/((self.Ix_force-self.Iy_force)/2)) / 2) * 180 / math.pi
+        
+        self._properties_current = True
+        
+        
+    @profiled("primitives")
+    def _store_primitives(self, primitives):
+        """
+        Store exact weld primitives and update the running moment sums, minimum thickness, and bounding box.
+        Private method called whenever welds are added. Moments are summed about the start (or center) of the first
+        weld added so that welds far from the origin do not lose precision in the shift to the centroid.
+        """
+        if not primitives:
+            return
+        if not self.primitives:
+            first = primitives[0]
+            self._moment_origin = np.array(first["start"] if first["type"] == "line" else first["center"], dtype=float)
+        moments, bounds = geometry.moments_and_bounds(primitives, self._moment_origin)
+        thickness = np.array([p["thickness"] for p in primitives], dtype=float)
+        self.primitives.extend(primitives)
+        
+        self._moment_sums = self._moment_sums + thickness @ moments
+        self._length_sum = self._length_sum + moments[:,0].sum()
+        self._t_min = min(self._t_min, thickness.min())
+        self._bounds = np.array([min(self._bounds[0], bounds[:,0].min()),
+                                 max(self._bounds[1], bounds[:,1].max()),
+                                 min(self._bounds[2], bounds[:,2].min()),
+                                 max(self._bounds[3], bounds[:,3].max())])
                 
     
+    @profiled("preview")
     def preview(self):
         """
-        preview weld group defined by user.
+        preview weld group defined by user. See ezweld.plotting.preview()
         """
-        DEFAULT_THICKNESS = 0.25  # for display
-        
-        # update geometric property
-        self.update_geometric_properties()
-        
-        # normalize thickness for display
-        t_min = min(self.dict_welds["thickness"])
-        line_thicknesses = [t/t_min * DEFAULT_THICKNESS for t in self.dict_welds["thickness"]]
-        
-        # initialize figure
-        fig, axs = plt.subplots(1,2, figsize=(11,8.5), gridspec_kw={"width_ratios":[2,3]})
-        
-        # plot weld mesh with polygon patches
-        for i in range(len(self.dict_welds["x_start"])):
-            x0 = self.dict_welds["x_start"][i]
-            x1 = self.dict_welds["x_end"][i]
-            y0 = self.dict_welds["y_start"][i]
-            y1 = self.dict_welds["y_end"][i]
-            xc = self.dict_welds["x_centroid"][i]
-            yc = self.dict_welds["y_centroid"][i]
-            
-            # calculate perpendicular direction vector to offset by thickness
-            u = np.array([x1,y1]) - np.array([x0,y0])
-            u_unit = u / np.linalg.norm(u)
-            v_unit = np.array([u_unit[1], -u_unit[0]])
-            
-            # plot using polygon patches
-            pt1 = np.array([x0, y0]) + v_unit * line_thicknesses[i]
-            pt2 = np.array([x0, y0]) - v_unit * line_thicknesses[i]
-            pt3 = np.array([x1, y1]) - v_unit * line_thicknesses[i]
-            pt4 = np.array([x1, y1]) + v_unit * line_thicknesses[i]
-            vertices = [pt1, pt2, pt3, pt4, pt1]
-            axs[1].add_patch(patches.Polygon(np.array(vertices), closed=True, facecolor="steelblue",
-                                          alpha=0.8, edgecolor="black", zorder=1, lw=0.5))
-            
-        # plot Cog
-        axs[1].plot(self.x_centroid, self.y_centroid, marker="x",c="red",markersize=8,zorder=2,linestyle="none")
-
-        # annotation for weld properties
-        xo = 0.12
-        yo = 0.98
-        dy = 0.045
-        unit = "in"
-        axs[0].annotate("Weld Group Properties", 
-                        (xo-0.03,yo), fontweight="bold",xycoords='axes fraction', fontsize=12, va="top", ha="left")
-        axs[0].annotate(r"$x_{{cg}} = {:.2f} \quad {}$".format(self.x_centroid_force, unit), 
-                        (xo,yo-dy*1), xycoords='axes fraction', fontsize=12, va="top", ha="left")
-        axs[0].annotate(r"$y_{{cg}} = {:.2f} \quad {}$".format(self.y_centroid_force, unit), 
-                        (xo,yo-dy*2), xycoords='axes fraction', fontsize=12, va="top", ha="left")
-        axs[0].annotate(r"$L = {:.2f} \quad {}$".format(self.L_force, unit), 
-                        (xo,yo-dy*3), xycoords='axes fraction', fontsize=12, va="top", ha="left")
-        axs[0].annotate(r"$L_{{effective}} = {:.2f} \quad {}$".format(self.Le_force, unit), 
-                        (xo,yo-dy*4), xycoords='axes fraction', fontsize=12, va="top", ha="left")
-        axs[0].annotate(r"$I_x = {:.2f} \quad {}^3$".format(self.Ix_force, unit), 
-                        (xo,yo-dy*5), xycoords='axes fraction', fontsize=12, va="top", ha="left")
-        axs[0].annotate(r"$I_y = {:.2f} \quad {}^3$".format(self.Iy_force, unit), 
-                        (xo,yo-dy*6), xycoords='axes fraction', fontsize=12, va="top", ha="left")
-        axs[0].annotate(r"$I_z = {:.2f} \quad {}^3$".format(self.Iz_force, unit), 
-                        (xo,yo-dy*7), xycoords='axes fraction', fontsize=12, va="top", ha="left")
-        axs[0].annotate(r"$S_{{x,top}} = {:.2f} \quad {}^2$".format(self.Sx1_force, unit), 
-                        (xo,yo-dy*8), xycoords='axes fraction', fontsize=12, va="top", ha="left")
-        axs[0].annotate(r"$S_{{x,bottom}} = {:.2f} \quad {}^2$".format(self.Sx2_force, unit), 
-                        (xo,yo-dy*9), xycoords='axes fraction', fontsize=12, va="top", ha="left")
-        axs[0].annotate(r"$S_{{y,right}} = {:.2f} \quad {}^2$".format(self.Sy1_force, unit), 
-                        (xo,yo-dy*10), xycoords='axes fraction', fontsize=12, va="top", ha="left")
-        axs[0].annotate(r"$S_{{y,left}} = {:.2f} \quad {}^2$".format(self.Sy2_force, unit), 
-                        (xo,yo-dy*11), xycoords='axes fraction', fontsize=12, va="top", ha="left")
-        axs[0].annotate(r"$I_{{xy}} = {:.2f} \quad {}^3$".format(self.Ixy_force, unit), 
-                        (xo,yo-dy*12), xycoords='axes fraction', fontsize=12, va="top", ha="left")
-        axs[0].annotate(r"$\theta_{{p}} = {:.2f} \quad deg$".format(self.theta_p_force), 
-                        (xo,yo-dy*13), xycoords='axes fraction', fontsize=12, va="top", ha="left")
-
-        
-        # styling
-        axs[1].set_aspect('equal', 'datalim')
-        fig.suptitle("Weld Group Preview", fontweight="bold", fontsize=16)
-        axs[1].set_axisbelow(True)
-        axs[0].set_xticks([])
-        axs[0].set_yticks([])
-        plt.tight_layout()
-            
-            
-    def solve(self, Vx=0, Vy=0, Vz=0, Mx=0, My=0, Mz=0):
+        from ezweld import plotting
+        return plotting.preview(self)
+    
+    
+    @profiled("solve")
+    def solve(self, Vx=0, Vy=0, Vz=0, Mx=0, My=0, Mz=0, results="dataframe", rtol=1e-3):
         """
         Start analysis.
         
@@ -430,10 +605,22 @@ class WeldGroup:
             Mx                  (OPTIONAL) float:: out-of-plane moment around X-axis. Default = 0
             My                  (OPTIONAL) float:: out-of-plane moment around Y-axis. Default = 0
             Mz                  (OPTIONAL) float:: in-plane torsion. Default = 0
+            results             (OPTIONAL) str:: "dataframe", "summary", or "arrays". Default = "dataframe"
+                                    - "dataframe" stores every result in dict_welds and returns df_welds
+                                    - "summary" stores no per-patch results and returns a WeldSummary
+                                    - "arrays" stores every result in dict_welds and returns it without pandas conversion.
+                                      Arrays are views into a buffer that the next solve() overwrites
+            rtol                (OPTIONAL) float:: relative tolerance of the equilibrium check. None to skip the check. Default = 1e-3
             
         Returns:
-            df_weld             dataframe:: calculation summary table
+            df_weld             dataframe:: calculation summary table (results="dataframe")
+            summary             WeldSummary:: governing results and equilibrium residuals (results="summary")
+            dict_welds          dict:: numpy array of every column in df_welds (results="arrays")
         """
+        # EXCEPTION: unrecognized result mode
+        if results not in ["dataframe", "summary", "arrays"]:
+            raise ValueError(f'results must be "dataframe", "summary", or "arrays". Got {results}')
+        
         # store applied loading
         self.Vx = Vx
         self.Vy = Vy
@@ -443,815 +630,982 @@ class WeldGroup:
         self.Vz = Vz
         
         # calculate geometric properties
-        self.update_geometric_properties()
+        if not self._properties_current:
+            self.update_geometric_properties()
         
         # EXCEPTION: no applied loading
         if Vx==0 and Vy==0 and Mx==0 and My==0 and Mz==0 and Vz==0:
             raise RuntimeError("No loading applied to weld group")
         
         # WARNING: weld group not defined with respect to principal axis
-        if abs(self.theta_p) > 0.1:  #deg
-            print("WARNING: Weld group is not in its principal orientation. Results may not be correct!")
-            print(f"Please rotate by {self.theta_p:.2f} degrees using the .rotate() method before solving.")
-        
-        # loop through every weld patch
-        for i in range(len(self.dict_welds["length_effective"])):
-            ################# FORCE PER UNIT LENGTH ########################
-            Li = self.dict_welds["length"][i]
-            dx = self.dict_welds["x_centroid"][i] - self.x_centroid
-            dy = self.dict_welds["y_centroid"][i] - self.y_centroid
-            length_factor = self.dict_welds["length_effective"][i] / self.dict_welds["length"][i]
+        self._warn_if_not_principal()
+        
+        if results == "summary":
+            return self._solve_summary(rtol)
+        
+        # unit load responses. Cached until geometry changes
+        force_influence, stress_influence = self._unit_load_response()
+        
+        # results are written in place into a buffer that is reused by every solve()
+        self.results.resize(len(self.patches))
+        r = self.results.as_dict()
+        
+        ################# FORCE PER UNIT LENGTH ########################
+        # kip/in (per foot basis). Each component is a load times its unit load response
+        np.multiply(Vx, force_influence[:,0,0], out=r["vx_direct"])
+        np.multiply(Mz, force_influence[:,5,0], out=r["vx_torsion"])
+        np.multiply(Vy, force_influence[:,1,1], out=r["vy_direct"])
+        np.multiply(Mz, force_influence[:,5,1], out=r["vy_torsion"])
+        np.multiply(Vz, force_influence[:,2,2], out=r["vz_direct"])
+        np.multiply(Mx, force_influence[:,3,2], out=r["vz_Mx"])
+        np.multiply(My, force_influence[:,4,2], out=r["vz_My"])
+        np.add(r["vx_direct"], r["vx_torsion"], out=r["vx_total"])
+        np.add(r["vy_direct"], r["vy_torsion"], out=r["vy_total"])
+        np.add(r["vz_direct"], r["vz_Mx"], out=r["vz_total"])
+        r["vz_total"] += r["vz_My"]
+        v_resultant = np.hypot(r["vx_total"], r["vy_total"], out=r["v_resultant"])
+        np.hypot(v_resultant, r["vz_total"], out=v_resultant)
+        
+        # kips (based on actual weld length)
+        for k, f in zip(["Fx", "Fy", "Fz", "Mxi", "Myi", "Mzi"], self._patch_forces(r["vx_total"], r["vy_total"], r["vz_total"], Mx, My, Mz)):
+            r[k][:] = f
+        
+        ################# STRESS ########################
+        np.multiply(Vx, stress_influence[:,0,0], out=r["tauX_direct"])
+        np.multiply(Mz, stress_influence[:,5,0], out=r["tauX_torsion"])
+        np.multiply(Vy, stress_influence[:,1,1], out=r["tauY_direct"])
+        np.multiply(Mz, stress_influence[:,5,1], out=r["tauY_torsion"])
+        np.multiply(Vz, stress_influence[:,2,2], out=r["tauZ_direct"])
+        np.multiply(Mx, stress_influence[:,3,2], out=r["tauZ_Mx"])
+        np.multiply(My, stress_influence[:,4,2], out=r["tauZ_My"])
+        np.add(r["tauX_direct"], r["tauX_torsion"], out=r["tauX_total"])
+        np.add(r["tauY_direct"], r["tauY_torsion"], out=r["tauY_total"])
+        np.add(r["tauZ_direct"], r["tauZ_Mx"], out=r["tauZ_total"])
+        r["tauZ_total"] += r["tauZ_My"]
+        simplified_vm = np.hypot(r["tauX_total"], r["tauY_total"], out=r["sigma_vm"])
+        np.hypot(simplified_vm, r["tauZ_total"], out=simplified_vm)
+        simplified_vm *= np.sqrt(3)
+        
+        # dict_welds exposes geometry and results together. Both are views so nothing is copied
+        self._sync_dict_welds(force=True)
+        self.dict_welds.update(r)
+        self.v_max_ID = int(np.argmax(v_resultant))
+        self.v_max = v_resultant[self.v_max_ID]
+        
+        # check equilibrium
+        if rtol is not None:
+            self.check_equilibrium(rtol=rtol)
+        
+        if results == "arrays":
+            self.df_welds = None
+            return self.dict_welds
+        
+        # convert dict to a dataframe for return
+        with stage(self, "dataframe"):
+            import pandas as pd
+            self.df_welds = pd.DataFrame(self.dict_welds)
+        return self.df_welds
+    
+    
+    def _solve_summary(self, rtol):
+        """
+        Governing results of solve(results="summary"). Private method that evaluates the total force and stress
+        of each patch directly from patch geometry and keeps nothing per-patch. Clears per-patch results of any
+        previous solve().
+        """
+        load_vector = np.array([self.Vx, self.Vy, self.Vz, self.Mx, self.My, self.Mz], dtype=float)
+        
+        # patches are evaluated in chunks so peak memory does not grow with the number of patches
+        CHUNK_SIZE = 65536
+        v_max, v_max_ID, v_max_xy = -1.0, 0, (0.0, 0.0)
+        sigma_max, sigma_max_ID, sigma_max_xy = -1.0, 0, (0.0, 0.0)
+        sums = np.zeros(6)
+        Le, Ix, Iy, Iz = float(self.Le_force), float(self.Ix_force), float(self.Iy_force), float(self.Iz_force)
+        for start in range(0, len(self.patches), CHUNK_SIZE):
+            rows = slice(start, start + CHUNK_SIZE)
             
-            # kip/in (per foot basis)
-            vx_direct = - Vx / self.Le_force * length_factor
-            vx_torsion = Mz * dy / self.Iz_force * length_factor
-            vy_direct = - Vy / self.Le_force * length_factor
-            vy_torsion = - Mz * dx / self.Iz_force * length_factor
-            vz_direct = - Vz / self.Le_force * length_factor
-            vz_Mx = -Mx * dy / self.Ix_force * length_factor
-            vz_My = My * dx / self.Iy_force * length_factor
-            vx_total = vx_direct + vx_torsion
-            vy_total = vy_direct + vy_torsion
-            vz_total = vz_direct + vz_Mx + vz_My
-            v_resultant = math.sqrt(vx_total**2 + vy_total**2 + vz_total**2)
+            # total force from the elastic method equations (see _influence_at). Python floats keep compact arrays in float32
+            thickness = self.patches.column("thickness", rows)
+            length_factor = thickness / float(self._t_min)
+            x = self.patches.column("x_centroid", rows)
+            y = self.patches.column("y_centroid", rows)
+            dx = x - float(self.x_centroid)
+            dy = y - float(self.y_centroid)
+            vx_total = (-self.Vx / Le + self.Mz / Iz * dy) * length_factor
+            vy_total = (-self.Vy / Le - self.Mz / Iz * dx) * length_factor
+            vz_total = (-self.Vz / Le - self.Mx / Ix * dy + self.My / Iy * dx) * length_factor
             
-            # kips (based on actual weld length)
-            Fx = vx_total * Li
-            Fy = vy_total * Li
-            Fz = vz_total * Li
-            Mxi = Fz * dy
-            Myi = -Fz * dx
-            Mzi = - Fx * dy + Fy * dx
+            # force per unit length is stress times thickness
+            v_resultant = np.sqrt(vx_total**2 + vy_total**2 + vz_total**2)
+            sigma_vm = math.sqrt(3) * v_resultant / thickness
             
-            # append results to dictionary
-            self.dict_welds["vx_direct"].append(vx_direct)
-            self.dict_welds["vx_torsion"].append(vx_torsion)
-            self.dict_welds["vy_direct"].append(vy_direct)
-            self.dict_welds["vy_torsion"].append(vy_torsion)
-            self.dict_welds["vz_direct"].append(vz_direct)
-            self.dict_welds["vz_Mx"].append(vz_Mx)
-            self.dict_welds["vz_My"].append(vz_My)
-            self.dict_welds["vx_total"].append(vx_total)
-            self.dict_welds["vy_total"].append(vy_total)
-            self.dict_welds["vz_total"].append(vz_total)
-            self.dict_welds["v_resultant"].append(v_resultant)
-            self.dict_welds["Fx"].append(Fx)
-            self.dict_welds["Fy"].append(Fy)
-            self.dict_welds["Fz"].append(Fz)
-            self.dict_welds["Mxi"].append(Mxi)
-            self.dict_welds["Myi"].append(Myi)
-            self.dict_welds["Mzi"].append(Mzi)
-        
-            ################# STRESS ########################
-            tauX_direct = - Vx / self.A
-            tauX_torsion = Mz * dy / self.Iz
-            tauY_direct = - Vy / self.A
-            tauY_torsion = - Mz * dx / self.Iz
-            tauZ_direct = - Vz / self.A
-            tauZ_Mx = -Mx * dy / self.Ix
-            tauZ_My = My * dx / self.Iy
-            tauX_total = tauX_direct + tauX_torsion
-            tauY_total = tauY_direct + tauY_torsion
-            tauZ_total = tauZ_direct + tauZ_Mx + tauZ_My
-            simplified_vm = math.sqrt(3*(tauX_total**2 + tauY_total**2 + tauZ_total**2))
+            i = int(np.argmax(v_resultant))
+            if v_resultant[i] > v_max:
+                v_max, v_max_ID, v_max_xy = float(v_resultant[i]), start + i, (float(x[i]), float(y[i]))
+            i = int(np.argmax(sigma_vm))
+            if sigma_vm[i] > sigma_max:
+                sigma_max, sigma_max_ID, sigma_max_xy = float(sigma_vm[i]), start + i, (float(x[i]), float(y[i]))
             
-            self.dict_welds["tauX_direct"].append(tauX_direct)
-            self.dict_welds["tauX_torsion"].append(tauX_torsion)
-            self.dict_welds["tauY_direct"].append(tauY_direct)
-            self.dict_welds["tauY_torsion"].append(tauY_torsion)
-            self.dict_welds["tauZ_direct"].append(tauZ_direct)
-            self.dict_welds["tauZ_Mx"].append(tauZ_Mx)
-            self.dict_welds["tauZ_My"].append(tauZ_My)
-            self.dict_welds["tauX_total"].append(tauX_total)
-            self.dict_welds["tauY_total"].append(tauY_total)
-            self.dict_welds["tauZ_total"].append(tauZ_total)
-            self.dict_welds["sigma_vm"].append(simplified_vm)
+            if rtol is not None:
+                sums += [f.sum(dtype=np.float64) for f in self._patch_forces(vx_total, vy_total, vz_total, self.Mx, self.My, self.Mz, rows)]
         
-        # convert dict to a dataframe for return
-        self.df_welds = pd.DataFrame(self.dict_welds)
-        
-        # check equilibrium
-        self.check_equilibrium()
+        # equilibrium
+        if rtol is None:
+            residuals = None
+        else:
+            residuals = tuple(self.check_equilibrium(sums, load_vector, rtol)["residual"].tolist())
         
-        return self.df_welds
+        # drop per-patch results of any previous solve() so they are not mistaken for this one
+        for k in ResultTable.COLUMNS:
+            self.dict_welds.pop(k, None)
+        self.df_welds = None
+        self.v_max_ID = v_max_ID
+        self.v_max = v_max
+        return WeldSummary(v_max = v_max,
+                           v_max_ID = v_max_ID,
+                           v_max_x = v_max_xy[0],
+                           v_max_y = v_max_xy[1],
+                           sigma_max = sigma_max,
+                           sigma_max_ID = sigma_max_ID,
+                           sigma_max_x = sigma_max_xy[0],
+                           sigma_max_y = sigma_max_xy[1],
+                           residuals = residuals)
+    
+    
+    def _patch_forces(self, vx_total, vy_total, vz_total, Mx, My, Mz, rows=slice(None)):
+        """
+        Force (kips) and moment about the weld group centroid of every patch for force per unit length (k/in)
+        evaluated at patch centroids. Private method called by solve(). Applied moments are needed for the
+        variation of force along each patch. Optionally evaluates only a slice of patches.
         
+        Returns:
+            Fx, Fy, Fz, Mxi, Myi, Mzi       array:: patch reactions used to verify equilibrium
+        """
+        length = self.patches.column("length", rows)
+        dx = self.patches.column("x_centroid", rows) - float(self.x_centroid)
+        dy = self.patches.column("y_centroid", rows) - float(self.y_centroid)
+        
+        Fx = vx_total * length
+        Fy = vy_total * length
+        Fz = vz_total * length
+        Mxi = Fz * dy
+        Myi = -Fz * dx
+        Mzi = - Fx * dy + Fy * dx
+        
+        # force varies linearly along each patch. Add the moment of that variation about the patch centroid
+        # (length^3/12 term) so equilibrium is exact against the closed-form section properties
+        ux = (self.patches.column("x_end", rows) - self.patches.column("x_start", rows)) / length
+        uy = (self.patches.column("y_end", rows) - self.patches.column("y_start", rows)) / length
+        length_factor = self.patches.column("thickness", rows) / float(self._t_min)
+        dvz_ds = (-Mx * uy / float(self.Ix_force) + My * ux / float(self.Iy_force)) * length_factor
+        Mxi = Mxi + length**3 / 12 * dvz_ds * uy
+        Myi = Myi - length**3 / 12 * dvz_ds * ux
+        Mzi = Mzi - length**3 / 12 * Mz / float(self.Iz_force) * length_factor
+        return Fx, Fy, Fz, Mxi, Myi, Mzi
+    
+    
+    @profiled("solve_many")
+    def solve_many(self, loads, full_results=False, rtol=1e-3):
+        """
+        Solve many load combinations against the same weld group. Geometric properties are
+        calculated once and every combination is evaluated with a single matrix product.
         
-    def check_equilibrium(self):
+        Arguments:
+            loads               array or dataframe:: (N x 6) load matrix with columns [Vx, Vy, Vz, Mx, My, Mz].
+                                    Dataframe columns are matched by name (missing columns = 0) and
+                                    the index is used as the load combination name.
+            full_results        (OPTIONAL) bool:: also return the full (N x patches) result arrays. Default = False
+            rtol                (OPTIONAL) float:: relative tolerance of the equilibrium check of every combination.
+                                    None to skip the check. Default = 1e-3
+            
+        Returns:
+            df_summary          dataframe:: governing results of each load combination
+            dict_results        dict:: (only if full_results=True) (N x patches) arrays of vx_total, vy_total,
+                                    vz_total, v_resultant, tauX_total, tauY_total, tauZ_total, sigma_vm
         """
-        Check if results are correct by checking equilibrium. Probably not needed.
-        More for me to debug.
+        load_matrix, combo_names = self._load_matrix(loads)
+        governing, dict_results = self._governing_results(load_matrix, full_results, rtol)
+        
+        with stage(self, "dataframe"):
+            import pandas as pd
+            df_summary = pd.DataFrame(load_matrix, columns=["Vx","Vy","Vz","Mx","My","Mz"], index=combo_names)
+            for k, v in governing.items():
+                df_summary[k] = v
+        
+        if not full_results:
+            return df_summary
+        return df_summary, dict_results
+    
+    
+    @profiled("governing_results")
+    def _governing_results(self, load_matrix, full_results=False, rtol=1e-3, warn=True):
         """
-        TOL = 0.1
+        Governing results of every load combination in a (N x 6) load matrix as numpy arrays. Private method
+        used by solve_many() and by batch workers that do not need pandas. Batch workers pass warn=False and
+        attach _principal_warning() to their results instead.
         
-        sumFx = sum(self.dict_welds["Fx"])
-        sumFy = sum(self.dict_welds["Fy"])
-        sumFz = sum(self.dict_welds["Fz"])
-        sumMx = sum(self.dict_welds["Mxi"])
-        sumMy = sum(self.dict_welds["Myi"])
-        sumMz = sum(self.dict_welds["Mzi"])
+        Returns:
+            governing           dict:: (N,) arrays of v_max, v_max_ID, sigma_max, sigma_max_ID
+            dict_results        dict:: (N x patches) result arrays if full_results=True, otherwise None
+        """
+        # calculate geometric properties and unit load responses. (patches x 6 x 3) for force (k/in) and stress (ksi)
+        force_influence, stress_influence = self._unit_load_response()
+        
+        # WARNING: weld group not defined with respect to principal axis. Batch workers report it with their results
+        if warn:
+            self._warn_if_not_principal()
+        
+        # governing results of each combination
+        N = len(load_matrix)
+        v_max = np.zeros(N)
+        v_max_ID = np.zeros(N, dtype=int)
+        sigma_max = np.zeros(N)
+        sigma_max_ID = np.zeros(N, dtype=int)
+        
+        # (N x 6) @ (6 x patches x 3) => (N x patches x 3). Done in chunks of load combinations to bound
+        # memory use unless the full result arrays are requested
+        MAX_CHUNK_SIZE = 2_000_000  # number of (patch, load combination, direction) values
+        chunk = max(1, N) if full_results else max(1, MAX_CHUNK_SIZE // (3 * force_influence.shape[0]))
+        
+        # no load combinations. Full results are empty (0 x patches) arrays
+        v = tau = np.zeros((0, force_influence.shape[0], 3))
+        v_resultant = sigma_vm = np.zeros((0, force_influence.shape[0]))
+        for i in range(0, N, chunk):
+            rows = slice(i, i+chunk)
+            v = np.tensordot(load_matrix[rows], force_influence, axes=([1],[1]))
+            tau = np.tensordot(load_matrix[rows], stress_influence, axes=([1],[1]))
+            v_resultant = np.sqrt(np.sum(v**2, axis=2))
+            sigma_vm = np.sqrt(3*np.sum(tau**2, axis=2))
+            
+            v_max_ID[rows] = np.argmax(v_resultant, axis=1)
+            sigma_max_ID[rows] = np.argmax(sigma_vm, axis=1)
+            v_max[rows] = np.max(v_resultant, axis=1)
+            sigma_max[rows] = np.max(sigma_vm, axis=1)
+        
+        # equilibrium of every combination from the summed reactions to unit loads
+        if rtol is not None:
+            self.check_equilibrium(load_matrix @ self._reaction_matrix().T, load_matrix, rtol)
+        
+        governing = {"v_max": v_max, "v_max_ID": v_max_ID, "sigma_max": sigma_max, "sigma_max_ID": sigma_max_ID}
+        if not full_results:
+            return governing, None
+        
+        dict_results = {"vx_total": v[:,:,0],
+                        "vy_total": v[:,:,1],
+                        "vz_total": v[:,:,2],
+                        "v_resultant": v_resultant,
+                        "tauX_total": tau[:,:,0],
+                        "tauY_total": tau[:,:,1],
+                        "tauZ_total": tau[:,:,2],
+                        "sigma_vm": sigma_vm}
+        return governing, dict_results
+    
+    
+    @profiled("solve_adaptive")
+    def solve_adaptive(self, Vx=0, Vy=0, Vz=0, Mx=0, My=0, Mz=0, tol=0.001, gradient_tol=0.05, coarse_size=None, max_iter=20,
+                       return_convergence=False):
+        """
+        Start analysis with adaptive discretization. Welds are first discretized coarsely, then only the patches
+        near the maximum or with a sharp change in force are bisected until the maximum converges. Geometric
+        properties are exact so they are unaffected by the discretization. Replaces the current weld patches.
         
-        residual_Fx = sumFx + self.Vx
-        residual_Fy = sumFy + self.Vy
-        residual_Fz = sumFz + self.Vz
-        residual_Mx = sumMx + self.Mx
-        residual_My = sumMy + self.My
-        residual_Mz = sumMz + self.Mz
+        The elastic method varies linearly along every straight patch so the maximum within a patch is at one
+        of its ends. The gap between the end values and the maximum patch centroid value is therefore a strict
+        bound on the error of v_max and sigma_vm.
         
-        flag_Fx = "OK" if abs(residual_Fx) < TOL else "WARNING: NOT OKAY. EQUILIBRIUM NOT SATISFIED"
-        flag_Fy = "OK" if abs(residual_Fy) < TOL else "WARNING: NOT OKAY. EQUILIBRIUM NOT SATISFIED"
-        flag_Fz = "OK" if abs(residual_Fz) < TOL else "WARNING: NOT OKAY. EQUILIBRIUM NOT SATISFIED"
-        flag_Mx = "OK" if abs(residual_Mx) < TOL else "WARNING: NOT OKAY. EQUILIBRIUM NOT SATISFIED"
-        flag_My = "OK" if abs(residual_My) < TOL else "WARNING: NOT OKAY. EQUILIBRIUM NOT SATISFIED"
-        flag_Mz = "OK" if abs(residual_Mz) < TOL else "WARNING: NOT OKAY. EQUILIBRIUM NOT SATISFIED"
+        Arguments:
+            Vx                  (OPTIONAL) float:: in-plane shear in X direction. Default = 0
+            Vy                  (OPTIONAL) float:: in-plane shear in Y direction. Default = 0
+            Vz                  (OPTIONAL) float:: out-of-plane axial force (negative is compression). Default = 0
+            Mx                  (OPTIONAL) float:: out-of-plane moment around X-axis. Default = 0
+            My                  (OPTIONAL) float:: out-of-plane moment around Y-axis. Default = 0
+            Mz                  (OPTIONAL) float:: in-plane torsion. Default = 0
+            tol                 (OPTIONAL) float:: relative tolerance on maximum force and stress. Default = 0.001
+            gradient_tol        (OPTIONAL) float:: bisect any patch whose force changes by more than this fraction of the maximum. Default = 0.05
+            coarse_size         (OPTIONAL) float:: initial patch size. Default = 1/10 of the larger of weld group width or depth
+            max_iter            (OPTIONAL) int:: maximum number of refinement iterations. Default = 20
+            return_convergence  (OPTIONAL) bool:: also return a summary of the refinement. Default = False
+            
+        Returns:
+            df_weld             dataframe:: calculation summary table. Convergence history is stored in df_refinement
+            dict_convergence    dict:: (only if return_convergence=True) "converged" (bool), "iterations", "patches",
+                                    and the final error bounds "v_error" and "sigma_error"
         
-        if flag_Fx !="OK" or flag_Fy !="OK" or flag_Fz !="OK" or flag_Mx !="OK" or flag_My !="OK" or flag_Mz !="OK":
-            print(f"\t\t Fx_applied={self.Vx:.2f},\t  sumFx={sumFx:.2f},\t residual = {residual_Fx:.2f},\t {flag_Fx}")
-            print(f"\t\t Fy_applied={self.Vy:.2f},\t  sumFy={sumFy:.2f},\t residual = {residual_Fy:.2f},\t {flag_Fy}")
-            print(f"\t\t Fz_applied={self.Vz:.2f},\t  sumFz={sumFz:.2f},\t residual = {residual_Fz:.2f},\t {flag_Fz}")
-            print(f"\t\t Mx_applied={self.Mx:.2f},\t  sumMx={sumMx:.2f},\t residual = {residual_Mx:.2f},\t {flag_Mx}")
-            print(f"\t\t My_applied={self.My:.2f},\t  sumMy={sumMy:.2f},\t residual = {residual_My:.2f},\t {flag_My}")
-            print(f"\t\t Mz_applied={self.Mz:.2f},\t  sumMz={sumMz:.2f},\t residual = {residual_Mz:.2f},\t {flag_Mz}")
-            raise RuntimeError("Error: Equilibrium check failed.")
+        Warns:
+            RuntimeWarning if refinement does not converge within max_iter iterations
+        """
+        MAX_ARC_ANGLE = 2  # deg. Maximum initial angle subtended by a single chord of an arc
         
+        # EXCEPTION: no applied loading
+        if Vx==0 and Vy==0 and Mx==0 and My==0 and Mz==0 and Vz==0:
+            raise RuntimeError("No loading applied to weld group")
         
-    def plot_results(self, plot="force", colormap="jet", cmin="auto", cmax="auto"):
-        """
-        plot results using matplotlib
-        """
-        # plot unit force or stress
-        if plot == "force":
-            magnitude = self.dict_welds["v_resultant"]
-            title = "Shear Resultant Force (k/in)"
-        else:
-            magnitude = self.dict_welds["sigma_vm"]
-            title = "Shear Stress Contour (ksi)"
-        
-        # normalize thickness for display
-        DEFAULT_THICKNESS = 0.25
-        t_min = min(self.dict_welds["thickness"])
-        line_thicknesses = [t/t_min * DEFAULT_THICKNESS for t in self.dict_welds["thickness"]]
-        
-        # initialize figure
-        fig, axs = plt.subplots(1,2, figsize=(11,8.5), gridspec_kw={"width_ratios":[2,3]})
-        
-        # colormap
-        cm = plt.get_cmap(colormap)
-        cmin = min(magnitude) if cmin == "auto" else cmin
-        cmax = max(magnitude) if cmax == "auto" else cmax
-        if math.isclose(cmax-cmin, 0):
-            cmin = 0
-        v_normalized = [(v-cmin)/(cmax-cmin) for v in magnitude]
-        colors = [cm(x) for x in v_normalized]
+        if not self._properties_current:
+            self.update_geometric_properties()
+        load_vector = np.array([Vx, Vy, Vz, Mx, My, Mz], dtype=float)
+        thickness = np.array([p["thickness"] for p in self.primitives], dtype=float)
+        
+        # initial coarse discretization of every primitive
+        if coarse_size is None:
+            x_min, x_max, y_min, y_max = self._bounds
+            coarse_size = max(x_max - x_min, y_max - y_min) / 10
+        moments, _ = geometry.moments_and_bounds(self.primitives)
+        segments = np.maximum(moments[:,0] // coarse_size, 1).astype(int)
+        for i, p in enumerate(self.primitives):
+            if p["type"] == "arc":
+                segments[i] = max(segments[i], math.ceil((p["end_angle"] - p["start_angle"]) / MAX_ARC_ANGLE))
+        primitive_id = np.repeat(np.arange(len(segments)), segments)
+        k = np.arange(segments.sum()) - np.repeat(np.cumsum(segments) - segments, segments)
+        s_start = k / segments[primitive_id]
+        s_end = (k + 1) / segments[primitive_id]
+        
+        history = []
+        for iteration in range(max_iter + 1):
+            self._set_patches(primitive_id, s_start, s_end)
             
-        # add colorbar to plot
-        tick_values = np.linspace(cmin,cmax,6)
-        norm = mcolors.Normalize(vmin=cmin, vmax=cmax)
-        fig.colorbar(mcm.ScalarMappable(norm=norm, cmap=cm), 
-                     orientation='vertical',
-                     ax=axs[1],
-                     ticks=tick_values)
-        
-        # plot weld mesh with polygon patches
-        for i in range(len(self.dict_welds["x_start"])):
-            x0 = self.dict_welds["x_start"][i]
-            x1 = self.dict_welds["x_end"][i]
-            y0 = self.dict_welds["y_start"][i]
-            y1 = self.dict_welds["y_end"][i]
+            # force and stress at patch centroids, start points, and end points
+            length_factor = thickness[primitive_id] / self._t_min
+            results = []
+            for x, y in [(self.patches.column("x_centroid"), self.patches.column("y_centroid")),
+                         (self.patches.column("x_start"), self.patches.column("y_start")),
+                         (self.patches.column("x_end"), self.patches.column("y_end"))]:
+                force_influence, stress_influence = self._influence_at(x - self.x_centroid, y - self.y_centroid, length_factor)
+                v = np.linalg.norm(np.tensordot(force_influence, load_vector, axes=([1],[0])), axis=1)
+                sigma = np.sqrt(3) * np.linalg.norm(np.tensordot(stress_influence, load_vector, axes=([1],[0])), axis=1)
+                results.append((v, sigma))
+            (v_center, sigma_center), (v_start, sigma_start), (v_end, sigma_end) = results
             
-            # calculate perpendicular direction vector to offset by thickness
-            u = np.array([x1,y1]) - np.array([x0,y0])
-            u_unit = u / np.linalg.norm(u)
-            v_unit = np.array([u_unit[1], - u_unit[0]])
+            # maximum at patch centroids and upper bound from patch ends
+            v_max = v_center.max()
+            sigma_max = sigma_center.max()
+            v_bound = np.maximum(v_start, v_end)
+            sigma_bound = np.maximum(sigma_start, sigma_end)
+            history.append({"iteration": iteration,
+                            "patches": len(primitive_id),
+                            "v_max": v_max,
+                            "v_error": v_bound.max() / v_max - 1,
+                            "sigma_max": sigma_max,
+                            "sigma_error": sigma_bound.max() / sigma_max - 1})
             
-            # plot using polygon patches
-            pt1 = np.array([x0, y0]) + v_unit * line_thicknesses[i]
-            pt2 = np.array([x0, y0]) - v_unit * line_thicknesses[i]
-            pt3 = np.array([x1, y1]) - v_unit * line_thicknesses[i]
-            pt4 = np.array([x1, y1]) + v_unit * line_thicknesses[i]
-            vertices = [pt1, pt2, pt3, pt4, pt1]
-            axs[1].add_patch(patches.Polygon(np.array(vertices), closed=True, facecolor=colors[i],
-                                          alpha=0.8, edgecolor=colors[i], zorder=1, lw=0.5))
-        
-        # plot Cog
-        axs[1].plot(self.x_centroid, self.y_centroid, marker="x",c="red",markersize=8,zorder=2,linestyle="none")
-        axs[1].annotate("",
-                        xy=(self.x_centroid+1, self.y_centroid), 
-                        xytext=(self.x_centroid, self.y_centroid),
-                        color="black",
-                        arrowprops=dict(arrowstyle="simple,head_length=0.4,head_width=0.3,tail_width=0.10",
-                                            fc="black", ec="black"))
-        axs[1].annotate("",
-                        xy=(self.x_centroid, self.y_centroid+1), 
-                        xytext=(self.x_centroid, self.y_centroid),
-                        color="black",
-                        arrowprops=dict(arrowstyle="simple,head_length=0.4,head_width=0.3,tail_width=0.10",
-                                            fc="black", ec="black"))
-        axs[1].annotate("X",
-                        xy=(self.x_centroid, self.y_centroid), 
-                        xytext=(self.x_centroid+1.1, self.y_centroid),
-                        va="center",
-                        color="black")
-        axs[1].annotate("Y",
-                        xy=(self.x_centroid, self.y_centroid), 
-                        xytext=(self.x_centroid, self.y_centroid+1.1),
-                        ha="center",
-                        color="black")
-        
-        
-        # annotation for weld properties
-        xo = 0.12
-        yo = 0.98
-        dy = 0.045
-        axs[0].annotate("Weld Group Properties", 
-                        (xo-0.03,yo), fontweight="bold",xycoords='axes fraction', fontsize=12, va="top", ha="left")
-        if plot == "force":
-            axs[0].annotate(r"$x_{{cg}} = {:.2f} \quad in$".format(self.x_centroid_force), 
-                            (xo,yo-dy*1), xycoords='axes fraction', fontsize=12, va="top", ha="left")
-            axs[0].annotate(r"$y_{{cg}} = {:.2f} \quad in$".format(self.y_centroid_force), 
-                            (xo,yo-dy*2), xycoords='axes fraction', fontsize=12, va="top", ha="left")
-            axs[0].annotate(r"$L = {:.2f} \quad in$".format(self.L_force), 
-                            (xo,yo-dy*3), xycoords='axes fraction', fontsize=12, va="top", ha="left")
-            axs[0].annotate(r"$L_{{effective}} = {:.2f} \quad in$".format(self.Le_force), 
-                            (xo,yo-dy*4), xycoords='axes fraction', fontsize=12, va="top", ha="left")
-            axs[0].annotate(r"$I_x = {:.2f} \quad in^3$".format(self.Ix_force), 
-                            (xo,yo-dy*5), xycoords='axes fraction', fontsize=12, va="top", ha="left")
-            axs[0].annotate(r"$I_y = {:.2f} \quad in^3$".format(self.Iy_force), 
-                            (xo,yo-dy*6), xycoords='axes fraction', fontsize=12, va="top", ha="left")
-            axs[0].annotate(r"$I_z = {:.2f} \quad in^3$".format(self.Iz_force), 
-                            (xo,yo-dy*7), xycoords='axes fraction', fontsize=12, va="top", ha="left")
-            axs[0].annotate(r"$S_{{x,top}} = {:.2f} \quad in^2$".format(self.Sx1_force), 
-                            (xo,yo-dy*8), xycoords='axes fraction', fontsize=12, va="top", ha="left")
-            axs[0].annotate(r"$S_{{x,bottom}} = {:.2f} \quad in^2$".format(self.Sx2_force), 
-                            (xo,yo-dy*9), xycoords='axes fraction', fontsize=12, va="top", ha="left")
-            axs[0].annotate(r"$S_{{y,right}} = {:.2f} \quad in^2$".format(self.Sy1_force), 
-                            (xo,yo-dy*10), xycoords='axes fraction', fontsize=12, va="top", ha="left")
-            axs[0].annotate(r"$S_{{y,left}} = {:.2f} \quad in^2$".format(self.Sy2_force), 
-                            (xo,yo-dy*11), xycoords='axes fraction', fontsize=12, va="top", ha="left")
-            axs[0].annotate(r"$I_{{xy}} = {:.2f} \quad in^3$".format(self.Ixy_force), 
-                            (xo,yo-dy*12), xycoords='axes fraction', fontsize=12, va="top", ha="left")
-            axs[0].annotate(r"$\theta_{{p}} = {:.2f} \quad deg$".format(self.theta_p_force), 
-                            (xo,yo-dy*13), xycoords='axes fraction', fontsize=12, va="top", ha="left")
-        else:
-            axs[0].annotate(r"$x_{{cg}} = {:.2f} \quad in$".format(self.x_centroid), 
-                            (xo,yo-dy*1), xycoords='axes fraction', fontsize=12, va="top", ha="left")
-            axs[0].annotate(r"$y_{{cg}} = {:.2f} \quad in$".format(self.y_centroid), 
-                            (xo,yo-dy*2), xycoords='axes fraction', fontsize=12, va="top", ha="left")
-            axs[0].annotate(r"$A = {:.2f} \quad in^2$".format(self.A), 
-                            (xo,yo-dy*3), xycoords='axes fraction', fontsize=12, va="top", ha="left")
-            axs[0].annotate(r"$I_x = {:.2f} \quad in^4$".format(self.Ix), 
-                            (xo,yo-dy*4), xycoords='axes fraction', fontsize=12, va="top", ha="left")
-            axs[0].annotate(r"$I_y = {:.2f} \quad in^4$".format(self.Iy), 
-                            (xo,yo-dy*5), xycoords='axes fraction', fontsize=12, va="top", ha="left")
-            axs[0].annotate(r"$I_z = {:.2f} \quad in^4$".format(self.Iz), 
-                            (xo,yo-dy*6), xycoords='axes fraction', fontsize=12, va="top", ha="left")
-            axs[0].annotate(r"$S_{{x,top}} = {:.2f} \quad in^3$".format(self.Sx1), 
-                            (xo,yo-dy*7), xycoords='axes fraction', fontsize=12, va="top", ha="left")
-            axs[0].annotate(r"$S_{{x,bottom}} = {:.2f} \quad in^3$".format(self.Sx2), 
-                            (xo,yo-dy*8), xycoords='axes fraction', fontsize=12, va="top", ha="left")
-            axs[0].annotate(r"$S_{{y,right}} = {:.2f} \quad in^3$".format(self.Sy1), 
-                            (xo,yo-dy*9), xycoords='axes fraction', fontsize=12, va="top", ha="left")
-            axs[0].annotate(r"$S_{{y,left}} = {:.2f} \quad in^3$".format(self.Sy2), 
-                            (xo,yo-dy*10), xycoords='axes fraction', fontsize=12, va="top", ha="left")
-            axs[0].annotate(r"$I_{{xy}} = {:.2f} \quad in^4$".format(self.Ixy), 
-                            (xo,yo-dy*11), xycoords='axes fraction', fontsize=12, va="top", ha="left")
-            axs[0].annotate(r"$\theta_{{p}} = {:.2f} \quad deg$".format(self.theta_p), 
-                            (xo,yo-dy*12), xycoords='axes fraction', fontsize=12, va="top", ha="left")
+            # bisect patches that may contain a larger maximum or where force changes sharply
+            refine = ((v_bound > v_max * (1 + tol)) |
+                      (sigma_bound > sigma_max * (1 + tol)) |
+                      (np.abs(v_end - v_start) > gradient_tol * v_max))
+            if not refine.any() or iteration == max_iter:
+                break
+            s_mid = (s_start[refine] + s_end[refine]) / 2
+            primitive_id = np.concatenate([primitive_id[~refine], primitive_id[refine], primitive_id[refine]])
+            s_start, s_end = (np.concatenate([s_start[~refine], s_start[refine], s_mid]),
+                              np.concatenate([s_end[~refine], s_mid, s_end[refine]]))
             
-        xo = 0.12
-        yo = 0.35
-        dy = 0.045
-        axs[0].annotate("Applied Loading", 
-                        (xo-0.03,yo), fontweight="bold",xycoords='axes fraction', fontsize=12, va="top", ha="left")
-        axs[0].annotate(r"$V_x = {:.2f} \quad kips$".format(self.Vx), 
-                        (xo,yo-dy*1), xycoords='axes fraction', fontsize=12, va="top", ha="left")
-        axs[0].annotate(r"$V_y = {:.2f} \quad kips$".format(self.Vy), 
-                        (xo,yo-dy*2), xycoords='axes fraction', fontsize=12, va="top", ha="left")
-        axs[0].annotate(r"$V_z = {:.2f} \quad kips$".format(self.Vz), 
-                        (xo,yo-dy*3), xycoords='axes fraction', fontsize=12, va="top", ha="left")
-        axs[0].annotate(r"$M_x = {:.2f} \quad k.in$".format(self.Mx), 
-                        (xo,yo-dy*4), xycoords='axes fraction', fontsize=12, va="top", ha="left")
-        axs[0].annotate(r"$M_y = {:.2f} \quad k.in$".format(self.My), 
-                        (xo,yo-dy*5), xycoords='axes fraction', fontsize=12, va="top", ha="left")
-        axs[0].annotate(r"$M_z = {:.2f} \quad k.in$".format(self.Mz), 
-                        (xo,yo-dy*6), xycoords='axes fraction', fontsize=12, va="top", ha="left")
-        
-        # styling
-        axs[1].set_aspect('equal', 'datalim')
-        fig.suptitle(title, fontweight="bold", fontsize=16)
-        axs[1].set_axisbelow(True)
-        axs[0].set_xticks([])
-        axs[0].set_yticks([])
-        plt.tight_layout()
+            # keep patches ordered along each primitive
+            order = np.lexsort((s_start, primitive_id))
+            primitive_id, s_start, s_end = primitive_id[order], s_start[order], s_end[order]
+        
+        import pandas as pd
+        self.df_refinement = pd.DataFrame(history)
+        converged = not refine.any()
+        if not converged:
+            warnings.warn(f"Adaptive refinement did not converge within {max_iter} iterations. "
+                          f"Error bound on v_max = {history[-1]['v_error']:.2%}", RuntimeWarning, stacklevel=3)
+        
+        df_welds = self.solve(Vx=Vx, Vy=Vy, Vz=Vz, Mx=Mx, My=My, Mz=Mz)
+        if not return_convergence:
+            return df_welds
+        dict_convergence = {"converged": converged,
+                            "iterations": history[-1]["iteration"],
+                            "patches": history[-1]["patches"],
+                            "v_error": float(history[-1]["v_error"]),
+                            "sigma_error": float(history[-1]["sigma_error"])}
+        return df_welds, dict_convergence
     
     
-    def plot_results_3D_deprecated(self, colormap="jet", cmin="auto", cmax="auto"):
+    @profiled("max_stress")
+    def max_stress(self, Vx=0, Vy=0, Vz=0, Mx=0, My=0, Mz=0):
         """
-        use plotly to generate an interactive plot
-        """     
-        # initialize a plotly figure with 2 subplots
-        fig = make_subplots(rows=2, cols=2,
-                            subplot_titles=("Weld Group Properties", "Vector Plot", "Applied Loading"),
-                            column_widths=[0.3, 0.7],
-                            row_heights=[0.65, 0.35],
-                            horizontal_spacing=0.02,
-                            vertical_spacing=0.05,
-                            specs = [[{"type":"table"}, {"type":"scene","rowspan":2}],
-                                     [{"type":"table"}, None],
-                                     ])
-        
-        # properties table
-        table_properties = [r"$x_{{cg}}$",
-                     r"$y_{{cg}}$",
-                     r"$L$",
-                     r"$L_e$",
-                     r"$I_{x}$",
-                     r"$I_{y}$",
-                     r"$I_{z}$",
-                     r"$S_{{x,top}}$",
-                     r"$S_{{x,bottom}}$",
-                     r"$S_{{y,right}}$",
-                     r"$S_{{y,left}}$"]
-        table_values = [r"${:.2f} \quad in$".format(self.x_centroid_force),
-                        r"${:.2f} \quad in$".format(self.y_centroid_force),
-                        r"${:.1f} \quad in$".format(self.L_force),
-                        r"${:.1f} \quad in$".format(self.Le_force),
-                        r"${:.1f} \quad in^3$".format(self.Ix_force),
-                        r"${:.1f} \quad in^3$".format(self.Iy_force),
-                        r"${:.1f} \quad in^3$".format(self.Iz_force),
-                        r"${:.1f} \quad in^2$".format(self.Sx1_force),
-                        r"${:.1f} \quad in^2$".format(self.Sx2_force),
-                        r"${:.1f} \quad in^2$".format(self.Sy1_force),
-                        r"${:.1f} \quad in^2$".format(self.Sy2_force)]
-        property_table = go.Table(header_values = ['Parameters', 'Value'],
-                                  header_line_color = "black",
-                                  header_font_color = "white",
-                                  header_fill_color = "#3b3b41",
-                                  header_align = "center",
-                                  header_font_size = 18,
-                                  header_height = 34,
-                                  cells_values = [table_properties, table_values],
-                                  cells_line_color = "black",
-                                  cells_font_color = "black",
-                                  cells_fill_color = "white",
-                                  cells_align = "center",
-                                  cells_font_size = 22,
-                                  cells_height = 34,
-                                  )
-        fig.add_trace(property_table, row=1, col=1)
-        
-        # applied force table
-        table_properties = [r"$V_x$",
-                            r"$V_y$",
-                            r"$V_z$",
-                            r"$M_x$",
-                            r"$M_y$",
-                            r"$M_z$"]
-        table_values = [r"${:.1f} \quad kips$".format(self.Vx),
-                        r"${:.1f} \quad kips$".format(self.Vy),
-                        r"${:.1f} \quad kips$".format(self.Vz),
-                        r"${:.1f} \quad k.in$".format(self.Mx),
-                        r"${:.1f} \quad k.in$".format(self.My),
-                        r"${:.1f} \quad k.in$".format(self.Mz)]
-        property_table = go.Table(header_values = ['Applied Load', 'Value'],
-                                  header_line_color = "black",
-                                  header_font_color = "white",
-                                  header_fill_color = "#3b3b41",
-                                  header_align = "center",
-                                  header_font_size = 18,
-                                  header_height = 34,
-                                  cells_values = [table_properties, table_values],
-                                  cells_line_color = "black",
-                                  cells_font_color = "black",
-                                  cells_fill_color = "white",
-                                  cells_align = "center",
-                                  cells_font_size = 22,
-                                  cells_height = 34,
-                                  )
-        fig.add_trace(property_table, row=2, col=1)
-        
-        
-        # plot orgin marker at centroid
-        xmax = max(self.dict_welds["x_centroid"])
-        xmin = min(self.dict_welds["x_centroid"])
-        ymax = max(self.dict_welds["y_centroid"])
-        ymin = min(self.dict_welds["y_centroid"])
-        dmax = max(xmax-xmin, ymax-ymin)/1.5
-        X = go.Scatter3d(
-            x=[self.x_centroid, self.x_centroid + dmax/14],
-            y=[self.y_centroid, self.y_centroid],
-            z=[0,0],
-            mode='lines+text',
-            hoverinfo = 'skip',
-            showlegend=False,
-            line=dict(color='blue', width=5),
-            text=["","X"],
-            textposition="top center",
-            textfont=dict(
-                family="Arial",
-                size=14,
-                color="blue"))
-        fig.add_trace(X, row=1, col=2)
-        Y = go.Scatter3d(
-            x=[self.x_centroid, self.x_centroid],
-            y=[self.y_centroid, self.y_centroid + dmax/14],
-            z=[0,0],
-            mode='lines+text',
-            hoverinfo = 'skip',
-            line=dict(color='red', width=5),
-            text=["","Y"],
-            textposition="top center",
-            showlegend=False,
-            textfont=dict(
-                family="Arial",
-                size=14,
-                color="red"))
-        fig.add_trace(Y,row=1, col=2)
-        Z = go.Scatter3d(
-            x=[self.x_centroid, self.x_centroid],
-            y=[self.y_centroid, self.y_centroid],
-            z=[0, 0 + 0.75],
-            mode='lines+text',
-            hoverinfo = 'skip',
-            line=dict(color='green', width=5),
-            text=["","Z"],
-            textposition="top center",
-            showlegend=False,
-            textfont=dict(
-                family="Arial",
-                size=14,
-                color="green"))
-        fig.add_trace(Z, row=1, col=2)
-        
-        
-        # plot weld stress quiver contour
-        cmin = min(self.df_welds["v_resultant"]) if cmin == "auto" else cmin
-        cmax = max(self.df_welds["v_resultant"]) if cmax == "auto" else cmax
-        if math.isclose(cmax-cmin, 0):
-            cmin = 0
-        sizeref = 0.35 * 1/cmax # fixes arrow scaling issues
-        # need to use sizemode raw which is not available on older versions of plotly
-        custom_hover = '<b>vx</b>: %{u:.2f} k/in<br>' +\
-            '<b>vy</b>: %{v:.2f} k/in<br>' +\
-            '<b>vz</b>: %{w:.2f} k/in<br>' +\
-            '<b>vtotal</b>: %{text:.2f} k/in<br>'
-        cone_plot = go.Cone(x = self.df_welds["x_centroid"],
-                            y = self.df_welds["y_centroid"],
-                            z = [0] * len(self.df_welds["y_centroid"]),
-                            u = self.df_welds["vx_total"],
-                            v = self.df_welds["vy_total"],
-                            w = self.df_welds["vz_total"],
-                            text = self.df_welds["v_resultant"],
-                            colorbar_title_text="(k/in)",
-                            hovertemplate = custom_hover,
-                            hoverlabel_font_size=16,
-                            colorscale=colormap,
-                            cmin=cmin,
-                            cmax=cmax,
-                            sizemode = "raw", #very new in plotly...
-                            sizeref = sizeref)
-        fig.add_trace(cone_plot, row=1, col=2)
+        Governing force and stress without discretizing the welds. Elastic method results vary linearly with
+        position, so their magnitude is convex along a straight weld and its maximum is at one of the end points.
+        Only line end points, arc end points, and the stationary points along each arc are evaluated.
+        Does not update df_welds.
         
-
-        # change such that axes are in proportion.
-        fig.update_scenes(aspectmode="data")
-        
-        # add title
-        fig.update_layout(title="<b>Weld Group Result Summary</b>",
-                          title_xanchor="center",
-                          title_font_size=22,
-                          title_x=0.5, 
-                          title_y=0.98,
-                          title_font_color="black")
-        
-        # background color
-        fig.update_layout(paper_bgcolor="white",
-                          font_color="black")
-        
-        # adjust zoom level and default camera position
-        fig.update_scenes(camera_eye=dict(x=2, y=2, z=2))
-        
-        # change origin to be on the bottom left corner
-        fig.update_scenes(xaxis_autorange="reversed")
-        fig.update_scenes(yaxis_autorange="reversed")
-        fig.update_scenes(xaxis_backgroundcolor="white",
-                          yaxis_backgroundcolor="white",
-                          xaxis_gridcolor="grey",
-                          yaxis_gridcolor="grey",
-                          xaxis_gridwidth=0.5,
-                          yaxis_gridwidth=0.5,
-                          zaxis_visible=False,
-                          )
-        fig.show()
-        return fig
+        Arguments:
+            Vx                  (OPTIONAL) float:: in-plane shear in X direction. Default = 0
+            Vy                  (OPTIONAL) float:: in-plane shear in Y direction. Default = 0
+            Vz                  (OPTIONAL) float:: out-of-plane axial force (negative is compression). Default = 0
+            Mx                  (OPTIONAL) float:: out-of-plane moment around X-axis. Default = 0
+            My                  (OPTIONAL) float:: out-of-plane moment around Y-axis. Default = 0
+            Mz                  (OPTIONAL) float:: in-plane torsion. Default = 0
+            
+        Returns:
+            dict_max            dict:: v_max, its location (v_max_x, v_max_y), and the index of the weld in
+                                    self.primitives (v_max_ID). Same for sigma_max
+        """
+        # EXCEPTION: no applied loading
+        if Vx==0 and Vy==0 and Mx==0 and My==0 and Mz==0 and Vz==0:
+            raise RuntimeError("No loading applied to weld group")
+        
+        if not self._properties_current:
+            self.update_geometric_properties()
+        
+        # WARNING: weld group not defined with respect to principal axis
+        self._warn_if_not_principal()
+        
+        load_vector = np.array([Vx, Vy, Vz, Mx, My, Mz], dtype=float)
+        thickness = np.array([p["thickness"] for p in self.primitives], dtype=float)
+        
+        # every weld is evaluated at its start and end point
+        candidate_id = [np.arange(len(self.primitives)), np.arange(len(self.primitives))]
+        candidate_s = [np.zeros(len(self.primitives)), np.ones(len(self.primitives))]
+        
+        # arcs are also evaluated where force or stress magnitude is stationary. Both vary around the arc as
+        # f(θ) = a + b*cos(θ) + c*sin(θ) so a, b, c are found by evaluating at the center and at unit offsets
+        for i, p in enumerate(self.primitives):
+            if p["type"] != "arc":
+                continue
+            dx = p["center"][0] - self.x_centroid + np.array([0, p["radius"], 0])
+            dy = p["center"][1] - self.y_centroid + np.array([0, 0, p["radius"]])
+            force_influence, stress_influence = self._influence_at(dx, dy, np.full(3, thickness[i] / self._t_min))
+            start = math.radians(p["start_angle"])
+            sweep = math.radians(p["end_angle"] - p["start_angle"])
+            for influence in [force_influence, stress_influence]:
+                a, b, c = np.tensordot(influence, load_vector, axes=([1],[0]))
+                theta = geometry.arc_stationary_angles(a, b - a, c - a)
+                s = np.mod(theta - start, 2*math.pi) / sweep
+                s = s[s <= 1]
+                candidate_id.append(np.full(len(s), i))
+                candidate_s.append(s)
+        candidate_id = np.concatenate(candidate_id)
+        candidate_s = np.concatenate(candidate_s)
+        
+        # force and stress at every candidate point
+        x, y = geometry.primitive_points(self.primitives, candidate_id, candidate_s)
+        force_influence, stress_influence = self._influence_at(x - self.x_centroid, y - self.y_centroid, thickness[candidate_id] / self._t_min)
+        v_resultant = np.linalg.norm(np.tensordot(force_influence, load_vector, axes=([1],[0])), axis=1)
+        sigma_vm = np.sqrt(3) * np.linalg.norm(np.tensordot(stress_influence, load_vector, axes=([1],[0])), axis=1)
+        
+        i_v = np.argmax(v_resultant)
+        i_sigma = np.argmax(sigma_vm)
+        return {"v_max": v_resultant[i_v],
+                "v_max_x": x[i_v],
+                "v_max_y": y[i_v],
+                "v_max_ID": candidate_id[i_v],
+                "sigma_max": sigma_vm[i_sigma],
+                "sigma_max_x": x[i_sigma],
+                "sigma_max_y": y[i_sigma],
+                "sigma_max_ID": candidate_id[i_sigma]}
     
     
-    def plot_results_3D(self, colormap="jet", cmin="auto", cmax="auto", scale=0.2):
-        """
-        use plotly to generate an interactive plot
-        """     
-        # initialize a plotly figure with 2 subplots
-        fig = make_subplots(rows=2, cols=2,
-                            subplot_titles=("Weld Group Properties", "Vector Plot", "Applied Loading"),
-                            column_widths=[0.3, 0.7],
-                            row_heights=[0.65, 0.35],
-                            horizontal_spacing=0.02,
-                            vertical_spacing=0.05,
-                            specs = [[{"type":"table"}, {"type":"scene","rowspan":2}],
-                                     [{"type":"table"}, None],
-                                     ])
-        
-        # properties table
-        table_properties = [r"$x_{{cg}}$",
-                     r"$y_{{cg}}$",
-                     r"$L$",
-                     r"$L_e$",
-                     r"$I_{x}$",
-                     r"$I_{y}$",
-                     r"$I_{z}$",
-                     r"$S_{{x,top}}$",
-                     r"$S_{{x,bottom}}$",
-                     r"$S_{{y,right}}$",
-                     r"$S_{{y,left}}$"]
-        table_values = [r"${:.2f} \quad in$".format(self.x_centroid_force),
-                        r"${:.2f} \quad in$".format(self.y_centroid_force),
-                        r"${:.1f} \quad in$".format(self.L_force),
-                        r"${:.1f} \quad in$".format(self.Le_force),
-                        r"${:.1f} \quad in^3$".format(self.Ix_force),
-                        r"${:.1f} \quad in^3$".format(self.Iy_force),
-                        r"${:.1f} \quad in^3$".format(self.Iz_force),
-                        r"${:.1f} \quad in^2$".format(self.Sx1_force),
-                        r"${:.1f} \quad in^2$".format(self.Sx2_force),
-                        r"${:.1f} \quad in^2$".format(self.Sy1_force),
-                        r"${:.1f} \quad in^2$".format(self.Sy2_force)]
-        property_table = go.Table(header_values = ['Parameters', 'Value'],
-                                  header_line_color = "black",
-                                  header_font_color = "white",
-                                  header_fill_color = "#3b3b41",
-                                  header_align = "center",
-                                  header_font_size = 18,
-                                  header_height = 34,
-                                  cells_values = [table_properties, table_values],
-                                  cells_line_color = "black",
-                                  cells_font_color = "black",
-                                  cells_fill_color = "white",
-                                  cells_align = "center",
-                                  cells_font_size = 22,
-                                  cells_height = 34,
-                                  )
-        fig.add_trace(property_table, row=1, col=1)
-        
-        # applied force table
-        table_properties = [r"$V_x$",
-                            r"$V_y$",
-                            r"$V_z$",
-                            r"$M_x$",
-                            r"$M_y$",
-                            r"$M_z$"]
-        table_values = [r"${:.1f} \quad kips$".format(self.Vx),
-                        r"${:.1f} \quad kips$".format(self.Vy),
-                        r"${:.1f} \quad kips$".format(self.Vz),
-                        r"${:.1f} \quad k.in$".format(self.Mx),
-                        r"${:.1f} \quad k.in$".format(self.My),
-                        r"${:.1f} \quad k.in$".format(self.Mz)]
-        property_table = go.Table(header_values = ['Applied Load', 'Value'],
-                                  header_line_color = "black",
-                                  header_font_color = "white",
-                                  header_fill_color = "#3b3b41",
-                                  header_align = "center",
-                                  header_font_size = 18,
-                                  header_height = 34,
-                                  cells_values = [table_properties, table_values],
-                                  cells_line_color = "black",
-                                  cells_font_color = "black",
-                                  cells_fill_color = "white",
-                                  cells_align = "center",
-                                  cells_font_size = 22,
-                                  cells_height = 34,
-                                  )
-        fig.add_trace(property_table, row=2, col=1)
-        
-        
-        # plot orgin marker at centroid
-        xmax = max(self.dict_welds["x_centroid"])
-        xmin = min(self.dict_welds["x_centroid"])
-        ymax = max(self.dict_welds["y_centroid"])
-        ymin = min(self.dict_welds["y_centroid"])
-        dmax = max(xmax-xmin, ymax-ymin)/1.5
-        X = go.Scatter3d(
-            x=[self.x_centroid, self.x_centroid + dmax/14],
-            y=[self.y_centroid, self.y_centroid],
-            z=[0,0],
-            mode='lines+text',
-            hoverinfo = 'skip',
-            showlegend=False,
-            line=dict(color='blue', width=5),
-            text=["","X"],
-            textposition="top center",
-            textfont=dict(
-                family="Arial",
-                size=14,
-                color="blue"))
-        fig.add_trace(X, row=1, col=2)
-        Y = go.Scatter3d(
-            x=[self.x_centroid, self.x_centroid],
-            y=[self.y_centroid, self.y_centroid + dmax/14],
-            z=[0,0],
-            mode='lines+text',
-            hoverinfo = 'skip',
-            line=dict(color='red', width=5),
-            text=["","Y"],
-            textposition="top center",
-            showlegend=False,
-            textfont=dict(
-                family="Arial",
-                size=14,
-                color="red"))
-        fig.add_trace(Y,row=1, col=2)
-        Z = go.Scatter3d(
-            x=[self.x_centroid, self.x_centroid],
-            y=[self.y_centroid, self.y_centroid],
-            z=[0, 0 + dmax/14],
-            mode='lines+text',
-            hoverinfo = 'skip',
-            line=dict(color='green', width=5),
-            text=["","Z"],
-            textposition="top center",
-            showlegend=False,
-            textfont=dict(
-                family="Arial",
-                size=14,
-                color="green"))
-        fig.add_trace(Z, row=1, col=2)
-        
-        # prep colormap
-        cm = plt.get_cmap(colormap)
-        magnitude = self.dict_welds["v_resultant"]
-        cmin = min(magnitude) if cmin == "auto" else cmin
-        cmax = max(magnitude) if cmax == "auto" else cmax
-        if math.isclose(cmax-cmin, 0):
-            cmin = 0
-        
-        # plot weld stress vectors
-        x_lines = []
-        y_lines = []
-        z_lines = []
-        xyz_dot = [[],[],[]]
-        line_colors = []
-        hover_text = []
-        LENGTH_SF = scale
-        for i in range(len(self.df_welds["x_centroid"])):
-            # first point (on Z=0 plane)
-            x0 = self.df_welds["x_centroid"][i]
-            y0 = self.df_welds["y_centroid"][i]
-            z0 = 0
-            xyz0_array = np.array([x0,y0,z0])
-            
-            # second point
-            u = self.df_welds["vx_total"][i]
-            v = self.df_welds["vy_total"][i]
-            w = self.df_welds["vz_total"][i]
-            resultant = self.df_welds["v_resultant"][i]
-            uvw_array = np.array([u,v,w])
-            xyz1_array = xyz0_array + LENGTH_SF * uvw_array
-            
-            # add to list of plot lines
-            x_lines.extend([xyz0_array[0], xyz1_array[0], None])
-            y_lines.extend([xyz0_array[1], xyz1_array[1], None])
-            z_lines.extend([xyz0_array[2], xyz1_array[2], None])
-            
-            # add to list of plot scatters
-            xyz_dot[0].append(xyz0_array[0])
-            xyz_dot[1].append(xyz0_array[1])
-            xyz_dot[2].append(xyz0_array[2])
-            
-            # add to list of colors
-            magnitude = self.dict_welds["v_resultant"][i]
-            magnitude_normalized = (magnitude-cmin)/(cmax-cmin)
-            rgb01 = cm(magnitude_normalized)
-            rgb255 = [a * 255 for a in rgb01]
-            rgb_str = f"rgb({rgb255[0]},{rgb255[1]},{rgb255[2]})"
-            line_colors.append(rgb_str)
-            line_colors.append(rgb_str)
-            line_colors.append("white")
+    @profiled("size_welds")
+    def size_welds(self, loads, allowable, size="thickness", criteria="stress", per_line=False, tol=1e-4):
+        """
+        Find the minimum weld size that satisfies an allowable limit for every load combination. The current weld
+        group is used as the geometry template and is not modified. Only weld end points and closely spaced points
+        along arcs are evaluated, and section properties come from the exact primitive moments, so no patches are built.
+        
+        Stress is inversely proportional to a uniform change in thickness, so uniform thickness is solved in closed-form.
+        size="scale" scales the whole weld group uniformly: weld lengths AND the spacing between welds grow by the same
+        factor, so the connection layout changes. It does not lengthen welds of a fixed layout. Scaling every coordinate
+        by a factor changes direct shear by 1/factor and moment terms by 1/factor², which is solved by bisection.
+        
+        Arguments:
+            loads               array or dataframe:: (N x 6) load matrix with columns [Vx, Vy, Vz, Mx, My, Mz]. See solve_many()
+            allowable           float:: allowable sigma_vm (ksi) if criteria="stress", or allowable v_resultant (k/in) if criteria="force"
+            size                (OPTIONAL) str:: "thickness" to size throat thickness, "scale" to scale the whole weld group.
+                                    "length" is a deprecated alias of "scale". Default = "thickness"
+            criteria            (OPTIONAL) str:: "stress" or "force". Default = "stress"
+            per_line            (OPTIONAL) bool:: keep the relative thickness of each weld in the template rather than
+                                    making every weld the same thickness. Default = False
+            tol                 (OPTIONAL) float:: relative tolerance of the bisection for size="scale". Default = 1e-4
             
-            # add to list of hoverinfo
-            custom_hover = '<b>Vx</b>: {:.2f} k/in<br>'.format(u) +\
-                '<b>Vy</b>: {:.2f} k/in<br>'.format(v) +\
-                '<b>Vz</b>: {:.2f} k/in<br>'.format(w) +\
-                '<b>V_resultant</b>: {:.2f} k/in<br>'.format(resultant)
-            hover_text.append(custom_hover)
+        Returns:
+            thickness           float or array:: (size="thickness") required uniform thickness, or array of required
+                                    thickness of each weld in self.primitives if per_line=True
+            scale               float:: (size="scale") factor to multiply every coordinate of the weld group by,
+                                    i.e. weld_group.transform(np.eye(2) * scale). Weld lengths, spacing between welds,
+                                    and total weld length (scale * L_force) all grow by this factor
+        """
+        MAX_ARC_ANGLE = 1  # deg. Spacing of points evaluated along arcs
+        
+        # "length" scaled the whole weld group rather than lengthening welds, so it was renamed
+        if size == "length":
+            warnings.warn('size="length" is deprecated because it scales the whole weld group, including the spacing '
+                          'between welds. Use size="scale"', DeprecationWarning, stacklevel=3)
+            size = "scale"
+        
+        # EXCEPTION: invalid sizing options
+        if size not in ["thickness", "scale"]:
+            raise ValueError(f'size must be "thickness" or "scale". Got {size}')
+        if criteria not in ["stress", "force"]:
+            raise ValueError(f'criteria must be "stress" or "force". Got {criteria}')
+        if size == "thickness" and criteria == "force":
+            raise ValueError('Force per unit length does not change with throat thickness. Use criteria="stress" or size="scale"')
+        
+        load_matrix, _ = self._load_matrix(loads)
+        moments, _ = geometry.moments_and_bounds(self.primitives, self._moment_origin)
+        thickness = np.array([p["thickness"] for p in self.primitives], dtype=float)
+        
+        # points to evaluate. Magnitudes are convex along a straight weld so only the end points are needed
+        segments = np.ones(len(self.primitives), dtype=int)
+        for i, p in enumerate(self.primitives):
+            if p["type"] == "arc":
+                segments[i] = math.ceil((p["end_angle"] - p["start_angle"]) / MAX_ARC_ANGLE)
+        primitive_id = np.repeat(np.arange(len(segments)), segments + 1)
+        k = np.arange(len(primitive_id)) - np.repeat(np.cumsum(segments + 1) - (segments + 1), segments + 1)
+        x, y = geometry.primitive_points(self.primitives, primitive_id, k / segments[primitive_id])
+        x, y = x - self._moment_origin[0], y - self._moment_origin[1]
+        
+        if size == "scale":
+            direct, moment = self._sizing_response(thickness, moments, x, y, load_matrix)
+            factor = thickness[primitive_id][None,:,None] if criteria == "force" else math.sqrt(3)
+            direct, moment = direct * factor, moment * factor
             
-        # prep work before plotting vectors
-        hovertemplate = '<b>coord: (%{x:.1f}, %{y:.1f}, %{z:.1f})</b><br>' + '%{text}<extra></extra>'
-        _cmin = min(self.dict_welds["v_resultant"])
-        _cmax = max(self.dict_welds["v_resultant"])
-        tick_interval = np.linspace(_cmin, _cmax, 9)
-        tick_interval_str = [f"{x:.2f}" for x in tick_interval]
-        
-        # plot vectors
-        vector_line = go.Scatter3d(x=x_lines,
-                                      y=y_lines,
-                                      z=z_lines,
-                                      mode='lines',
-                                      line_width = 8,
-                                      line_color = line_colors,
-                                      showlegend = False,
-                                      hoverinfo="none")
-        vector_base = go.Scatter3d(x=xyz_dot[0],
-                                      y=xyz_dot[1],
-                                      z=xyz_dot[2],
-                                      mode='markers',
-                                      marker_symbol = "square",
-                                      marker_size = 8,
-                                      showlegend = False,
-                                      hovertemplate = hovertemplate,
-                                      text = hover_text,
-                                      hoverlabel_font_size=16,
-                                      marker_color=self.df_welds["v_resultant"],
-                                      marker_colorscale=colormap,
-                                      marker_showscale=True,
-                                      marker_colorbar=dict(title_text="k/in",
-                                                           outlinecolor="black",
-                                                           outlinewidth=2,
-                                                           tickvals=tick_interval,
-                                                           ticktext=tick_interval_str,
-                                                           xpad=40,
-                                                           ypad=40)
-                                      )
-        fig.add_trace(vector_base, row=1, col=2)
-        fig.add_trace(vector_line, row=1, col=2)
-        
-        # change such that axes are in proportion.
-        fig.update_scenes(aspectmode="data")
-        
-        # add title
-        fig.update_layout(title="<b>Weld Group Result Summary</b>",
-                          title_xanchor="center",
-                          title_font_size=22,
-                          title_x=0.5, 
-                          title_y=0.98,
-                          title_font_color="black")
-        
-        # background color
-        fig.update_layout(paper_bgcolor="white",
-                          font_color="black")
-        
-        # adjust zoom level and default camera position
-        fig.update_scenes(camera_eye=dict(x=2, y=2, z=2))
-        
-        # change origin to be on the bottom left corner
-        fig.update_scenes(xaxis_autorange="reversed")
-        fig.update_scenes(yaxis_autorange="reversed")
-        fig.update_scenes(xaxis_backgroundcolor="white",
-                          yaxis_backgroundcolor="white",
-                          xaxis_gridcolor="grey",
-                          yaxis_gridcolor="grey",
-                          xaxis_gridwidth=0.5,
-                          yaxis_gridwidth=0.5,
-                          zaxis_visible=False,
-                          )
-        fig.show()
-        return fig
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
+            # bracket the required scale then bisect
+            def ratio(scale):
+                return np.max(np.linalg.norm(direct / scale + moment / scale**2, axis=2)) / allowable
+            lower, upper = 1.0, 1.0
+            while ratio(upper) > 1:
+                upper *= 2
+            while ratio(lower) <= 1 and lower > 1e-12:
+                lower /= 2
+            while upper / lower - 1 > tol:
+                middle = math.sqrt(lower * upper)
+                if ratio(middle) > 1:
+                    lower = middle
+                else:
+                    upper = middle
+            return upper
+        
+        # stress is inversely proportional to a uniform change in thickness
+        if not per_line:
+            thickness = np.ones(len(self.primitives))
+        direct, moment = self._sizing_response(thickness, moments, x, y, load_matrix)
+        required = thickness * math.sqrt(3) * np.max(np.linalg.norm(direct + moment, axis=2)) / allowable
+        return required if per_line else required[0]
+    
+    
+    def _sizing_response(self, thickness, moments, x, y, load_matrix):
+        """
+        Direct shear and moment stress at points (x, y) for trial weld thicknesses. Private method called by
+        size_welds(). Section properties are recalculated from the primitive moments without modifying the weld group.
+        Moments and points are relative to the same reference point (see _moment_origin).
+        
+        Returns:
+            direct              array:: (loads x points x 3) stress (tauX, tauY, tauZ) from Vx, Vy, Vz
+            moment              array:: (loads x points x 3) stress (tauX, tauY, tauZ) from Mx, My, Mz
+        """
+        A, xA, yA, xxA, yyA, xyA = thickness @ moments
+        dx = x - xA / A
+        dy = y - yA / A
+        Ix = yyA - yA**2 / A
+        Iy = xxA - xA**2 / A
+        Iz = Ix + Iy
+        
+        Vx, Vy, Vz, Mx, My, Mz = [load_matrix[:,[i]] for i in range(6)]
+        direct = np.broadcast_to(-load_matrix[:,None,:3] / A, (len(load_matrix), len(x), 3))
+        moment = np.stack([Mz * dy / Iz,
+                           -Mz * dx / Iz,
+                           -Mx * dy / Ix + My * dx / Iy], axis=2)
+        return direct, moment
+    
+    
+    @profiled("discretize")
+    def _set_patches(self, primitive_id, s_start, s_end):
+        """
+        Replace all weld patches with straight patches spanning normalized positions [s_start, s_end] along
+        primitives. Private method called by solve_adaptive(). Geometric properties are exact so they remain current.
+        """
+        thickness = np.array([p["thickness"] for p in self.primitives], dtype=float)[primitive_id]
+        x_start, y_start = geometry.primitive_points(self.primitives, primitive_id, s_start)
+        x_end, y_end = geometry.primitive_points(self.primitives, primitive_id, s_end)
+        length = np.hypot(x_end - x_start, y_end - y_start)
+        
+        self.patches = PatchTable(capacity=len(primitive_id), dtype=self._dtype, compact=self.compact)
+        self._custom_mesh = True
+        self.patches.append(x_centroid = (x_start + x_end) / 2,
+                            y_centroid = (y_start + y_end) / 2,
+                            x_start = x_start,
+                            y_start = y_start,
+                            x_end = x_end,
+                            y_end = y_end,
+                            length = length,
+                            thickness = thickness,
+                            area = thickness * length)
+        self._sync_dict_welds()
+        self._force_influence = None
+        self._stress_influence = None
+        self._reactions = None
+        self._chord_errors = None
+    
+    
+    def _principal_warning(self):
+        """
+        Warning message if the weld group is not in its principal orientation, otherwise None. Private method issued
+        as a UserWarning by solve(), solve_many(), and max_stress(), and reported with the results of batch workers.
+        """
+        if not self._properties_current:
+            self.update_geometric_properties()
+        if abs(self.theta_p) > 0.1:  #deg
+            return (f"Weld group is not in its principal orientation. Results may not be correct! "
+                    f"Please rotate by {self.theta_p:.2f} degrees using the .rotate() method before solving.")
+        return None
+    
+    
+    def _warn_if_not_principal(self):
+        """Issue _principal_warning() as a UserWarning attributed to the code that called ezweld"""
+        message = self._principal_warning()
+        if message is not None:
+            # skip frames within ezweld (profiling wrappers, solve_many() => _governing_results()) to find the caller
+            frame, stacklevel = sys._getframe(1), 2
+            while frame is not None and frame.f_globals.get("__name__", "").startswith("ezweld."):
+                frame, stacklevel = frame.f_back, stacklevel + 1
+            warnings.warn(message, UserWarning, stacklevel=stacklevel)
+    
+    
+    @staticmethod
+    def _load_matrix(loads):
+        """
+        Convert user-specified load combinations into a (N x 6) float array ordered [Vx, Vy, Vz, Mx, My, Mz].
+        Returns the array and the load combination names.
+        """
+        LOAD_NAMES = ["Vx","Vy","Vz","Mx","My","Mz"]
+        pd = sys.modules.get("pandas")  # a dataframe can only be passed in if pandas is already imported
+        if pd is not None and isinstance(loads, pd.DataFrame):
+            unknown = [c for c in loads.columns if c not in LOAD_NAMES]
+            if unknown:
+                raise ValueError(f"Unrecognized load columns {unknown}. Expected any of {LOAD_NAMES}")
+            load_matrix = loads.reindex(columns=LOAD_NAMES, fill_value=0).to_numpy(dtype=float)
+            combo_names = loads.index
+        else:
+            load_matrix = np.atleast_2d(np.asarray(loads, dtype=float))
+            combo_names = None
+        
+        if load_matrix.ndim != 2 or load_matrix.shape[1] != 6:
+            raise ValueError(f"Load matrix must be of shape (N x 6). Got {load_matrix.shape}")
+        return load_matrix, combo_names
+    
+    
+    @profiled("unit_load_response")
+    def _unit_load_response(self):
+        """
+        Per-patch response to a unit value of each load [Vx, Vy, Vz, Mx, My, Mz]. The elastic method is linear
+        so the response to any load vector is a mat-vec with these influence tensors. Geometric properties and
+        influence tensors are calculated once then cached until the weld group geometry changes.
+        
+        Returns:
+            force_influence     array:: (patches x 6 x 3) force per unit length (vx, vy, vz) per unit load
+            stress_influence    array:: (patches x 6 x 3) stress (tauX, tauY, tauZ) per unit load
+        """
+        if self._force_influence is not None:
+            return self._force_influence, self._stress_influence
+        
+        # weld groups with identical geometry share properties and unit load responses through the cache
+        use_cache = self.cache is not None and not self.compact and not self._custom_mesh
+        if use_cache:
+            key = self.geometry_hash()
+            entry = self.cache.get(key)
+            if entry is not None and entry["force_influence"].shape[0] == len(self.patches):
+                for k, v in entry["properties"].items():
+                    setattr(self, k, v)
+                self._properties_current = True
+                # stress before force: _force_influence is the "is cached" flag checked above by other threads
+                self._stress_influence = entry["stress_influence"]
+                self._force_influence = entry["force_influence"]
+                return entry["force_influence"], entry["stress_influence"]
+        
+        # calculate geometric properties
+        if not self._properties_current:
+            self.update_geometric_properties()
+        
+        # modify length to account for variable thickness. Proportioned based on min weld thickness
+        dx = self.patches.column("x_centroid") - float(self.x_centroid)
+        dy = self.patches.column("y_centroid") - float(self.y_centroid)
+        length_factor = self.patches.column("thickness") / float(self._t_min)
+        
+        force_influence, stress_influence = self._influence_at(dx, dy, length_factor)
+        
+        # compact weld groups recalculate rather than cache the (patches x 6 x 3) tensors.
+        # stress before force: _force_influence is the "is cached" flag checked above by other threads
+        if not self.compact:
+            self._stress_influence = stress_influence
+            self._force_influence = force_influence
+        if use_cache:
+            self.cache.put(key, {k: getattr(self, k) for k in self.SECTION_PROPERTIES}, force_influence, stress_influence)
+        return force_influence, stress_influence
+    
+    
+    def _reaction_matrix(self):
+        """
+        Summed weld reactions [Fx, Fy, Fz, Mx, My, Mz] (rows) to a unit value of each load [Vx, Vy, Vz, Mx, My, Mz]
+        (columns). Reactions are linear in the loads so equilibrium of N load combinations is a (N x 6) @ (6 x 6)
+        product. Cached until geometry changes. Only published once complete so threads sharing a weld group never
+        read a partial matrix.
+        """
+        if self._reactions is None:
+            force_influence, _ = self._unit_load_response()
+            reactions = np.zeros((6, 6))
+            for j in range(6):
+                unit = np.eye(6)[j]
+                v = force_influence[:,j,:]
+                reactions[:,j] = [np.sum(f) for f in self._patch_forces(v[:,0], v[:,1], v[:,2], *unit[3:])]
+            self._reactions = reactions
+        return self._reactions
+    
+    
+    def _chord_error(self):
+        """
+        Error of the summed weld reactions per unit load (6 x 6, same layout as _reaction_matrix()) from discretizing
+        arcs into straight chords. Section properties are integrated over the exact arcs while forces are applied to
+        the chords, so the reactions are off by the difference between the chord mesh and exact length integrals.
+        This error vanishes as PATCH_SIZE decreases and is zero for straight welds. Cached until geometry changes.
+        """
+        if self._chord_errors is not None:
+            return self._chord_errors
+        if all(p["type"] == "line" for p in self.primitives) or len(self.patches) == 0:
+            self._chord_errors = np.zeros((6, 6))
+            return self._chord_errors
+        if not self._properties_current:
+            self.update_geometric_properties()
+        
+        # effective length integrals [L, ∫x, ∫y, ∫x², ∫y², ∫xy] of the chord mesh about the centroid
+        CHUNK_SIZE = 65536
+        centroid = np.array([float(self.x_centroid), float(self.y_centroid)])
+        mesh = np.zeros(6)
+        for start in range(0, len(self.patches), CHUNK_SIZE):
+            rows = slice(start, start + CHUNK_SIZE)
+            starts = np.column_stack([self.patches.column("x_start", rows), self.patches.column("y_start", rows)]).astype(float)
+            ends = np.column_stack([self.patches.column("x_end", rows), self.patches.column("y_end", rows)]).astype(float)
+            length_factor = self.patches.column("thickness", rows).astype(float) / float(self._t_min)
+            mesh += length_factor @ geometry.line_moments(starts - centroid, ends - centroid)
+        exact = np.array([self.Le_force, 0, 0, self.Iy_force, self.Ix_force, self.Ixy_force], dtype=float)
+        
+        def reactions(m):
+            # summed reactions of _patch_forces() to each unit load for effective length integrals m
+            L, x, y, xx, yy, xy = m
+            Le, Ix, Iy, Iz = float(self.Le_force), float(self.Ix_force), float(self.Iy_force), float(self.Iz_force)
+            return np.array([[-L/Le, 0, 0, 0, 0, y/Iz],
+                             [0, -L/Le, 0, 0, 0, -x/Iz],
+                             [0, 0, -L/Le, -y/Ix, x/Iy, 0],
+                             [0, 0, -y/Le, -yy/Ix, xy/Iy, 0],
+                             [0, 0, x/Le, xy/Ix, -xx/Iy, 0],
+                             [y/Le, -x/Le, 0, 0, 0, -(xx + yy)/Iz]])
+        self._chord_errors = reactions(mesh) - reactions(exact)
+        return self._chord_errors
+    
+    
+    def _influence_at(self, dx, dy, length_factor):
+        """
+        Response to a unit value of each load [Vx, Vy, Vz, Mx, My, Mz] at arbitrary points. Private method that
+        assumes geometric properties are up-to-date.
+        
+        Arguments:
+            dx                  array:: x distance of each point from centroid
+            dy                  array:: y distance of each point from centroid
+            length_factor       array:: thickness / t_min of the weld at each point
+        
+        Returns:
+            force_influence     array:: (points x 6 x 3) force per unit length (vx, vy, vz) per unit load
+            stress_influence    array:: (points x 6 x 3) stress (tauX, tauY, tauZ) per unit load
+        """
+        # stress convention. Same equations as solve() with the load set to unity
+        stress_influence = np.zeros((len(dx), 6, 3), dtype=np.result_type(dx, dy))
+        stress_influence[:,0,0] = -1 / self.A           # Vx
+        stress_influence[:,1,1] = -1 / self.A           # Vy
+        stress_influence[:,2,2] = -1 / self.A           # Vz
+        stress_influence[:,3,2] = -dy / self.Ix         # Mx
+        stress_influence[:,4,2] = dx / self.Iy          # My
+        stress_influence[:,5,0] = dy / self.Iz          # Mz
+        stress_influence[:,5,1] = -dx / self.Iz         # Mz
+        
+        # unit force convention
+        force_influence = np.zeros((len(dx), 6, 3), dtype=np.result_type(dx, dy))
+        force_influence[:,0,0] = -1 / self.Le_force
+        force_influence[:,1,1] = -1 / self.Le_force
+        force_influence[:,2,2] = -1 / self.Le_force
+        force_influence[:,3,2] = -dy / self.Ix_force
+        force_influence[:,4,2] = dx / self.Iy_force
+        force_influence[:,5,0] = dy / self.Iz_force
+        force_influence[:,5,1] = -dx / self.Iz_force
+        force_influence *= length_factor[:, None, None]
+        
+        return force_influence, stress_influence
+    
+    
+    def _sync_dict_welds(self, force=False):
+        """
+        Expose patch geometry in dict_welds. Geometry entries are views into self.patches so this is free, except in
+        compact mode where derived columns are calculated and are therefore only added when needed (force=True).
+        Effective length depends on the minimum thickness of the weld group so it is only added when force=True.
+        """
+        if force or not self.compact:
+            self.dict_welds.update(self.patches.as_dict())
+        if force:
+            self.dict_welds["length_effective"] = self.patches.column("thickness") / self._t_min * self.patches.column("length")
+    
+    
+    def _geometry_changed(self):
+        """
+        Discard cached quantities that depend on weld geometry. Private method called whenever welds are added or moved.
+        """
+        self._force_influence = None
+        self._stress_influence = None
+        self._reactions = None
+        self._chord_errors = None
+        self._properties_current = False
+        
+        
+    @profiled("check_equilibrium")
+    def check_equilibrium(self, sums=None, loads=None, rtol=1e-3, raise_error=True):
+        """
+        Check if results are correct by checking equilibrium. Residual = applied load + sum of weld reactions.
+        Tolerance is relative to the applied loading: forces are compared to rtol * P and moments to rtol * P * d,
+        where d is the larger of weld group width or depth and P is the larger of max(|Vx|, |Vy|, |Vz|) or
+        max(|Mx|, |My|, |Mz|) / d. Section properties of arcs are exact but their patches are straight chords, so the
+        known discretization error of the chords (see _chord_error()) is added to the tolerance. Vectorized over any
+        number of load combinations.
+        
+        Arguments:
+            sums                (OPTIONAL) array:: (6,) or (N x 6) summed weld reactions [Fx, Fy, Fz, Mx, My, Mz].
+                                    Default = sum of dict_welds
+            loads               (OPTIONAL) array:: (6,) or (N x 6) applied loads [Vx, Vy, Vz, Mx, My, Mz].
+                                    Default = loads of the last solve()
+            rtol                (OPTIONAL) float:: relative tolerance. Default = 1e-3
+            raise_error         (OPTIONAL) bool:: raise RuntimeError if equilibrium is not satisfied. Default = True
+        
+        Returns:
+            dict_equilibrium    dict:: "residual" and "tolerance" arrays shaped like loads, and "ok" (bool or (N,) bool array)
+        """
+        if loads is None:
+            loads = [self.Vx, self.Vy, self.Vz, self.Mx, self.My, self.Mz]
+        if sums is None:
+            sums = [np.sum(self.dict_welds[k]) for k in ["Fx", "Fy", "Fz", "Mxi", "Myi", "Mzi"]]
+        loads = np.asarray(loads, dtype=float)
+        residual = np.asarray(sums, dtype=float) + loads
+        
+        # tolerance scaled by load magnitude and weld group size
+        x_min, x_max, y_min, y_max = self._bounds
+        d = max(x_max - x_min, y_max - y_min) or 1.0
+        P = np.maximum(np.max(np.abs(loads[...,:3]), axis=-1), np.max(np.abs(loads[...,3:]), axis=-1) / d)
+        tolerance = rtol * P[...,None] * np.array([1, 1, 1, d, d, d]) + np.abs(loads @ self._chord_error().T)
+        ok = np.all(np.abs(residual) <= tolerance, axis=-1)
+        
+        if raise_error and not np.all(ok):
+            worst = np.unravel_index(np.argmax(np.abs(residual) / np.maximum(tolerance, 1e-300)), residual.shape)
+            names = ["Fx", "Fy", "Fz", "Mx", "My", "Mz"]
+            raise RuntimeError(f"Error: Equilibrium check failed. {names[worst[-1]]} residual = {residual[worst]:.4g} "
+                               f"exceeds tolerance = {tolerance[worst]:.4g}")
+        return {"residual": residual, "tolerance": tolerance, "ok": ok}
+        
+        
+    @profiled("save")
+    def save(self, path):
+        """
+        Save weld group to a directory of binary column files that can be memory-mapped by load(). Patch geometry
+        and results are each written as a single (columns x patches) .npy array. Primitives, section properties, and
+        applied loads are written to weldgroup.json.
+        
+        Arguments:
+            path                str:: directory to write. Created if it does not exist
+        """
+        if not self._properties_current:
+            self.update_geometric_properties()
+        os.makedirs(path, exist_ok=True)
+        
+        # results are only saved if they belong to the current patches (i.e. solve() with results="dataframe" or "arrays")
+        has_results = len(self.results) == len(self.patches) and "v_resultant" in self.dict_welds and len(self.patches) > 0
+        np.save(os.path.join(path, "patches.npy"), self.patches.buffer())
+        if has_results:
+            np.save(os.path.join(path, "results.npy"), self.results.buffer())
+        
+        metadata = {"PATCH_SIZE": self.PATCH_SIZE,
+                    "compact": self.compact,
+                    "patch_columns": self.patches.stored,
+                    "result_columns": ResultTable.COLUMNS if has_results else [],
+                    "primitives": self.primitives,
+                    "moment_sums": self._moment_sums.tolist(),
+                    "moment_origin": self._moment_origin.tolist(),
+                    "length_sum": self._length_sum,
+                    "t_min": self._t_min,
+                    "bounds": np.asarray(self._bounds).tolist(),
+                    "properties": {k: getattr(self, k) for k in self.SECTION_PROPERTIES},
+                    "loads": {k: getattr(self, k) for k in ["Vx", "Vy", "Vz", "Mx", "My", "Mz"]},
+                    "v_max": self.v_max if has_results else None,
+                    "v_max_ID": self.v_max_ID if has_results else None}
+        with open(os.path.join(path, "weldgroup.json"), "w") as f:
+            json.dump(metadata, f, indent=2, default=float)
+    
+    
+    @staticmethod
+    def load(path, mmap_mode="r"):
+        """
+        Load a weld group written by save(). Patch geometry and result columns are memory-mapped rather than read into
+        memory, so dict_welds["v_resultant"] etc. can be queried without re-solving. df_welds is not rebuilt. Use
+        pd.DataFrame(weld_group.dict_welds) if a dataframe is needed.
+        
+        A read-only weld group can be solved again. The results are then written to a new in-memory buffer and the
+        file is left unchanged. Moving welds (rotate(), translate(), transform()) requires mmap_mode="c" or None.
+        
+        Arguments:
+            path                str:: directory written by save()
+            mmap_mode           (OPTIONAL) str:: numpy memory-map mode. "r" for read-only, "c" for copy-on-write
+                                    (needed to move welds), None to read into memory. Default = "r"
+        
+        Returns:
+            weld_group          WeldGroup:: solved weld group
+        """
+        with open(os.path.join(path, "weldgroup.json")) as f:
+            metadata = json.load(f)
+        
+        weld_group = WeldGroup(PATCH_SIZE=metadata["PATCH_SIZE"], compact=metadata["compact"])
+        weld_group.primitives = metadata["primitives"]
+        weld_group._moment_sums = np.array(metadata["moment_sums"])
+        weld_group._moment_origin = np.array(metadata.get("moment_origin", [0, 0]), dtype=float)
+        weld_group._length_sum = metadata["length_sum"]
+        weld_group._t_min = metadata["t_min"]
+        weld_group._bounds = np.array(metadata["bounds"])
+        for k, v in metadata["properties"].items():
+            setattr(weld_group, k, v)
+        for k, v in metadata["loads"].items():
+            setattr(weld_group, k, v)
+        weld_group._properties_current = True
+        
+        # memory-map patch geometry and results
+        weld_group.patches = PatchTable.from_buffer(np.load(os.path.join(path, "patches.npy"), mmap_mode=mmap_mode),
+                                                    compact=metadata["compact"])
+        
+        # dict_welds only holds memory-mapped columns. Effective length and compact derived columns are left out
+        # because calculating them would read the whole file
+        weld_group.dict_welds = {}
+        weld_group._sync_dict_welds()
+        if metadata["result_columns"]:
+            weld_group.results = ResultTable.from_buffer(np.load(os.path.join(path, "results.npy"), mmap_mode=mmap_mode))
+            weld_group.dict_welds.update(weld_group.results.as_dict())
+            weld_group.v_max = metadata["v_max"]
+            weld_group.v_max_ID = metadata["v_max_ID"]
+        return weld_group
+    
+    
+    @profiled("plot_results")
+    def plot_results(self, plot="force", colormap="jet", cmin="auto", cmax="auto"):
+        """
+        plot results using matplotlib. See ezweld.plotting.plot_results()
+        """
+        from ezweld import plotting
+        return plotting.plot_results(self, plot=plot, colormap=colormap, cmin=cmin, cmax=cmax)
+    
+    
+    def plot_results_3D_deprecated(self, colormap="jet", cmin="auto", cmax="auto"):
+        """
+        use plotly to generate an interactive plot. See ezweld.plotting.plot_results_3D_deprecated()
+        """
+        from ezweld import plotting
+        return plotting.plot_results_3D_deprecated(self, colormap=colormap, cmin=cmin, cmax=cmax)
+    
+    
+    @profiled("plot_results_3D")
+    def plot_results_3D(self, colormap="jet", cmin="auto", cmax="auto", scale=0.2, max_vectors=10000, show=True):
+        """
+        use plotly to generate an interactive plot. See ezweld.plotting.plot_results_3D()
+        """
+        from ezweld import plotting
+        return plotting.plot_results_3D(self, colormap=colormap, cmin=cmin, cmax=cmax, scale=scale,
+                                        max_vectors=max_vectors, show=show)